@@ -27,6 +27,7 @@ from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm import sessionmaker
 
 # Import dependencies
+from core.profiler import load_snapshots
 from handler.exchange import SolPrice
 from utils.fields import BotFields
 from utils.forms import BotForm
@@ -399,6 +400,7 @@ class PumpBotUI:
 
             if form.validate_on_submit():
                 data = {
+                    **filedata,
                     'rpc': form.rpc.data.strip(),
                     'wss': form.wss.data.strip()
                 }
@@ -477,6 +479,19 @@ class PumpBotUI:
 
             return render_template('logs.html', title='Logs', logflask=logflask)
 
+        # Function 'rpc'
+        @app.route('/rpc')
+        @self.loadsession
+        def rpc():
+            """ Render the RPC profile of every bot """
+            return render_template('rpc.html', title='RPC', profiles=load_snapshots('logs'))
+
+        # API: Return RPC profiles
+        @app.route('/api/rpc-profile', methods=['GET'])
+        @self.loadsession
+        def rpcprofile():
+            return jsonify(load_snapshots('logs'))
+
         # Function 'screener'
         @app.route('/screener')
         @self.loadsession
@@ -0,0 +1,232 @@
+# === Import libraries ===
+import argparse
+import asyncio
+import base58
+import json
+import logging
+import sys
+import time
+
+# === Import packages ===
+from pathlib import Path
+from solders.keypair import Keypair
+
+# === Import dependencies ===
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import websockets
+
+from handler.agent import PumpAgent
+from monitoring.listeners import LogsListener
+from utils.mocknode import MockNode
+
+
+# === Function 'percentiles' ===
+def percentiles(samples: list[float]) -> dict[str, float | int | None]:
+    """
+    Summarises a list of latencies in milliseconds.
+
+    Parameters:
+    - samples (list[float]): Latencies in seconds.
+
+    Returns:
+    - dict: Count, p50, p95, p99 and max in milliseconds.
+    """
+    if not samples:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+
+    ordered = sorted(samples)
+
+    def pick(share: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * share))] * 1000, 2)
+
+    return {"count": len(ordered), "p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": round(ordered[-1] * 1000, 2)}
+
+
+# === Function 'trade' ===
+async def trade(agent: PumpAgent, token, created: float, results: dict[str, list], semaphore: asyncio.Semaphore) -> None:
+    """
+    Runs one detected token through the buyer and the seller and records stage latencies.
+
+    Parameters:
+    - agent (PumpAgent): Agent under test.
+    - token (TokenInfo): Token decoded by the listener.
+    - created (float): perf_counter() timestamp of the token creation on the node.
+    - results (dict): Latency and failure accumulators.
+    - semaphore (asyncio.Semaphore): Bounds the number of concurrent trades.
+
+    Returns:
+    - None
+    """
+    async with semaphore:
+        started = time.perf_counter()
+        buyresult = await agent.buyer.execute(token)
+        bought = time.perf_counter()
+        if not buyresult.success:
+            results["failures"].append(f"buy: {buyresult.error_message}")
+            return
+
+        results["buy"].append(bought - started)
+        results["endtoend"].append(bought - created)
+        sellresult = await agent.seller.execute(token)
+        if not sellresult.success:
+            results["failures"].append(f"sell: {sellresult.error_message}")
+            return
+        results["sell"].append(time.perf_counter() - bought)
+
+
+# === Function 'run' ===
+async def run(args: argparse.Namespace) -> dict:
+    """
+    Starts a mock node, points a PumpAgent at it and streams `args.tokens` new tokens at
+    `args.rate` per second. Every token is detected through the agent's own listener
+    decoding path, bought and sold through the agent's buyer and seller, so the RPC,
+    websocket, blockhash, fee and confirmation layers all run as in production. Market
+    screening is skipped because it depends on the public pump.fun HTTP API.
+
+    Parameters:
+    - args (argparse.Namespace): Parsed command line options.
+
+    Returns:
+    - dict: Benchmark report.
+    """
+    node = MockNode(latency = args.latency, jitter = args.jitter, slottime = args.slottime, seed = args.seed)
+    if args.errorrate:
+        node.inject(args.errorrate)
+    await node.start()
+
+    agent = PumpAgent(
+        rpcendpoint = node.url,
+        wssendpoint = node.wsurl,
+        privatekey = base58.b58encode(bytes(Keypair())).decode(),
+        botname = "benchmark",
+        sandbox = False,
+        rpcbroadcast = args.broadcast,
+        rpcratelimit = args.ratelimit,
+        chainlistener = args.listener,
+        chaininterval = 0,
+        noshorting = True,
+        buyamount = 0.01,
+        buyslippage = 0.1,
+        sellslippage = 0.25,
+        priodynamic = args.dynamicfee,
+        priofixed = not args.dynamicfee,
+        priotarget = args.targetslots,
+        fastmode = args.fastmode
+    )
+
+    results: dict[str, list] = {"detect": [], "buy": [], "sell": [], "endtoend": [], "failures": [], "startup": []}
+    created: dict[str, float] = {}
+    semaphore = asyncio.Semaphore(args.concurrency)
+    tasks: list[asyncio.Task] = []
+    started = time.perf_counter()
+    try:
+        # Startup reads are guarded like in PumpAgent.start, injected errors are reported instead of ending the run
+        try:
+            await agent.solanaclient.warmup()
+        except Exception as e:
+            results["startup"].append(f"warmup: {e!s}")
+        try:
+            await agent.globalaccount.load()
+        except Exception as e:
+            results["startup"].append(f"global: {e!s}")
+        await agent.wallet.load()
+        agent.priorityorderfee.start()
+        listener = agent.tokenlistener
+        async with websockets.connect(node.wsurl, max_size = None) as websocket:
+            if isinstance(listener, LogsListener):
+                await listener._subscribe_to_logs(websocket)
+            else:
+                # blockSubscribe is not acknowledged before returning, tokens created earlier would be missed
+                await listener._subscribe_to_program(websocket)
+                while not node.subscribers("blockSubscribe"):
+                    await asyncio.sleep(0.01)
+
+            async def produce() -> None:
+                for index in range(args.tokens):
+                    token = node.create_token(f"Benchmark {index}", f"BM{index}", publish = False)
+                    created[str(token.mint)] = time.perf_counter()
+                    node.publish_token(token)
+                    await asyncio.sleep(1 / args.rate)
+
+            producer = asyncio.create_task(produce())
+            while len(results["detect"]) < args.tokens:
+                token = await listener._wait_for_token_creation(websocket)
+                if token is None or str(token.mint) not in created:
+                    continue
+                origin = created[str(token.mint)]
+                results["detect"].append(time.perf_counter() - origin)
+                tasks.append(asyncio.create_task(trade(agent, token, origin, results, semaphore)))
+            await producer
+
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+        client = agent.solanaclient
+        return {
+            "settings": vars(args),
+            "elapsed": round(elapsed, 3),
+            "throughput": round(len(results["buy"]) / elapsed, 2),
+            "latency": {stage: percentiles(results[stage]) for stage in ("detect", "buy", "sell", "endtoend")},
+            "failures": len(results["failures"]),
+            "failurereasons": sorted(set(results["failures"]))[:10],
+            "startuperrors": results["startup"],
+            "noderequests": dict(sorted(node.requests.items())),
+            "pool": client.pool_stats(),
+            "cache": client.cache_stats(),
+            "rpc": client.profile_stats()["methods"],
+            "confirmations": client.confirmer.stats(),
+            "blockhash": client.blockhashes.stats(),
+            "compute": client.budgeter.stats(),
+            "resend": client.resender.stats(),
+            "global": agent.globalaccount.stats(),
+            "wallet": agent.wallet.stats(),
+            "priorityfee": agent.priorityorderfee.sampler.stats(),
+            "blockfees": agent.feesketch.stats() if agent.feesketch is not None else None,
+            "landing": agent.priorityorderfee.optimizer.stats() if agent.priorityorderfee.optimizer is not None else None
+        }
+    finally:
+        await agent.globalaccount.close()
+        await agent.wallet.close()
+        await agent.priorityorderfee.close()
+        await agent.solanaclient.close()
+        await node.stop()
+
+
+# === Function 'main' ===
+def main() -> None:
+    """
+    Parses the command line, runs the benchmark and prints the JSON report.
+
+    Returns:
+    - None
+    """
+    parser = argparse.ArgumentParser(description = "Offline end-to-end benchmark of PumpAgent against a mock node")
+    parser.add_argument("--tokens", type = int, default = 50, help = "Number of tokens to create")
+    parser.add_argument("--rate", type = float, default = 10.0, help = "Tokens created per second")
+    parser.add_argument("--concurrency", type = int, default = 10, help = "Maximum concurrent trades")
+    parser.add_argument("--latency", type = float, default = 0.02, help = "Mock node base latency in seconds")
+    parser.add_argument("--jitter", type = float, default = 0.01, help = "Mock node extra random latency in seconds")
+    parser.add_argument("--errorrate", type = float, default = 0.0, help = "Share of RPC calls answered with an error")
+    parser.add_argument("--slottime", type = float, default = 0.4, help = "Mock node slot duration in seconds")
+    parser.add_argument("--listener", choices = ("logs", "blocks"), default = "logs")
+    parser.add_argument("--broadcast", action = "store_true", help = "Enable transaction broadcast mode")
+    parser.add_argument("--ratelimit", type = float, default = 0.0, help = "Requests per second allowed per node, 0 for unlimited")
+    parser.add_argument("--dynamicfee", action = "store_true", help = "Use the dynamic priority fee")
+    parser.add_argument("--targetslots", type = int, default = 0, help = "Landing delay in slots the fee optimizer aims for, 0 disables it")
+    parser.add_argument("--fastmode", action = "store_true", help = "Quote buys from the Global account without reading the curve")
+    parser.add_argument("--seed", type = int, default = 7)
+    parser.add_argument("--output", help = "Also write the JSON report to this file")
+    parser.add_argument("--verbose", action = "store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level = logging.INFO if args.verbose else logging.ERROR)
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent = 2, default = str)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text, encoding = "utf-8")
+
+
+# === Callback ===
+if __name__ == "__main__":
+    main()
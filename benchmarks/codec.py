@@ -0,0 +1,335 @@
+# === Import libraries ===
+import argparse
+import base64
+import json
+import random
+import sys
+import time
+
+# === Import packages ===
+from collections.abc import Callable
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# === Import dependencies ===
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core import codec
+from core.pubkeys import PumpAddresses
+from utils.mocknode import MockNode
+
+
+# === Function 'backends' ===
+def backends() -> list[str]:
+    """
+    Lists the codec backends that can be benchmarked in this environment.
+
+    Returns:
+    - list[str]: 'json', every installed optional backend alone, and 'installed' for the
+      combination the bot actually runs with.
+    """
+    return ["json"] + [name for name in ("orjson", "msgspec") if getattr(codec, name) is not None] + ["installed"]
+
+
+# === Function 'backend' ===
+@contextmanager
+def backend(name: str):
+    """
+    Temporarily restricts the codec module to one backend.
+
+    Parameters:
+    - name (str): 'json', 'orjson', 'msgspec', or 'installed' to leave the module untouched.
+
+    Returns:
+    - Iterator[None]
+    """
+    saved = codec.orjson, codec.msgspec
+    if name == "installed":
+        yield
+        return
+    codec.orjson = saved[0] if name == "orjson" else None
+    codec.msgspec = saved[1] if name == "msgspec" else None
+    try:
+        yield
+    finally:
+        codec.orjson, codec.msgspec = saved
+
+
+# === Function 'notification' ===
+def notification(method: str, result: Any) -> str:
+    """
+    Wraps a result in a websocket notification as sent by the node.
+
+    Parameters:
+    - method (str): Notification method.
+    - result (Any): Notification result payload.
+
+    Returns:
+    - str: Serialized text frame.
+    """
+    return json.dumps({"jsonrpc": "2.0", "method": method, "params": {"result": result, "subscription": 1}})
+
+
+# === Function 'trade_logs' ===
+def trade_logs(rng: random.Random) -> list[str]:
+    """
+    Builds the program logs of a typical pump.fun buy or sell.
+
+    Parameters:
+    - rng (random.Random): Source of the random payloads.
+
+    Returns:
+    - list[str]: Log lines.
+    """
+    program = str(PumpAddresses.PROGRAM)
+    return [
+        "Program ComputeBudget111111111111111111111111111111 invoke [1]",
+        "Program ComputeBudget111111111111111111111111111111 success",
+        f"Program {program} invoke [1]",
+        f"Program log: Instruction: {rng.choice(('Buy', 'Sell'))}",
+        "Program TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA invoke [2]",
+        "Program log: Instruction: Transfer",
+        "Program TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA consumed 4645 of 170000 compute units",
+        "Program TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA success",
+        f"Program data: {base64.b64encode(rng.randbytes(129)).decode()}",
+        f"Program {program} consumed {rng.randint(20000, 60000)} of 200000 compute units",
+        f"Program {program} success"
+    ]
+
+
+# === Function 'transaction_meta' ===
+def transaction_meta(rng: random.Random, logs: list[str]) -> dict[str, Any]:
+    """
+    Builds a transaction status meta object of realistic size.
+
+    Parameters:
+    - rng (random.Random): Source of the random values.
+    - logs (list[str]): Log messages of the transaction.
+
+    Returns:
+    - dict: Meta object as returned with transactionDetails 'full'.
+    """
+    balances = [rng.randint(0, 10**12) for _ in range(12)]
+    tokens = [{"accountIndex": index, "mint": str(PumpAddresses.PROGRAM), "owner": str(PumpAddresses.PROGRAM), "uiTokenAmount": {"amount": str(rng.randint(0, 10**15)), "decimals": 6, "uiAmount": 1.0, "uiAmountString": "1"}} for index in range(2)]
+    return {
+        "err": None,
+        "fee": 5000,
+        "computeUnitsConsumed": rng.randint(20000, 80000),
+        "preBalances": balances,
+        "postBalances": [balance - 5000 for balance in balances],
+        "preTokenBalances": tokens,
+        "postTokenBalances": tokens,
+        "innerInstructions": [{"index": 2, "instructions": [{"programIdIndex": 7, "accounts": list(range(6)), "data": base64.b64encode(rng.randbytes(40)).decode(), "stackHeight": 2}]}],
+        "logMessages": logs,
+        "loadedAddresses": {"readonly": [], "writable": []},
+        "rewards": [],
+        "status": {"Ok": None}
+    }
+
+
+# === Function 'build_messages' ===
+def build_messages(count: int, creates: float, blocksize: int, seed: int) -> dict[str, list]:
+    """
+    Generates logs notifications, block notifications and RPC replies.
+
+    Parameters:
+    - count (int): Number of logs notifications and RPC replies.
+    - creates (float): Share of logs notifications that announce a new token.
+    - blocksize (int): Transactions per block notification.
+    - seed (int): Random seed.
+
+    Returns:
+    - dict: Message lists keyed by stream.
+    """
+    rng = random.Random(seed)
+    node = MockNode(seed = seed)
+    tokens = [node.create_token(f"Codec {index}", f"CD{index}", publish = False) for index in range(max(1, int(count * creates)))]
+    filler = base64.b64encode(rng.randbytes(600)).decode()
+
+    logs = []
+    for index in range(count):
+        if rng.random() < creates:
+            token = tokens[index % len(tokens)]
+            logs.append(notification("logsNotification", {"context": {"slot": index}, "value": {"signature": token.signature, "err": None, "logs": token.logs}}))
+        else:
+            signature = base64.b64encode(rng.randbytes(64)).decode()
+            logs.append(notification("logsNotification", {"context": {"slot": index}, "value": {"signature": signature, "err": None, "logs": trade_logs(rng)}}))
+
+    blocks = []
+    for index in range(max(1, count // blocksize)):
+        transactions = [{"transaction": [filler, "base64"], "meta": transaction_meta(rng, trade_logs(rng)), "version": 0} for _ in range(blocksize - 1)]
+        token = tokens[index % len(tokens)]
+        transactions.insert(rng.randrange(blocksize), {"transaction": [token.transaction, "base64"], "meta": transaction_meta(rng, token.logs), "version": 0})
+        blocks.append(notification("blockNotification", {"context": {"slot": index}, "value": {"slot": index, "block": {"blockhash": str(node.blockhash(index)), "parentSlot": index - 1, "transactions": transactions}, "err": None}}))
+
+    account = node._account_json(str(tokens[0].boundingcurve), {"encoding": "base64"})
+    replies = [json.dumps({"jsonrpc": "2.0", "id": index, "result": {"context": {"slot": index}, "value": [account] * 20}}).encode() for index in range(count)]
+    bodies = [{"jsonrpc": "2.0", "id": index, "method": "getMultipleAccounts", "params": [[str(token.boundingcurve) for token in tokens[:20]], {"encoding": "base64"}]} for index in range(count)]
+    return {"logs": logs, "blocks": blocks, "replies": replies, "bodies": bodies}
+
+
+# === Function 'legacy_logs' ===
+def legacy_logs(raw: str) -> tuple[list[str], str] | None:
+    """
+    Previous LogsListener path: stdlib parse of every frame, then the processor's Create check.
+
+    Parameters:
+    - raw (str): Text frame.
+
+    Returns:
+    - tuple | None: Logs and signature of a Create transaction.
+    """
+    data = json.loads(raw)
+    if "method" not in data or data["method"] != "logsNotification":
+        return None
+    log_data = data["params"]["result"]["value"]
+    logs = log_data.get("logs", [])
+    if not any("Program log: Instruction: Create" in log for log in logs):
+        return None
+    return logs, log_data.get("signature", "unknown")
+
+
+# === Function 'codec_logs' ===
+def codec_logs(raw: str) -> tuple[list[str], str] | None:
+    """
+    Current LogsListener path: raw pre-filter, then a typed decode.
+
+    Parameters:
+    - raw (str): Text frame.
+
+    Returns:
+    - tuple | None: Logs and signature of a Create transaction.
+    """
+    if not codec.mentions(raw, "logsNotification", "Program log: Instruction: Create"):
+        return None
+    event = codec.decode_logs(raw)
+    if event is None or not any("Program log: Instruction: Create" in log for log in event.logs):
+        return None
+    return event.logs, event.signature
+
+
+# === Function 'legacy_block' ===
+def legacy_block(raw: str) -> list[str]:
+    """
+    Previous BlockListener path: stdlib parse of the whole block, then a dict walk.
+
+    Parameters:
+    - raw (str): Text frame.
+
+    Returns:
+    - list[str]: Base64 encoded transactions.
+    """
+    data = json.loads(raw)
+    block = data["params"]["result"]["value"]["block"]
+    return [tx["transaction"][0] for tx in block["transactions"] if isinstance(tx, dict) and "transaction" in tx]
+
+
+# === Function 'codec_block' ===
+def codec_block(raw: str) -> list[str]:
+    """
+    Current BlockListener path: typed decode of the transactions only.
+
+    Parameters:
+    - raw (str): Text frame.
+
+    Returns:
+    - list[str]: Base64 encoded transactions.
+    """
+    event = codec.decode_block(raw)
+    return event.transactions if event is not None else []
+
+
+# === Function 'measure' ===
+def measure(function: Callable[[Any], Any], messages: list, rounds: int) -> dict[str, float]:
+    """
+    Times a function over a message list, keeping the best of several rounds.
+
+    Parameters:
+    - function (Callable): Function applied to every message.
+    - messages (list): Inputs.
+    - rounds (int): Number of timed passes.
+
+    Returns:
+    - dict: Messages per second and microseconds per message.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for message in messages:
+            function(message)
+        best = min(best, time.perf_counter() - started)
+    return {"persecond": round(len(messages) / best), "microseconds": round(best / len(messages) * 1e6, 2)}
+
+
+# === Function 'run' ===
+def run(args: argparse.Namespace) -> dict:
+    """
+    Measures the listener and RPC decode paths before and after the codec layer,
+    once per installed backend, and checks that every path returns the same tokens.
+
+    Parameters:
+    - args (argparse.Namespace): Parsed command line options.
+
+    Returns:
+    - dict: Benchmark report.
+    """
+    messages = build_messages(args.messages, args.creates, args.blocksize, args.seed)
+    expected = [legacy_logs(raw) for raw in messages["logs"]]
+    sizes = {stream: round(sum(len(message) for message in messages[stream]) / len(messages[stream])) for stream in ("logs", "blocks", "replies")}
+
+    report: dict[str, Any] = {
+        "settings": vars(args),
+        "python": sys.version.split()[0],
+        "messagebytes": sizes,
+        "before": {
+            "logs": measure(legacy_logs, messages["logs"], args.rounds),
+            "blocks": measure(legacy_block, messages["blocks"], args.rounds),
+            "replies": measure(json.loads, messages["replies"], args.rounds),
+            "requests": measure(lambda body: json.dumps(body).encode(), messages["bodies"], args.rounds)
+        },
+        "after": {}
+    }
+
+    for name in backends():
+        with backend(name):
+            if [codec_logs(raw) for raw in messages["logs"]] != expected:
+                raise RuntimeError(f"Backend {name} decoded different tokens")
+            report["after"][name] = {
+                "logs": measure(codec_logs, messages["logs"], args.rounds),
+                "blocks": measure(codec_block, messages["blocks"], args.rounds),
+                "replies": measure(codec.loads, messages["replies"], args.rounds),
+                "requests": measure(codec.dumpb, messages["bodies"], args.rounds)
+            }
+
+    installed = report["after"]["installed"]
+    report["speedup"] = {stream: round(installed[stream]["persecond"] / report["before"][stream]["persecond"], 2) for stream in report["before"]}
+    return report
+
+
+# === Function 'main' ===
+def main() -> None:
+    """
+    Parses the command line, runs the benchmark and prints the JSON report.
+
+    Returns:
+    - None
+    """
+    parser = argparse.ArgumentParser(description = "Throughput of the notification and RPC reply decode paths")
+    parser.add_argument("--messages", type = int, default = 5000, help = "Logs notifications and RPC replies to decode")
+    parser.add_argument("--creates", type = float, default = 0.02, help = "Share of logs notifications announcing a token")
+    parser.add_argument("--blocksize", type = int, default = 50, help = "Transactions per block notification")
+    parser.add_argument("--rounds", type = int, default = 5, help = "Timed passes, the best one is reported")
+    parser.add_argument("--seed", type = int, default = 7)
+    parser.add_argument("--output", help = "Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    text = json.dumps(run(args), indent = 2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text, encoding = "utf-8")
+
+
+# === Callback ===
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# === Import libraries ===
+import argparse
+import json
+import random
+import struct
+import sys
+import time
+import tracemalloc
+
+# === Import packages ===
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from construct import Flag
+from construct import Int64ul
+from construct import Struct
+
+# === Import dependencies ===
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core import curve
+from core.curve import BondingCurveState
+from core.curve import CURVE_FIELDS
+from core.curve import EXPECTED_DISCRIMINATOR
+
+
+# === Class 'LegacyCurveState' ===
+class LegacyCurveState:
+    """
+    Previous BondingCurveState decoder: a construct Struct parse copied into the instance
+    dictionary, kept here as the baseline.
+    """
+
+    _STRUCT = Struct(
+        "virtual_token_reserves" / Int64ul,
+        "virtual_sol_reserves" / Int64ul,
+        "real_token_reserves" / Int64ul,
+        "real_sol_reserves" / Int64ul,
+        "token_total_supply" / Int64ul,
+        "complete" / Flag,
+    )
+
+    # === Function '__init__' ===
+    def __init__(self, data: bytes) -> None:
+        """
+        Parses bonding curve data the way the previous implementation did.
+
+        Parameters:
+        - data (bytes): Raw account data.
+
+        Returns:
+        - None
+        """
+        if data[:8] != EXPECTED_DISCRIMINATOR:
+            raise ValueError("Invalid curve state discriminator")
+        parsed = self._STRUCT.parse(data[8:])
+        self.__dict__.update(parsed)
+
+
+# === Function 'build_accounts' ===
+def build_accounts(count: int, length: int, seed: int) -> list[bytes]:
+    """
+    Generates bonding curve accounts with random reserves.
+
+    Parameters:
+    - count (int): Number of accounts.
+    - length (int): Bytes per account, the full on-chain account is longer than the fields read.
+    - seed (int): Random seed.
+
+    Returns:
+    - list[bytes]: Raw account data.
+    """
+    rng = random.Random(seed)
+    accounts = []
+    for _ in range(count):
+        fields = struct.pack("<5Q?", *(rng.randrange(1, 2**50) for _ in range(5)), rng.random() < 0.05)
+        accounts.append((EXPECTED_DISCRIMINATOR + fields).ljust(length, b"\0"))
+    return accounts
+
+
+# === Function 'measure' ===
+def measure(function: Callable[[list[bytes]], Any], accounts: list[bytes], rounds: int) -> dict[str, float]:
+    """
+    Times a decoder over every account, keeping the best of several rounds, then measures
+    the memory it allocates in one more pass.
+
+    Parameters:
+    - function (Callable): Decoder taking the whole account list.
+    - accounts (list[bytes]): Inputs.
+    - rounds (int): Number of timed passes.
+
+    Returns:
+    - dict: Decodes per second, nanoseconds per decode and allocated bytes per decode.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function(accounts)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    result = function(accounts)
+    allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return {"persecond": round(len(accounts) / best), "nanoseconds": round(best / len(accounts) * 1e9, 1), "bytes": round(allocated / len(accounts), 1)}
+
+
+# === Function 'run' ===
+def run(args: argparse.Namespace) -> dict:
+    """
+    Compares the construct decoder with the struct decoder, decoding into new objects
+    and in place into one cached object, and the vectorized NumPy decoder when installed.
+    Every decoder must return the same fields.
+
+    Parameters:
+    - args (argparse.Namespace): Parsed command line options.
+
+    Returns:
+    - dict: Benchmark report.
+    """
+    accounts = build_accounts(args.accounts, args.length, args.seed)
+    expected = [tuple(getattr(LegacyCurveState(data), name) for name in CURVE_FIELDS) for data in accounts]
+    if [tuple(getattr(BondingCurveState(data), name) for name in CURVE_FIELDS) for data in accounts] != expected:
+        raise RuntimeError("Struct decoder returned different fields")
+
+    cached = BondingCurveState(accounts[0])
+
+    def inplace(datas: list[bytes]) -> BondingCurveState:
+        for data in datas:
+            cached.update(data)
+        return cached
+
+    report: dict[str, Any] = {
+        "settings": vars(args),
+        "python": sys.version.split()[0],
+        "decoders": {
+            "construct": measure(lambda datas: [LegacyCurveState(data) for data in datas], accounts, args.rounds),
+            "struct": measure(lambda datas: [BondingCurveState(data) for data in datas], accounts, args.rounds),
+            "inplace": measure(inplace, accounts, args.rounds)
+        }
+    }
+
+    if curve.np is not None:
+        records = curve.decode_curve_array(accounts)
+        if [tuple(record[name].item() for name in CURVE_FIELDS) for record in records] != expected:
+            raise RuntimeError("NumPy decoder returned different fields")
+        report["decoders"]["numpy"] = measure(curve.decode_curve_array, accounts, args.rounds)
+        report["decoders"]["numpyprices"] = measure(lambda datas: curve.curve_prices(curve.decode_curve_array(datas)), accounts, args.rounds)
+
+    baseline = report["decoders"]["construct"]["persecond"]
+    report["speedup"] = {name: round(result["persecond"] / baseline, 1) for name, result in report["decoders"].items()}
+    return report
+
+
+# === Function 'main' ===
+def main() -> None:
+    """
+    Parses the command line, runs the benchmark and prints the JSON report.
+
+    Returns:
+    - None
+    """
+    parser = argparse.ArgumentParser(description = "Throughput and allocations of the bonding curve decoders")
+    parser.add_argument("--accounts", type = int, default = 20000, help = "Accounts to decode per pass")
+    parser.add_argument("--length", type = int, default = 150, help = "Bytes per account")
+    parser.add_argument("--rounds", type = int, default = 5, help = "Timed passes, the best one is reported")
+    parser.add_argument("--seed", type = int, default = 7)
+    parser.add_argument("--output", help = "Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    text = json.dumps(run(args), indent = 2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text, encoding = "utf-8")
+
+
+# === Callback ===
+if __name__ == "__main__":
+    main()
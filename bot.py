@@ -88,6 +88,12 @@ class PumpBotManager:
             # General
             rpcendpoint = nodeinfo["rpc"],
             wssendpoint = nodeinfo["wss"],
+            rpcpoolsize = nodeinfo.get("poolsize", 20),
+            rpcbatchwindow = nodeinfo.get("batchwindow", 0.002),
+            rpcendpoints = nodeinfo.get("rpcs", []),
+            rpcbroadcast = nodeinfo.get("broadcast", False),
+            rpcratelimit = nodeinfo.get("ratelimit", 0),
+            rpcslowcall = nodeinfo.get("slowcall", 1.0),
             privatekey = loadwallet["privatekey"],
 
             # Main
@@ -119,7 +125,6 @@ class PumpBotManager:
             buyslippage = botconf["trade"]["buyslippage"],
             sellslippage = botconf["trade"]["sellslippage"],
             fastmode = botconf["trade"]["fastmode"],
-            fasttokens = botconf["trade"]["fasttokens"],
             stoploss = botconf["trade"]["stoploss"],
             takeprofit = botconf["trade"]["takeprofit"],
             trailprofit = botconf["trade"]["trailprofit"],
@@ -130,6 +135,7 @@ class PumpBotManager:
             priolamports = botconf["priority"]["lamports"],
             prioextrafee = botconf["priority"]["extra"],
             priohardcap = botconf["priority"]["hardcap"],
+            priotarget = botconf["priority"].get("target", 0),
 
             # Retries
             maxattempts = botconf["retries"]["attempts"],
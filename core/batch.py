@@ -0,0 +1,160 @@
+# Import libraries
+import asyncio
+import itertools
+
+# Import packages
+from typing import Any
+
+# Import local packages
+from core.limiter import PRIORITIES
+from core.limiter import priority_for
+
+
+# Class 'RPCError'
+class RPCError(RuntimeError):
+    """ JSON-RPC error object returned by the node """
+
+    # Class initialization
+    def __init__(self, code: int | None, message: str):
+        """ Initializer description """
+        super().__init__(f"RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+# Class 'RPCBatcher'
+class RPCBatcher:
+    """ Merge concurrent JSON-RPC calls into batch requests """
+
+    # Class initialization
+    def __init__(self, transport: Any, window: float = 0.002, maxbatch: int = 100):
+        """ Initializer description """
+        self.transport = transport
+        self.window = window
+        self.maxbatch = maxbatch
+        self.batches = 0
+        self.calls = 0
+        self._ids = itertools.count(1)
+        self._pending: list[tuple[dict[str, Any], asyncio.Future, str]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    # Function 'body'
+    def body(self, method: str, params: list[Any] | None = None) -> dict[str, Any]:
+        """ Build a JSON-RPC request body with a unique id """
+        body = {"jsonrpc": "2.0", "id": next(self._ids), "method": method}
+        if params is not None:
+            body["params"] = params
+        return body
+
+    # Function 'unwrap'
+    @staticmethod
+    def unwrap(reply: dict[str, Any] | None) -> Any:
+        """ Return the result of a JSON-RPC reply or raise its error """
+        if not isinstance(reply, dict):
+            raise RPCError(None, "Missing reply in batch response")
+        if "error" in reply:
+            error = reply["error"] or {}
+            raise RPCError(error.get("code"), error.get("message", "unknown error"))
+        return reply.get("result")
+
+    # Function 'submit'
+    async def submit(self, method: str, params: list[Any] | None = None, priority: str | None = None) -> Any:
+        """ Queue a call for the next batch and wait for its result """
+        body = self.body(method, params)
+        priority = priority or priority_for(method)
+        self.calls += 1
+        if not self.window:
+            self.batches += 1
+            return self.unwrap(await self.transport.post_json(body, priority = priority))
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((body, future, priority))
+        if len(self._pending) >= self.maxbatch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self.flush)
+        return await future
+
+    # Function 'execute'
+    async def execute(self, calls: list[tuple[str, list[Any] | None]], priority: str | None = None) -> list[Any]:
+        """ Send several calls as one batch, errors are returned in place of results """
+        if not calls:
+            return []
+
+        bodies = [self.body(method, params) for method, params in calls]
+        self.calls += len(bodies)
+        self.batches += 1
+        try:
+            replies = await self.transport.post_json(bodies, priority = priority or priority_for(calls[0][0]))
+        except RPCError as e:
+            # The router raises a node error that answered every call, each call failed with it
+            return [e] * len(bodies)
+        results = []
+        for reply in self.align(replies, bodies):
+            try:
+                results.append(self.unwrap(reply))
+            except RPCError as e:
+                results.append(e)
+        return results
+
+    # Function 'flush'
+    def flush(self) -> None:
+        """ Dispatch every queued call as a single batch request """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.maxbatch):
+            task = asyncio.create_task(self._dispatch(pending[start:start + self.maxbatch]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    # Function '_dispatch'
+    async def _dispatch(self, pending: list[tuple[dict[str, Any], asyncio.Future, str]]) -> None:
+        """ Post one batch at the priority of its most urgent call and resolve each caller's future """
+        self.batches += 1
+        priority = min((name for _, _, name in pending), key = PRIORITIES.__getitem__)
+        try:
+            if len(pending) == 1:
+                replies = [await self.transport.post_json(pending[0][0], priority = priority)]
+            else:
+                replies = await self.transport.post_json([body for body, _, _ in pending], priority = priority)
+        except Exception as e:
+            for _, future, _ in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        aligned = self.align(replies, [body for body, _, _ in pending])
+        for (_, future, _), reply in zip(pending, aligned):
+            if future.done():
+                continue
+            try:
+                future.set_result(self.unwrap(reply))
+            except RPCError as e:
+                future.set_exception(e)
+
+    # Function 'align'
+    @staticmethod
+    def align(replies: Any, bodies: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        """ Order batch replies like their request bodies """
+        if isinstance(replies, dict):
+            if replies.get("id") is None:
+                return [replies] * len(bodies)
+            replies = [replies]
+        byid = {reply.get("id"): reply for reply in replies or [] if isinstance(reply, dict)}
+        return [byid.get(body["id"]) for body in bodies]
+
+    # Function 'stats'
+    def stats(self) -> dict[str, int]:
+        """ Return the number of calls and HTTP batches sent """
+        return {"calls": self.calls, "batches": self.batches}
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Flush queued calls and wait for in-flight batches """
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions = True)
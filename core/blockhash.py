@@ -0,0 +1,249 @@
+# Import libraries
+import asyncio
+import logging
+import time
+
+# Import packages
+from collections import OrderedDict
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+from typing import Final
+from solders.hash import Hash
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+# Define 'SLOT_TIME'
+SLOT_TIME: Final[float] = 0.4
+
+# Define 'MAX_PROCESSING_AGE'
+# Blocks after which the cluster rejects a transaction referencing a blockhash
+MAX_PROCESSING_AGE: Final[int] = 150
+
+
+# Class 'RecentBlockhash'
+@dataclass(frozen = True)
+class RecentBlockhash:
+    """ Blockhash together with its expiry height and the slot it was fetched at """
+
+    # Define 'blockhash'
+    blockhash: Hash
+
+    # Define 'lastvalidheight'
+    lastvalidheight: int
+
+    # Define 'slot'
+    slot: int
+
+    # Define 'fetched'
+    fetched: float
+
+
+# Class 'BlockhashTracker'
+class BlockhashTracker:
+    """ Blockhash cache refreshed from slot notifications instead of a fixed poll """
+
+    # Class initialization
+    def __init__(self, client: Any, hub: Any = None, refreshslots: int = 10, pressureslots: int = 3, minremaining: int = 45, idletimeout: float = 30.0, pressurewindow: float = 2.0, pressuresends: int = 3):
+        """ Initializer description """
+        self.client = client
+        self.hub = hub
+        self.refreshslots = refreshslots
+        self.pressureslots = pressureslots
+        self.minremaining = minremaining
+        self.idletimeout = idletimeout
+        self.pressurewindow = pressurewindow
+        self.pressuresends = pressuresends
+        self.current: RecentBlockhash | None = None
+        self.slot = 0
+        self.height = 0
+        self.refreshes = 0
+        self.blocking = 0
+        self._slottime = 0.0
+        self._heighttime = 0.0
+        self._uses: deque[float] = deque(maxlen = 64)
+        self._issued: OrderedDict[str, RecentBlockhash] = OrderedDict()
+        self._refresh_task: asyncio.Task | None = None
+        self._subscription: Any = None
+
+    # Function 'start'
+    async def start(self, attempts: int = 3, backoff: float = 0.25) -> None:
+        """ Follow slot notifications and fetch the first blockhash, retrying transient read errors """
+        if self.hub is not None and self._subscription is None:
+            self._subscription = await self.hub.subscribe("slotSubscribe", [], self._on_slot)
+        for attempt in range(attempts):
+            try:
+                await self.refresh()
+                return
+            except Exception as e:
+                logger.warning(f"Blockhash fetch attempt {attempt + 1} failed: {e!s}")
+                if attempt < attempts - 1:
+                    await asyncio.sleep(backoff * 2 ** attempt)
+        # Slot notifications or the first get() fetch it later, a node that is briefly behind must not stop the bot
+        logger.error(f"No blockhash after {attempts} attempts, fetching it on the next slot or send")
+
+    # Function '_on_slot'
+    def _on_slot(self, result: dict[str, Any]) -> None:
+        """ Track the cluster slot and refresh the blockhash while the bot is sending or none was fetched yet """
+        self._advance(result["slot"])
+        if self.current is None or (self.active() and self.ageslots() >= self.threshold()):
+            self._schedule()
+
+    # Function '_advance'
+    def _advance(self, slot: int) -> None:
+        """ Move the known slot forward """
+        if slot > self.slot:
+            self.slot = slot
+            self._slottime = time.monotonic()
+
+    # Function 'currentslot'
+    def currentslot(self) -> int:
+        """ Latest known slot, extrapolated from wall time when notifications lag """
+        if not self._slottime:
+            return self.slot
+        return self.slot + int((time.monotonic() - self._slottime) / SLOT_TIME)
+
+    # Function 'ageslots'
+    def ageslots(self, entry: RecentBlockhash | None = None) -> int:
+        """ Slots elapsed since a blockhash was fetched """
+        entry = entry or self.current
+        if entry is None:
+            return 0
+        return max(0, self.currentslot() - entry.slot)
+
+    # Function 'remaining'
+    def remaining(self, entry: RecentBlockhash) -> int:
+        """ Estimated blocks left before the blockhash expires """
+        # lastValidBlockHeight is the fetch height plus MAX_PROCESSING_AGE, and block height
+        # never advances faster than the slot, so this errs on the side of expiring early
+        return MAX_PROCESSING_AGE - self.ageslots(entry)
+
+    # Function 'blockheight'
+    async def blockheight(self) -> int:
+        """ Current block height of the cluster, read at most once per slot """
+        if time.monotonic() - self._heighttime >= SLOT_TIME:
+            height = await self.client.CallRPC("getBlockHeight", [{"commitment": "processed"}], priority = "confirm")
+            self._store(height)
+        return self.height
+
+    # Function '_store'
+    def _store(self, height: int) -> None:
+        """ Move the known block height forward """
+        self._heighttime = time.monotonic()
+        if height > self.height:
+            self.height = height
+
+    # Function 'expired'
+    async def expired(self, entry: RecentBlockhash) -> bool:
+        """ True once the block height has passed the last valid height of a blockhash, the slot estimate if it cannot be read """
+        try:
+            height = await self.blockheight()
+        except Exception as e:
+            logger.debug(f"Block height read failed: {e!s}")
+            return self.remaining(entry) <= 0
+        return height > entry.lastvalidheight
+
+    # Function 'active'
+    def active(self) -> bool:
+        """ True if a blockhash was requested within the idle timeout """
+        return bool(self._uses) and time.monotonic() - self._uses[-1] < self.idletimeout
+
+    # Function 'pressured'
+    def pressured(self) -> bool:
+        """ True when several transactions were signed within the pressure window """
+        now = time.monotonic()
+        return sum(1 for used in self._uses if now - used < self.pressurewindow) >= self.pressuresends
+
+    # Function 'threshold'
+    def threshold(self) -> int:
+        """ Slot age at which a background refresh starts """
+        return self.pressureslots if self.pressured() else self.refreshslots
+
+    # Function 'refresh'
+    async def refresh(self) -> RecentBlockhash:
+        """ Fetch a new blockhash, sharing the request with concurrent callers """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._fetch())
+        return await asyncio.shield(self._refresh_task)
+
+    # Function '_schedule'
+    def _schedule(self) -> None:
+        """ Start a background refresh unless one is already running """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._fetch())
+            self._refresh_task.add_done_callback(self._refreshed)
+
+    # Function '_refreshed'
+    @staticmethod
+    def _refreshed(task: asyncio.Task) -> None:
+        """ Log a failed background refresh """
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Blockhash refresh failed: {task.exception()!s}")
+
+    # Function '_fetch'
+    async def _fetch(self) -> RecentBlockhash:
+        """ Query getLatestBlockhash and store the result """
+        # Every transaction waits on this hash, so it is fetched ahead of reads whatever the caller
+        response = await self.client.CallRPC("getLatestBlockhash", [{"commitment": "processed"}], priority = "send")
+        value = response["value"]
+        slot = response["context"]["slot"]
+        self._advance(slot)
+        self._store(value["lastValidBlockHeight"] - MAX_PROCESSING_AGE)
+
+        entry = RecentBlockhash(Hash.from_string(value["blockhash"]), value["lastValidBlockHeight"], slot, time.monotonic())
+        if self.current is None or entry.slot >= self.current.slot:
+            self.current = entry
+        self._issued[str(entry.blockhash)] = entry
+        while len(self._issued) > 32:
+            self._issued.popitem(last = False)
+        self.refreshes += 1
+        return entry
+
+    # Function 'get'
+    async def get(self) -> RecentBlockhash:
+        """ Return a blockhash with enough validity left, fetching one first if the cached hash is stale """
+        self._uses.append(time.monotonic())
+        if self.current is None or self.remaining(self.current) < self.minremaining:
+            self.blocking += 1
+            return await self.refresh()
+
+        if self.ageslots() >= self.threshold():
+            self._schedule()
+        return self.current
+
+    # Function 'valid'
+    def valid(self, blockhash: Hash) -> bool:
+        """ True while a blockhash handed out by the tracker can still land """
+        entry = self._issued.get(str(blockhash))
+        return entry is not None and self.remaining(entry) > 0
+
+    # Function 'age'
+    def age(self) -> float | None:
+        """ Seconds since the current blockhash was fetched """
+        if self.current is None:
+            return None
+        return time.monotonic() - self.current.fetched
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return the age of the current blockhash and refresh counters """
+        age = self.age()
+        return {
+            "age": round(age, 3) if age is not None else None,
+            "ageslots": self.ageslots(),
+            "remaining": self.remaining(self.current) if self.current is not None else None,
+            "height": self.height,
+            "refreshes": self.refreshes,
+            "blocking": self.blocking,
+            "pressured": self.pressured()
+        }
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop following slots and cancel a pending refresh """
+        if self._subscription is not None:
+            await self.hub.unsubscribe(self._subscription)
+            self._subscription = None
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
@@ -0,0 +1,107 @@
+# Import libraries
+import asyncio
+import json
+import time
+
+# Import packages
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+from typing import Final
+
+# Define 'DEFAULT_TTLS'
+# Seconds a successful reply stays valid; 0 only coalesces concurrent identical calls
+DEFAULT_TTLS: Final[dict[str, float]] = {
+    "getAccountInfo": 0.2,
+    "getMultipleAccounts": 0.2,
+    "getTokenAccountBalance": 0.2,
+    "getBalance": 0.2,
+    "getLatestBlockhash": 0.0,
+    "getRecentPrioritizationFees": 1.0,
+    "getHealth": 5.0,
+    "getSignatureStatuses": 0.0,
+}
+
+
+# Class 'RPCCache'
+class RPCCache:
+    """ Single-flight coalescing in front of a size-bounded per-method TTL cache """
+
+    # Class initialization
+    def __init__(self, ttls: dict[str, float] | None = None, maxsize: int = 1024):
+        """ Initializer description """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    # Function 'key'
+    @staticmethod
+    def key(method: str, params: list[Any] | None) -> str:
+        """ Build the cache key of a call from its method and params """
+        return method + json.dumps(params, sort_keys = True, separators = (",", ":"), default = str)
+
+    # Function 'fetch'
+    async def fetch(self, method: str, params: list[Any] | None, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """ Return a cached or in-flight result, or load it once for every concurrent caller """
+        ttl = self.ttls.get(method)
+        if ttl is None:
+            return await loader()
+
+        key = self.key(method, params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task)
+
+        self.misses += 1
+        task = asyncio.ensure_future(loader())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._store(key, ttl, done))
+        return await asyncio.shield(task)
+
+    # Function '_store'
+    def _store(self, key: str, ttl: float, task: asyncio.Task) -> None:
+        """ Release the in-flight slot and keep successful results for their TTL """
+        self._inflight.pop(key, None)
+        if ttl <= 0 or task.cancelled() or task.exception() is not None:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last = False)
+            self.evictions += 1
+
+    # Function 'invalidate'
+    def invalidate(self, method: str | None = None) -> None:
+        """ Drop cached entries, for one method or all of them """
+        if method is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key.startswith(method + "[") or key == method + "null"]:
+            del self._entries[key]
+
+    # Function 'stats'
+    def stats(self) -> dict[str, int]:
+        """ Return cache hit, miss, coalesced and eviction counters """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "size": len(self._entries)
+        }
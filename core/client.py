@@ -1,54 +1,118 @@
 # Import libraries
 import aiohttp
 import asyncio
-import json
+import base64
 import logging
 
 # Import packages
+from collections import OrderedDict
 from typing import Any
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Processed
-from solana.rpc.types import TxOpts
 from solders.compute_budget import set_compute_unit_limit
+from solders.account import Account
 from solders.compute_budget import set_compute_unit_price
 from solders.hash import Hash
 from solders.instruction import Instruction
 from solders.keypair import Keypair
 from solders.message import Message
 from solders.pubkey import Pubkey
+from solders.signature import Signature
 from solders.transaction import Transaction
 
+# Import local packages
+from core import codec
+from core.batch import RPCBatcher
+from core.batch import RPCError
+from core.blockhash import BlockhashTracker
+from core.cache import RPCCache
+from core.compute import ComputeBudgeter
+from core.confirm import SignatureConfirmer
+from core.health import CircuitOpenError
+from core.limiter import RateLimitError
+from core.limiter import priority_for
+from core.resend import TransactionResender
+from core.router import EndpointRouter
+from core.session import PooledHTTPProvider
+from core.websocket import WebsocketHub
+
+# Import optional packages
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Define 'logger'
 logger = logging.getLogger(__name__)
 
+# Define 'MAX_MULTIPLE_ACCOUNTS'
+MAX_MULTIPLE_ACCOUNTS = 100
+
 
 # Class 'SolanaClient'
 class SolanaClient:
     """ Class description """
 
     # Class initialization
-    def __init__(self, rpcendpoint: str):
+    def __init__(self, rpcendpoint: str, poolsize: int = 20, keepalive: float = 60.0, dnscache: int = 300, batchwindow: float = 0.002, cachettls: dict[str, float] | None = None, cachesize: int = 1024, rpcendpoints: list[dict[str, Any]] | None = None, broadcast: bool = False, rebroadcastinterval: float = 0.4, wssendpoint: str | None = None, ratelimit: float = 0.0, slowcall: float = 1.0, profilepath: str | None = None, profileinterval: float = 5.0, cumargin: float = 1.2, cuwait: float = 0.0):
         """ Initializer description """
         self.rpcendpoint = rpcendpoint
+        self.rpcrouter = EndpointRouter.from_config(rpcendpoint, rpcendpoints, poolsize, keepalive, dnscache, ratelimit, slowcall)
+        self.rpcbatcher = RPCBatcher(self.rpcrouter, batchwindow)
+        self.rpccache = RPCCache(cachettls, cachesize)
+        self.broadcast = broadcast
+        self.rebroadcastinterval = rebroadcastinterval
+        self.accepted: OrderedDict[str, str] = OrderedDict()
+        self.profilepath = profilepath
+        self.profileinterval = profileinterval
+        self._profile_task: asyncio.Task | None = None
+        self.wshub = WebsocketHub(wssendpoint) if wssendpoint else None
+        self.blockhashes = BlockhashTracker(self, self.wshub)
+        self.confirmer = SignatureConfirmer(self, self.wshub)
+        self.budgeter = ComputeBudgeter(self, cumargin, wait = cuwait)
+        self.resender = TransactionResender(self, rebroadcastinterval)
         self._client = None
-        self._cached_blockhash: Hash | None = None
-        self._blockhash_lock = asyncio.Lock()
-        self._blockhash_updater_task = asyncio.create_task(self.start_blockhash_updater())
 
     # Function 'PostRPC'
     async def PostRPC(self, body: dict[str, Any]) -> dict[str, Any] | None:
         """ Function description """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.rpcendpoint, json = body, timeout = aiohttp.ClientTimeout(10)) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            return await self.rpcrouter.post_json(body)
         except aiohttp.ClientError as e:
             logger.error(f"RPC request failed: {e!s}", exc_info=True)
             return None
-        except json.JSONDecodeError as e:
+        except codec.DECODE_ERRORS as e:
             logger.error(f"Failed to decode RPC response: {e!s}", exc_info=True)
             return None
+        except (TimeoutError, CircuitOpenError, RateLimitError, RPCError) as e:
+            logger.error(f"RPC request failed: {e!s}")
+            return None
+
+    # Function 'PostBatch'
+    async def PostBatch(self, bodies: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+        """ Send several JSON-RPC bodies as one batch, replies follow the body order """
+        try:
+            replies = await self.rpcrouter.post_json(bodies)
+            return RPCBatcher.align(replies, bodies)
+        except aiohttp.ClientError as e:
+            logger.error(f"RPC batch request failed: {e!s}", exc_info=True)
+            return None
+        except codec.DECODE_ERRORS as e:
+            logger.error(f"Failed to decode RPC batch response: {e!s}", exc_info=True)
+            return None
+        except (TimeoutError, CircuitOpenError, RateLimitError, RPCError) as e:
+            logger.error(f"RPC batch request failed: {e!s}")
+            return None
+
+    # Function 'CallRPC'
+    async def CallRPC(self, method: str, params: list[Any] | None = None, priority: str | None = None) -> Any:
+        """ Call a method through the cache, single-flight and batch layers and return its result """
+        priority = priority or priority_for(method)
+        return await self.rpccache.fetch(method, params, lambda: self.rpcbatcher.submit(method, params, priority))
+
+    # Function 'CallBatch'
+    async def CallBatch(self, calls: list[tuple[str, list[Any] | None]], priority: str | None = None) -> list[Any]:
+        """ Call several methods in one batch request, failed calls yield an RPCError """
+        return await self.rpcbatcher.execute(calls, priority)
 
     # Function 'GetHealth'
     async def GetHealth(self) -> str | None:
@@ -63,108 +127,206 @@ class SolanaClient:
             return result["result"]
         return None
 
-    # Function 'start_blockhash_updater'
-    async def start_blockhash_updater(self, interval: float = 5.0):
-        """ Function description """
+    # Function 'warmup'
+    async def warmup(self, connections: int = 2) -> str | None:
+        """ Open pooled connections ahead of the first trade and check node health """
+        await self.rpcrouter.warmup(connections)
+        await self.get_client()
+        await self.blockhashes.start()
+        if self.profilepath and self._profile_task is None:
+            self._profile_task = asyncio.create_task(self._profile_loop())
+        return await self.GetHealth()
+
+    # Function 'pool_stats'
+    def pool_stats(self) -> dict[str, Any]:
+        """ Return per-endpoint routing and pool counters """
+        return {**self.rpcrouter.stats(), **self.rpcbatcher.stats()}
+
+    # Function 'profile_stats'
+    def profile_stats(self) -> dict[str, Any]:
+        """ Return per-method latency histograms, payload sizes, errors, in-flight gauges and slow calls """
+        return self.rpcrouter.profiler.snapshot()
+
+    # Function '_profile_loop'
+    async def _profile_loop(self) -> None:
+        """ Write the profiler snapshot for the web UI at a fixed interval """
         while True:
+            await asyncio.sleep(self.profileinterval)
             try:
-                blockhash = await self.get_latest_blockhash()
-                async with self._blockhash_lock:
-                    self._cached_blockhash = blockhash
-            except Exception as e:
-                logger.warning(f"Blockhash fetch failed: {e!s}")
-            finally:
-                await asyncio.sleep(interval)
+                self.rpcrouter.profiler.dump(self.profilepath)
+            except OSError as e:
+                logger.warning(f"Failed to write RPC profile: {e!s}")
+
+    # Function 'cache_stats'
+    def cache_stats(self) -> dict[str, int]:
+        """ Return RPC response cache and single-flight counters """
+        return self.rpccache.stats()
 
     # Function 'get_cached_blockhash'
     async def get_cached_blockhash(self) -> Hash:
-        """ Function description """
-        async with self._blockhash_lock:
-            if self._cached_blockhash is None:
-                raise RuntimeError("No cached blockhash available yet")
-            return self._cached_blockhash
+        """ Return a recent blockhash that still has enough validity left """
+        return (await self.blockhashes.get()).blockhash
 
     # Function 'get_client'
     async def get_client(self) -> AsyncClient:
         """ Function description """
         if self._client is None:
             self._client = AsyncClient(self.rpcendpoint)
+            await self._client._provider.close()
+            self._client._provider = PooledHTTPProvider(self.rpcrouter)
         return self._client
 
     # Function 'close'
     async def close(self):
         """ Function description """
-        if self._blockhash_updater_task:
-            self._blockhash_updater_task.cancel()
+        await self.blockhashes.close()
+        await self.confirmer.close()
+        await self.budgeter.close()
+        if self.wshub is not None:
+            await self.wshub.close()
+
+        await self.resender.close()
+
+        if self._profile_task is not None:
+            self._profile_task.cancel()
+            self._profile_task = None
+        if self.profilepath:
             try:
-                await self._blockhash_updater_task
-            except asyncio.CancelledError:
-                pass
+                self.rpcrouter.profiler.dump(self.profilepath)
+            except OSError as e:
+                logger.warning(f"Failed to write RPC profile: {e!s}")
 
         if self._client:
             await self._client.close()
             self._client = None
 
+        await self.rpcbatcher.close()
+        logger.info(f"RPC pool stats: {self.pool_stats()}")
+        logger.info(f"RPC cache stats: {self.cache_stats()}")
+        logger.info(f"Blockhash stats: {self.blockhashes.stats()}")
+        logger.info(f"Confirmation stats: {self.confirmer.stats()}")
+        logger.info(f"Compute budget stats: {self.budgeter.stats()}")
+        logger.info(f"Resend stats: {self.resender.stats()}")
+        await self.rpcrouter.close()
+
     # Function 'get_account_info'
-    async def get_account_info(self, pubkey: Pubkey) -> dict[str, Any]:
+    async def get_account_info(self, pubkey: Pubkey) -> Account:
         """ Function description """
-        client = await self.get_client()
-        response = await client.get_account_info(pubkey, encoding="base64")
-        if not response.value:
+        account, _ = await self.get_account_info_slot(pubkey)
+        return account
+
+    # Function 'get_account_info_slot'
+    async def get_account_info_slot(self, pubkey: Pubkey) -> tuple[Account, int]:
+        """ Fetch one account together with the slot it was read at """
+        response = await self.CallRPC("getAccountInfo", [str(pubkey), {"encoding": "base64"}])
+        if not response or not response.get("value"):
             raise ValueError(f"Account {pubkey} not found")
-        return response.value
+        return self._parse_account(response["value"]), response.get("context", {}).get("slot", 0)
+
+    # Function 'get_multiple_accounts'
+    async def get_multiple_accounts(self, pubkeys: list[Pubkey], data_slice: tuple[int, int] | None = None, encoding: str = "base64") -> list[Account | None]:
+        """ Fetch many accounts with getMultipleAccounts, missing accounts yield None """
+        if encoding == "base64+zstd" and zstandard is None:
+            logger.warning("zstandard is not installed, falling back to base64 account encoding")
+            encoding = "base64"
+
+        config: dict[str, Any] = {"encoding": encoding}
+        if data_slice is not None:
+            config["dataSlice"] = {"offset": data_slice[0], "length": data_slice[1]}
+
+        keys = [str(pubkey) for pubkey in pubkeys]
+        chunks = [keys[start:start + MAX_MULTIPLE_ACCOUNTS] for start in range(0, len(keys), MAX_MULTIPLE_ACCOUNTS)]
+        responses = await asyncio.gather(*(self.CallRPC("getMultipleAccounts", [chunk, config]) for chunk in chunks))
+
+        accounts = []
+        for chunk, response in zip(chunks, responses):
+            if not response or response.get("value") is None:
+                accounts.extend([None] * len(chunk))
+                continue
+            for value in response["value"]:
+                accounts.append(self._parse_account(value) if value else None)
+        return accounts
+
+    # Function '_parse_account'
+    @staticmethod
+    def _parse_account(value: dict[str, Any]) -> Account:
+        """ Build a solders Account from a base64 or base64+zstd encoded JSON-RPC account """
+        payload, encoding = value["data"]
+        data = base64.b64decode(payload)
+        if encoding == "base64+zstd":
+            data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+        return Account(
+            value["lamports"],
+            data,
+            Pubkey.from_string(value["owner"]),
+            value.get("executable", False),
+            value.get("rentEpoch", 0)
+        )
 
     # Function 'get_token_account_balance'
     async def get_token_account_balance(self, token_account: Pubkey) -> int:
         """ Function description """
-        client = await self.get_client()
-        response = await client.get_token_account_balance(token_account)
-        if response.value:
-            return int(response.value.amount)
+        response = await self.CallRPC("getTokenAccountBalance", [str(token_account)])
+        if response and response.get("value"):
+            return int(response["value"]["amount"])
         return 0
 
     # Function 'get_latest_blockhash'
     async def get_latest_blockhash(self) -> Hash:
         """ Function description """
-        client = await self.get_client()
-        response = await client.get_latest_blockhash(commitment="processed")
-        return response.value.blockhash
+        response = await self.CallRPC("getLatestBlockhash", [{"commitment": "processed"}])
+        return Hash.from_string(response["value"]["blockhash"])
+
+    # Function 'send_transaction'
+    async def send_transaction(self, transaction: Transaction, skip_preflight: bool = True) -> Signature:
+        """ Send a signed transaction once through the best send endpoint, or to all of them in broadcast mode """
+        # Rebroadcasting is handled by the resender, nodes should not queue their own retries
+        options = {"encoding": "base64", "skipPreflight": skip_preflight, "preflightCommitment": "processed", "maxRetries": 0}
+        body = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "sendTransaction",
+            "params": [base64.b64encode(bytes(transaction)).decode("utf-8"), options]
+        }
+        if not self.broadcast:
+            reply = await self.rpcrouter.post_json(body, role = "send")
+            return Signature.from_string(RPCBatcher.unwrap(reply))
+
+        result, endpoint = await self.rpcrouter.broadcast(body)
+        signature = Signature.from_string(result)
+        # Acceptance only, which node's copy lands is not known
+        if str(signature) not in self.accepted:
+            endpoint.accepted += 1
+            self.accepted[str(signature)] = endpoint.name
+            while len(self.accepted) > 1024:
+                self.accepted.popitem(last = False)
+            logger.info(f"Transaction {signature} first accepted by {endpoint.name}")
+        return signature
 
     # Function 'build_and_send_transaction'
-    async def build_and_send_transaction(self, instructions: list[Instruction], signer_keypair: Keypair, skip_preflight: bool = True, max_retries: int = 3, priority_fee: int | None = None) -> str:
-        """ Function description """
-        client = await self.get_client()
+    async def build_and_send_transaction(self, instructions: list[Instruction], signer_keypair: Keypair, skip_preflight: bool = True, max_retries: int = 3, priority_fee: int | None = None, resigns: int = 0, label: str = "transaction") -> str:
+        """ Sign and send, then keep rebroadcasting until the transaction lands or may be re-signed `resigns` times """
         logger.info(f"Priority fee in microlamports: {priority_fee if priority_fee else 0}")
+        # Each shape is simulated once alongside its first send, later sends reuse the measured limit
+        limit = await self.budgeter.limit(instructions, signer_keypair)
         if priority_fee is not None:
-            fee_instructions = [set_compute_unit_limit(72_000), set_compute_unit_price(priority_fee)]
+            fee_instructions = [set_compute_unit_limit(limit or self.budgeter.default), set_compute_unit_price(priority_fee)]
             instructions = fee_instructions + instructions
+        elif limit is not None:
+            instructions = [set_compute_unit_limit(limit)] + instructions
 
-        recent_blockhash = await self.get_cached_blockhash()
         message = Message(instructions, signer_keypair.pubkey())
-        transaction = Transaction([signer_keypair], message, recent_blockhash)
-
-        for attempt in range(max_retries):
-            try:
-                tx_opts = TxOpts(skip_preflight = skip_preflight, preflight_commitment = Processed)
-                response = await client.send_transaction(transaction, tx_opts)
-                return response.value
-
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to send transaction after {max_retries} attempts")
-                    raise
-
-                wait_time = 2**attempt
-                logger.warning(f"Transaction attempt {attempt + 1} failed: {e!s}, retrying in {wait_time}s")
-                await asyncio.sleep(wait_time)
+        return await self.resender.submit(lambda entry: Transaction([signer_keypair], message, entry.blockhash), skip_preflight, max_retries, resigns, label, priority_fee)
 
     # Function 'confirm_transaction'
-    async def confirm_transaction(self, signature: str, commitment: str = "confirmed") -> bool:
-        """ Function description """
-        client = await self.get_client()
+    async def confirm_transaction(self, signature: str | Signature, commitment: str = "confirmed") -> bool:
+        """ Wait for a signatureSubscribe notification, polling statuses while the websocket is down """
         try:
-            await client.confirm_transaction(signature, commitment=commitment, sleep_seconds=1)
-            return True
+            job = self.resender.job(str(signature))
+            if job is not None:
+                return await self.resender.confirm(job, commitment)
+            return await self.confirmer.wait(str(signature), commitment)
         except Exception as e:
             logger.error(f"Failed to confirm transaction {signature}: {e!s}")
             return False
\ No newline at end of file
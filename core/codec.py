@@ -0,0 +1,196 @@
+# Import libraries
+import json
+
+# Import packages
+from dataclasses import dataclass
+from typing import Any
+from typing import Final
+
+# Import optional packages
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Define 'BACKEND'
+# Generic documents go through orjson first, typed notifications through msgspec schemas
+BACKEND: Final[str] = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+
+# Define 'DECODE_ERRORS'
+# orjson raises a subclass of json.JSONDecodeError, msgspec its own DecodeError
+DECODE_ERRORS: Final[tuple[type[Exception], ...]] = (json.JSONDecodeError,) + ((msgspec.DecodeError,) if msgspec is not None else ())
+
+
+# Function 'loads'
+def loads(data: str | bytes) -> Any:
+    """ Decode a JSON document with the fastest installed backend """
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return _decoder.decode(data)
+    return json.loads(data)
+
+
+# Function 'dumpb'
+def dumpb(obj: Any) -> bytes:
+    """ Encode an object to JSON bytes """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if msgspec is not None:
+        return _encoder.encode(obj)
+    return json.dumps(obj, separators = (",", ":")).encode()
+
+
+# Function 'dumps'
+def dumps(obj: Any) -> str:
+    """ Encode an object to a JSON string, for text websocket frames """
+    return dumpb(obj).decode()
+
+
+# Function 'mentions'
+def mentions(raw: str | bytes, *markers: str) -> bool:
+    """ True if every marker occurs in a raw message, checked before paying for a full parse """
+    if isinstance(raw, bytes):
+        return all(marker.encode() in raw for marker in markers)
+    return all(marker in raw for marker in markers)
+
+
+# Class 'LogsEvent'
+@dataclass(slots = True)
+class LogsEvent:
+    """ Program logs of one transaction from a logsNotification """
+
+    # Define 'signature'
+    signature: str
+
+    # Define 'err'
+    err: Any
+
+    # Define 'logs'
+    logs: list[str]
+
+    # Define 'slot'
+    slot: int
+
+
+# Class 'BlockEvent'
+@dataclass(slots = True)
+class BlockEvent:
+    """ Base64 encoded transactions of one block from a blockNotification """
+
+    # Define 'slot'
+    slot: int
+
+    # Define 'transactions'
+    transactions: list[str]
+
+
+# Function 'decode_logs'
+def decode_logs(raw: str | bytes) -> LogsEvent | None:
+    """ Decode a logsNotification, None for any other message """
+    if msgspec is not None:
+        try:
+            message = _logs_decoder.decode(raw)
+        except msgspec.ValidationError:
+            return None
+        if message.method != "logsNotification" or message.params is None:
+            return None
+        result = message.params.result
+        return LogsEvent(result.value.signature, result.value.err, result.value.logs or [], result.context.slot)
+
+    data = loads(raw)
+    if data.get("method") != "logsNotification":
+        return None
+    result = data["params"]["result"]
+    value = result["value"]
+    return LogsEvent(value.get("signature", "unknown"), value.get("err"), value.get("logs") or [], result.get("context", {}).get("slot", 0))
+
+
+# Function 'decode_block'
+def decode_block(raw: str | bytes) -> BlockEvent | None:
+    """ Decode a blockNotification, None for any other message or a block without transactions """
+    if msgspec is not None:
+        try:
+            message = _block_decoder.decode(raw)
+        except msgspec.ValidationError:
+            return None
+        if message.method != "blockNotification" or message.params is None:
+            return None
+        value = message.params.result.value
+        if value.block is None:
+            return None
+        return BlockEvent(value.slot, [tx.transaction[0] for tx in value.block.transactions if tx.transaction])
+
+    data = loads(raw)
+    if data.get("method") != "blockNotification":
+        return None
+    value = data.get("params", {}).get("result", {}).get("value") or {}
+    block = value.get("block")
+    if not block:
+        return None
+    transactions = [tx["transaction"][0] for tx in block.get("transactions") or [] if isinstance(tx, dict) and tx.get("transaction")]
+    return BlockEvent(value.get("slot", 0), transactions)
+
+
+# Define the msgspec schemas, unknown fields are skipped without being materialized
+if msgspec is not None:
+
+    # Class '_Context'
+    class _Context(msgspec.Struct, frozen = True):
+        slot: int = 0
+
+    # Class '_LogsValue'
+    class _LogsValue(msgspec.Struct):
+        signature: str = "unknown"
+        err: Any = None
+        logs: list[str] | None = None
+
+    # Class '_LogsResult'
+    class _LogsResult(msgspec.Struct):
+        value: _LogsValue
+        context: _Context = _Context()
+
+    # Class '_LogsParams'
+    class _LogsParams(msgspec.Struct):
+        result: _LogsResult
+
+    # Class '_LogsMessage'
+    class _LogsMessage(msgspec.Struct):
+        method: str = ""
+        params: _LogsParams | None = None
+
+    # Class '_BlockTransaction'
+    class _BlockTransaction(msgspec.Struct):
+        transaction: list[str] = []
+
+    # Class '_Block'
+    class _Block(msgspec.Struct):
+        transactions: list[_BlockTransaction] = []
+
+    # Class '_BlockValue'
+    class _BlockValue(msgspec.Struct):
+        slot: int = 0
+        block: _Block | None = None
+
+    # Class '_BlockResult'
+    class _BlockResult(msgspec.Struct):
+        value: _BlockValue
+
+    # Class '_BlockParams'
+    class _BlockParams(msgspec.Struct):
+        result: _BlockResult
+
+    # Class '_BlockMessage'
+    class _BlockMessage(msgspec.Struct):
+        method: str = ""
+        params: _BlockParams | None = None
+
+    _decoder = msgspec.json.Decoder()
+    _encoder = msgspec.json.Encoder()
+    _logs_decoder = msgspec.json.Decoder(_LogsMessage)
+    _block_decoder = msgspec.json.Decoder(_BlockMessage)
@@ -0,0 +1,174 @@
+# Import libraries
+import asyncio
+import base64
+import logging
+import time
+
+# Import packages
+from typing import Any
+from typing import Final
+from solders.compute_budget import set_compute_unit_limit
+from solders.instruction import Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+
+# Import local packages
+from core.pubkeys import PumpAddresses
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+# Define 'DEFAULT_LIMIT'
+# Limit used until a shape has been measured, enough for a buy with its ATA creation
+DEFAULT_LIMIT: Final[int] = 72_000
+
+# Define 'MAX_LIMIT'
+MAX_LIMIT: Final[int] = 1_400_000
+
+# Define 'BUDGET_UNITS'
+# Units consumed by the two compute budget instructions prepended to every transaction
+BUDGET_UNITS: Final[int] = 300
+
+# Define 'DISCRIMINATORS'
+# Leading data bytes that identify an instruction, Anchor programs use 8, native programs 1
+DISCRIMINATORS: Final[dict[Pubkey, int]] = {PumpAddresses.PROGRAM: 8}
+
+# Define 'STATE_ERRORS'
+# Errors caused by the accounts the simulation ran against rather than by the instructions themselves
+STATE_ERRORS: Final[tuple[str, ...]] = ("Custom", "InsufficientFunds", "InsufficientFundsForFee", "InsufficientFundsForRent", "AccountNotFound", "InvalidAccountForFee")
+
+
+# Class 'ComputeBudgeter'
+class ComputeBudgeter:
+    """ Compute unit limits sized from one simulation per instruction shape """
+
+    # Class initialization
+    def __init__(self, client: Any, margin: float = 1.2, default: int = DEFAULT_LIMIT, maxattempts: int = 3, cooldown: float = 60.0, statecooldown: float = 5.0, wait: float = 0.0):
+        """ Initializer description """
+        self.client = client
+        self.margin = margin
+        self.default = default
+        self.maxattempts = maxattempts
+        self.cooldown = cooldown
+        self.statecooldown = statecooldown
+        self.wait = wait
+        self.hits = 0
+        self.misses = 0
+        self.simulations = 0
+        self.failures = 0
+        self.statefailures = 0
+        self.units: dict[tuple, int] = {}
+        self._attempts: dict[tuple, int] = {}
+        self._retry: dict[tuple, float] = {}
+        self._pending: dict[tuple, asyncio.Task] = {}
+
+    # Function 'shape'
+    @staticmethod
+    def shape(instructions: list[Instruction]) -> tuple:
+        """ Key of a transaction: program and discriminator of every instruction, in order """
+        return tuple((bytes(ix.program_id), bytes(ix.data[:DISCRIMINATORS.get(ix.program_id, 1)])) for ix in instructions)
+
+    # Function 'limit'
+    async def limit(self, instructions: list[Instruction], payer: Keypair) -> int | None:
+        """ Measured limit of the shape, None until its simulation has finished or while it cannot be measured """
+        key = self.shape(instructions)
+        units = self.units.get(key)
+        if units is not None:
+            self.hits += 1
+            return units
+
+        # A simulation that loses the race to the send sees a sold balance of 0, a state error retried on a later send
+        self.misses += 1
+        task = self._measure(key, instructions, payer)
+        if task is not None and self.wait > 0:
+            # By default the first send goes out with the default limit while the shape is measured in the background
+            try:
+                await asyncio.wait_for(asyncio.shield(task), self.wait)
+            except TimeoutError:
+                logger.debug(f"Compute unit simulation still pending after {self.wait}s, sending with the default limit")
+        return self.units.get(key)
+
+    # Function '_measure'
+    def _measure(self, key: tuple, instructions: list[Instruction], payer: Keypair) -> asyncio.Task | None:
+        """ Start or join the single simulation of a shape, None while a failed shape cools down """
+        task = self._pending.get(key)
+        if task is not None:
+            return task
+        if time.monotonic() < self._retry.get(key, 0.0):
+            return None
+
+        task = asyncio.create_task(self._simulate(key, instructions, payer))
+        self._pending[key] = task
+        task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return task
+
+    # Function '_simulate'
+    async def _simulate(self, key: tuple, instructions: list[Instruction], payer: Keypair) -> None:
+        """ Simulate the instructions under the maximum limit and cache the consumed units with margin """
+        self.simulations += 1
+        try:
+            blockhash = await self.client.get_cached_blockhash()
+            message = Message([set_compute_unit_limit(MAX_LIMIT)] + instructions, payer.pubkey())
+            transaction = Transaction([payer], message, blockhash)
+            payload = base64.b64encode(bytes(transaction)).decode()
+            config = {"encoding": "base64", "sigVerify": False, "replaceRecentBlockhash": True, "commitment": "processed"}
+            # Sent in the caller's priority class, the task copied it from the trade that started it
+            result = await self.client.CallRPC("simulateTransaction", [payload, config])
+        except Exception as e:
+            self._failed(key)
+            logger.debug(f"Compute unit simulation failed: {e!s}")
+            return
+
+        value = (result or {}).get("value") or {}
+        error = value.get("err")
+        if error is not None and self.stateerror(error):
+            # The accounts were not in a state the instructions can run against, say nothing about the shape
+            self.statefailures += 1
+            self._retry[key] = time.monotonic() + self.statecooldown
+            logger.debug(f"Compute unit simulation hit account state: {error}")
+            return
+        if error is not None or not value.get("unitsConsumed"):
+            # A failing simulation stops early and under-reports, keep the default
+            self._failed(key)
+            logger.debug(f"Compute unit simulation rejected: {error}")
+            return
+
+        units = min(MAX_LIMIT, int(value["unitsConsumed"] * self.margin) + BUDGET_UNITS)
+        self.units[key] = units
+        self._attempts.pop(key, None)
+        self._retry.pop(key, None)
+        logger.info(f"Compute unit limit for a {len(instructions)} instruction transaction set to {units} ({value['unitsConsumed']} measured)")
+
+    # Function 'stateerror'
+    @staticmethod
+    def stateerror(error: Any) -> bool:
+        """ True if a simulation error comes from account state, such as a custom program error or missing funds """
+        if isinstance(error, dict) and "InstructionError" in error:
+            error = error["InstructionError"][1]
+        if isinstance(error, dict):
+            return any(name in STATE_ERRORS for name in error)
+        return error in STATE_ERRORS
+
+    # Function '_failed'
+    def _failed(self, key: tuple) -> None:
+        """ Count a failed simulation, cooling the shape down once it has failed `maxattempts` times in a row """
+        self.failures += 1
+        attempts = self._attempts.get(key, 0) + 1
+        if attempts >= self.maxattempts:
+            self._retry[key] = time.monotonic() + self.cooldown
+            attempts = 0
+        self._attempts[key] = attempts
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Cancel pending simulations """
+        for task in list(self._pending.values()):
+            task.cancel()
+        self._pending.clear()
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return shape counts, simulation counters and the measured limits """
+        return {"shapes": len(self.units), "hits": self.hits, "misses": self.misses, "simulations": self.simulations, "failures": self.failures, "statefailures": self.statefailures, "limits": sorted(self.units.values())}
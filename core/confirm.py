@@ -0,0 +1,226 @@
+# Import libraries
+import asyncio
+import logging
+
+# Import packages
+from collections import OrderedDict
+from typing import Any
+from typing import Final
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+# Define 'COMMITMENTS'
+COMMITMENTS: Final[tuple[str, ...]] = ("processed", "confirmed", "finalized")
+
+# Define 'MAX_SIGNATURE_STATUSES'
+MAX_SIGNATURE_STATUSES: Final[int] = 256
+
+
+# Function 'reached'
+def reached(status: str | None, commitment: str) -> bool:
+    """ True if a confirmation status is at least the requested commitment """
+    if status is None:
+        return False
+    return COMMITMENTS.index(status) >= COMMITMENTS.index(commitment)
+
+
+# Class 'SignatureStatusPoller'
+class SignatureStatusPoller:
+    """ Single background loop checking every pending signature with batched getSignatureStatuses """
+
+    # Class initialization
+    def __init__(self, client: Any, hub: Any = None, mininterval: float = 0.4, maxinterval: float = 2.0, fallbackinterval: float = 1.0, backoff: float = 1.5):
+        """ Initializer description """
+        self.client = client
+        self.hub = hub
+        self.mininterval = mininterval
+        self.maxinterval = maxinterval
+        self.fallbackinterval = fallbackinterval
+        self.backoff = backoff
+        self.interval = mininterval
+        self.rounds = 0
+        self.calls = 0
+        self.resolved = 0
+        self.slots: OrderedDict[str, int] = OrderedDict()
+        self._pending: dict[str, list[tuple[str, asyncio.Future]]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    # Function 'watch'
+    def watch(self, signature: str, commitment: str = "confirmed") -> asyncio.Future:
+        """ Return a future resolved with True once `signature` reaches `commitment`, False if it failed """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(signature, []).append((commitment, future))
+        self.boost()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    # Function 'forget'
+    def forget(self, signature: str, future: asyncio.Future) -> None:
+        """ Stop polling for one waiter """
+        waiters = [waiter for waiter in self._pending.get(signature, []) if waiter[1] is not future]
+        if waiters:
+            self._pending[signature] = waiters
+        else:
+            self._pending.pop(signature, None)
+
+    # Function 'boost'
+    def boost(self) -> None:
+        """ Poll right away and restart the interval from its minimum """
+        self.interval = self.mininterval
+        self._wakeup.set()
+
+    # Function 'ceiling'
+    def ceiling(self) -> float:
+        """ Longest interval allowed, longer while websocket notifications cover the signatures """
+        if self.hub is not None and self.hub.connected.is_set():
+            return self.maxinterval
+        return self.fallbackinterval
+
+    # Function '_run'
+    async def _run(self) -> None:
+        """ Poll until no signature is pending """
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                resolved = await self.poll()
+            except Exception as e:
+                logger.debug(f"Signature status poll failed: {e!s}")
+                resolved = 0
+            self.interval = self.mininterval if resolved else min(self.interval * self.backoff, self.ceiling())
+
+    # Function 'poll'
+    async def poll(self) -> int:
+        """ Query every pending signature once and return the number of resolved waiters """
+        signatures = list(self._pending)
+        if not signatures:
+            return 0
+
+        chunks = [signatures[start:start + MAX_SIGNATURE_STATUSES] for start in range(0, len(signatures), MAX_SIGNATURE_STATUSES)]
+        self.rounds += 1
+        self.calls += len(chunks)
+        responses = await asyncio.gather(*(self.client.CallRPC("getSignatureStatuses", [chunk], priority = "confirm") for chunk in chunks))
+
+        resolved = 0
+        for chunk, response in zip(chunks, responses):
+            for signature, status in zip(chunk, response["value"]):
+                if status is not None:
+                    resolved += self._resolve(signature, status)
+        self.resolved += resolved
+        return resolved
+
+    # Function '_resolve'
+    def _resolve(self, signature: str, status: dict[str, Any]) -> int:
+        """ Settle the waiters of one signature whose commitment has been reached """
+        failed = status.get("err") is not None
+        if status.get("slot"):
+            self.slots[signature] = status["slot"]
+            while len(self.slots) > 1024:
+                self.slots.popitem(last = False)
+        waiting = []
+        resolved = 0
+        for commitment, future in self._pending.get(signature, []):
+            if future.done():
+                continue
+            if failed or reached(status.get("confirmationStatus") or "processed", commitment):
+                future.set_result(not failed)
+                resolved += 1
+            else:
+                waiting.append((commitment, future))
+
+        if waiting:
+            self._pending[signature] = waiting
+        else:
+            self._pending.pop(signature, None)
+        return resolved
+
+    # Function 'slot'
+    def slot(self, signature: str) -> int | None:
+        """ Slot a recently resolved signature was processed in """
+        return self.slots.get(signature)
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return polling counters """
+        return {"pending": len(self._pending), "rounds": self.rounds, "calls": self.calls, "resolved": self.resolved, "interval": round(self.interval, 3)}
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop polling and cancel every waiter """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for waiters in self._pending.values():
+            for _, future in waiters:
+                future.cancel()
+        self._pending.clear()
+
+
+# Class 'SignatureConfirmer'
+class SignatureConfirmer:
+    """ Resolve confirmations from signatureSubscribe, backed by the shared status poller """
+
+    # Class initialization
+    def __init__(self, client: Any, hub: Any = None, poller: SignatureStatusPoller | None = None):
+        """ Initializer description """
+        self.client = client
+        self.hub = hub
+        self.poller = poller or SignatureStatusPoller(client, hub)
+        self.pushed = 0
+        self.timeouts = 0
+        if hub is not None:
+            hub.on_state(self._on_state)
+
+    # Function '_on_state'
+    def _on_state(self, connected: bool) -> None:
+        """ Poll immediately when notifications can no longer be relied on """
+        if not connected:
+            self.poller.boost()
+
+    # Function 'wait'
+    async def wait(self, signature: str, commitment: str = "confirmed", timeout: float = 60.0) -> bool:
+        """ Wait until a transaction reaches `commitment`, False if it failed or timed out """
+        future = self.poller.watch(signature, commitment)
+
+        def notified(result: dict[str, Any]) -> None:
+            if not future.done():
+                self.pushed += 1
+                future.set_result(result["value"].get("err") is None)
+
+        subscription = None
+        if self.hub is not None:
+            try:
+                subscription = await self.hub.subscribe("signatureSubscribe", [signature, {"commitment": commitment}], notified, oneshot = True)
+            except Exception as e:
+                logger.warning(f"signatureSubscribe failed for {signature}, polling instead: {e!s}")
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            self.timeouts += 1
+            logger.warning(f"Timed out waiting for {signature} to reach '{commitment}'")
+            return False
+        finally:
+            self.poller.forget(signature, future)
+            if subscription is not None:
+                await self.hub.unsubscribe(subscription)
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return how confirmations were resolved """
+        return {"pushed": self.pushed, "timeouts": self.timeouts, **self.poller.stats()}
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop the status poller """
+        await self.poller.close()
@@ -1,15 +1,23 @@
 """
 Bonding curve operations for pump.fun tokens.
 """
+import asyncio
+import base64
 import logging
 import struct
-from typing import Final
+from dataclasses import dataclass, field
+from typing import Any, Final
 
-from construct import Flag, Int64ul, Struct
 from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
 from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
+from core.quote import quote_buy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 logger = logging.getLogger(__name__)
@@ -17,20 +25,39 @@ logger = logging.getLogger(__name__)
 # Discriminator for the bonding curve account
 EXPECTED_DISCRIMINATOR: Final[bytes] = struct.pack("<Q", 6966180631402821399)
 
+# Fixed layout of the bonding curve account: discriminator, five u64 fields and a bool
+CURVE_LAYOUT: Final[struct.Struct] = struct.Struct("<8s5Q?")
+
+# Bytes of the bonding curve account read by BondingCurveState (discriminator + fields)
+CURVE_STATE_SIZE: Final[int] = CURVE_LAYOUT.size
+
+# Field names of BondingCurveState, in layout order
+CURVE_FIELDS: Final[tuple[str, ...]] = (
+    "virtual_token_reserves",
+    "virtual_sol_reserves",
+    "real_token_reserves",
+    "real_sol_reserves",
+    "token_total_supply",
+    "complete",
+)
+
+# NumPy record of the same layout, for decoding many accounts at once
+CURVE_DTYPE = (
+    np.dtype([("discriminator", "<u8")] + [(name, "<u8") for name in CURVE_FIELDS[:-1]] + [("complete", "?")])
+    if np is not None
+    else None
+)
+
+# Discriminator as the unsigned integer stored in the first CURVE_DTYPE field
+CURVE_DTYPE_DISCRIMINATOR: Final[int] = struct.unpack("<Q", EXPECTED_DISCRIMINATOR)[0]
+
 
 class BondingCurveState:
     """Represents the state of a pump.fun bonding curve."""
 
-    _STRUCT = Struct(
-        "virtual_token_reserves" / Int64ul,
-        "virtual_sol_reserves" / Int64ul,
-        "real_token_reserves" / Int64ul,
-        "real_sol_reserves" / Int64ul,
-        "token_total_supply" / Int64ul,
-        "complete" / Flag,
-    )
+    __slots__ = CURVE_FIELDS
 
-    def __init__(self, data: bytes) -> None:
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
         """Parse bonding curve data.
 
         Args:
@@ -39,11 +66,44 @@ class BondingCurveState:
         Raises:
             ValueError: If data cannot be parsed
         """
-        if data[:8] != EXPECTED_DISCRIMINATOR:
+        self.update(data)
+
+    def update(self, data: bytes | bytearray | memoryview) -> None:
+        """Re-parse the state in place from fresh account data, without copying it.
+
+        Args:
+            data: Raw account data
+
+        Raises:
+            ValueError: If data cannot be parsed
+        """
+        try:
+            (
+                discriminator,
+                virtual_token_reserves,
+                virtual_sol_reserves,
+                real_token_reserves,
+                real_sol_reserves,
+                token_total_supply,
+                complete,
+            ) = CURVE_LAYOUT.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"Truncated curve state: {str(e)}")
+
+        if discriminator != EXPECTED_DISCRIMINATOR:
             raise ValueError("Invalid curve state discriminator")
 
-        parsed = self._STRUCT.parse(data[8:])
-        self.__dict__.update(parsed)
+        self.virtual_token_reserves = virtual_token_reserves
+        self.virtual_sol_reserves = virtual_sol_reserves
+        self.real_token_reserves = real_token_reserves
+        self.real_sol_reserves = real_sol_reserves
+        self.token_total_supply = token_total_supply
+        self.complete = complete
+
+    def assign(self, other: "BondingCurveState") -> None:
+        """Copy the fields of another state into this one."""
+        for name in CURVE_FIELDS:
+            setattr(self, name, getattr(other, name))
 
     def calculate_price(self) -> float:
         """Calculate token price in SOL.
@@ -92,20 +152,81 @@ class BondingCurveHandler:
         Returns:
             Bonding curve state
 
+        Raises:
+            ValueError: If curve data is invalid
+        """
+        state, _ = await self.get_curve_state_slot(curve_address)
+        return state
+
+    async def get_curve_state_slot(self, curve_address: Pubkey) -> tuple[BondingCurveState, int]:
+        """Get the state of a bonding curve together with the slot it was read at.
+
+        Args:
+            curve_address: Address of the bonding curve account
+
+        Returns:
+            Bonding curve state and its slot
+
         Raises:
             ValueError: If curve data is invalid
         """
         try:
-            account = await self.client.get_account_info(curve_address)
+            account, slot = await self.client.get_account_info_slot(curve_address)
             if not account.data:
                 raise ValueError(f"No data in bonding curve account {curve_address}")
 
-            return BondingCurveState(account.data)
+            return BondingCurveState(account.data), slot
 
         except Exception as e:
             logger.error(f"Failed to get curve state: {str(e)}")
             raise ValueError(f"Invalid curve state: {str(e)}")
 
+    async def get_curve_states(
+        self, curve_addresses: list[Pubkey]
+    ) -> list[BondingCurveState | None]:
+        """Get the state of many bonding curves in a single round trip.
+
+        Only the leading bytes parsed by BondingCurveState are downloaded.
+
+        Args:
+            curve_addresses: Addresses of the bonding curve accounts
+
+        Returns:
+            Bonding curve states in input order, None for missing or invalid accounts
+        """
+        accounts = await self.client.get_multiple_accounts(
+            curve_addresses, data_slice=(0, CURVE_STATE_SIZE)
+        )
+
+        states: list[BondingCurveState | None] = []
+        for curve_address, account in zip(curve_addresses, accounts):
+            if account is None or not account.data:
+                logger.warning(f"No data in bonding curve account {curve_address}")
+                states.append(None)
+                continue
+
+            try:
+                states.append(BondingCurveState(account.data))
+            except Exception as e:
+                logger.warning(f"Invalid curve state for {curve_address}: {str(e)}")
+                states.append(None)
+
+        return states
+
+    async def get_curve_array(self, curve_addresses: list[Pubkey]) -> "np.ndarray":
+        """Get many bonding curves in a single round trip as a NumPy record array.
+
+        Args:
+            curve_addresses: Addresses of the bonding curve accounts
+
+        Returns:
+            Records of CURVE_DTYPE in input order, see decode_curve_array
+        """
+        accounts = await self.client.get_multiple_accounts(
+            curve_addresses, data_slice=(0, CURVE_STATE_SIZE)
+        )
+        return decode_curve_array([account.data if account is not None else b"" for account in accounts])
+
     async def calculate_price(self, curve_address: Pubkey) -> float:
         """Calculate the current price of a token.
 
@@ -128,8 +249,240 @@ class BondingCurveHandler:
             sol_amount: Amount of SOL to spend
 
         Returns:
-            Expected token amount
+            Expected token amount, after curve impact and the trading fee
         """
         curve_state = await self.get_curve_state(curve_address)
-        price = curve_state.calculate_price()
-        return sol_amount / price
+        return quote_buy(curve_state, int(sol_amount * LAMPORTS_PER_SOL)).amount
+
+
+def decode_curve_array(datas: list[bytes]) -> "np.ndarray":
+    """Decode many bonding curve accounts at once into a NumPy record array.
+
+    Args:
+        datas: Raw account data, at least CURVE_STATE_SIZE bytes each to be valid
+
+    Returns:
+        Records of CURVE_DTYPE, with a zeroed record for every missing or invalid account
+
+    Raises:
+        RuntimeError: If NumPy is not installed
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required for vectorized curve decoding")
+
+    blank = bytes(CURVE_STATE_SIZE)
+    buffer = b"".join(data[:CURVE_STATE_SIZE] if len(data) >= CURVE_STATE_SIZE else blank for data in datas)
+    records = np.frombuffer(buffer, dtype=CURVE_DTYPE).copy()
+    records[records["discriminator"] != CURVE_DTYPE_DISCRIMINATOR] = 0
+    return records
+
+
+def curve_prices(records: "np.ndarray") -> "np.ndarray":
+    """Token prices in SOL of decoded curve records, NaN where the reserves are empty.
+
+    Args:
+        records: Records returned by decode_curve_array
+
+    Returns:
+        Prices as float64
+    """
+    tokens = records["virtual_token_reserves"].astype(np.float64) / 10**TOKEN_DECIMALS
+    sols = records["virtual_sol_reserves"].astype(np.float64) / LAMPORTS_PER_SOL
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where((tokens > 0) & (sols > 0), sols / tokens, np.nan)
+
+
+@dataclass
+class TrackedCurve:
+    """Cached state of one subscribed bonding curve."""
+
+    state: BondingCurveState | None = None
+    slot: int = 0
+    version: int = 0
+    holders: int = 0
+    subscription: Any = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class CurveStateCache:
+    """Bonding curve states kept current by accountSubscribe notifications.
+
+    Every tracked curve has one subscription on the client's shared websocket. Updates
+    are decoded into the cached BondingCurveState in place and wake up every waiter,
+    and curves are refreshed over RPC while the websocket is down.
+    """
+
+    def __init__(self, client: SolanaClient, handler: BondingCurveHandler | None = None):
+        """Initialize with Solana client.
+
+        Args:
+            client: Solana client owning the shared websocket
+            handler: Curve handler used for RPC reads
+        """
+        self.client = client
+        self.hub = client.wshub
+        self.handler = handler or BondingCurveHandler(client)
+        self.curves: dict[Pubkey, TrackedCurve] = {}
+        self.updates = 0
+        self.refreshes = 0
+        if self.hub is not None:
+            self.hub.on_state(self._on_state)
+
+    async def track(self, curve_address: Pubkey) -> BondingCurveState:
+        """Start following a curve, or add a holder to a curve already followed.
+
+        Args:
+            curve_address: Address of the bonding curve account
+
+        Returns:
+            Current bonding curve state
+        """
+        tracked = self.curves.get(curve_address)
+        if tracked is None:
+            tracked = self.curves[curve_address] = TrackedCurve()
+            if self.hub is not None:
+                try:
+                    tracked.subscription = await self.hub.subscribe(
+                        "accountSubscribe",
+                        [str(curve_address), {"encoding": "base64", "commitment": "processed"}],
+                        lambda result: self._on_update(curve_address, result),
+                    )
+                except Exception as e:
+                    logger.warning(f"accountSubscribe failed for {curve_address}, polling instead: {str(e)}")
+
+        tracked.holders += 1
+        if tracked.state is None:
+            await self.refresh(curve_address)
+        return tracked.state
+
+    async def release(self, curve_address: Pubkey) -> None:
+        """Drop a holder and unsubscribe once nobody follows the curve.
+
+        Args:
+            curve_address: Address of the bonding curve account
+        """
+        tracked = self.curves.get(curve_address)
+        if tracked is None:
+            return
+
+        tracked.holders -= 1
+        if tracked.holders > 0:
+            return
+
+        del self.curves[curve_address]
+        tracked.changed.set()
+        if tracked.subscription is not None:
+            try:
+                await self.hub.unsubscribe(tracked.subscription)
+            except Exception as e:
+                logger.debug(f"accountUnsubscribe failed for {curve_address}: {str(e)}")
+
+    def get(self, curve_address: Pubkey) -> BondingCurveState | None:
+        """Return the cached state of a tracked curve without a round trip."""
+        tracked = self.curves.get(curve_address)
+        return tracked.state if tracked is not None else None
+
+    async def refresh(self, curve_address: Pubkey) -> BondingCurveState:
+        """Read a tracked curve over RPC and publish it like a notification.
+
+        Args:
+            curve_address: Address of the bonding curve account
+
+        Returns:
+            Bonding curve state, the cached one if a notification already carried a newer slot
+        """
+        self.refreshes += 1
+        state, slot = await self.handler.get_curve_state_slot(curve_address)
+        tracked = self.curves.get(curve_address)
+        if tracked is None:
+            return state
+        if slot < tracked.slot:
+            return tracked.state
+
+        if tracked.state is None:
+            tracked.state = state
+        else:
+            tracked.state.assign(state)
+        tracked.slot = slot
+        self._changed(tracked)
+        return tracked.state
+
+    async def wait(
+        self, curve_address: Pubkey, version: int, timeout: float
+    ) -> tuple[BondingCurveState, int]:
+        """Wait until the curve changes past `version`, or for `timeout` seconds.
+
+        Without a live subscription the curve is read over RPC once the timeout expires.
+
+        Args:
+            curve_address: Address of a tracked bonding curve account
+            version: Last version seen by the caller
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Current state and its version
+        """
+        tracked = self.curves[curve_address]
+        if tracked.version <= version:
+            try:
+                await asyncio.wait_for(tracked.changed.wait(), timeout)
+            except TimeoutError:
+                if not self._live(tracked):
+                    await self.refresh(curve_address)
+        return tracked.state, tracked.version
+
+    def _live(self, tracked: TrackedCurve) -> bool:
+        """True while notifications for the curve can be relied on."""
+        return (
+            tracked.subscription is not None
+            and tracked.subscription.serverid is not None
+            and self.hub.connected.is_set()
+        )
+
+    def _changed(self, tracked: TrackedCurve) -> None:
+        """Bump the version of a curve and wake up its waiters."""
+        tracked.version += 1
+        tracked.changed.set()
+        tracked.changed = asyncio.Event()
+
+    def _on_update(self, curve_address: Pubkey, result: dict[str, Any]) -> None:
+        """Decode an accountNotification into the cached state."""
+        tracked = self.curves.get(curve_address)
+        value = (result or {}).get("value")
+        if tracked is None or not value:
+            return
+
+        slot = result.get("context", {}).get("slot", 0)
+        if slot < tracked.slot:
+            return
+
+        try:
+            data = base64.b64decode(value["data"][0])
+            if tracked.state is None:
+                tracked.state = BondingCurveState(data)
+            else:
+                tracked.state.update(data)
+        except Exception as e:
+            logger.warning(f"Invalid curve update for {curve_address}: {str(e)}")
+            return
+
+        tracked.slot = slot
+        self.updates += 1
+        self._changed(tracked)
+
+    def _on_state(self, connected: bool) -> None:
+        """Catch up on updates missed while the websocket was down."""
+        if connected:
+            for curve_address in list(self.curves):
+                asyncio.ensure_future(self._catch_up(curve_address))
+
+    async def _catch_up(self, curve_address: Pubkey) -> None:
+        """Refresh one curve after a reconnect, logging failures."""
+        try:
+            await self.refresh(curve_address)
+        except Exception as e:
+            logger.debug(f"Curve refresh after reconnect failed for {curve_address}: {str(e)}")
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of tracked curves, notifications and RPC refreshes."""
+        return {"curves": len(self.curves), "updates": self.updates, "refreshes": self.refreshes}
@@ -0,0 +1,156 @@
+# Import libraries
+import time
+
+# Import packages
+from collections import deque
+from typing import Any
+from typing import Final
+
+# Define 'STATES'
+STATES: Final[tuple[str, ...]] = ("closed", "open", "half-open")
+
+
+# Class 'CircuitOpenError'
+class CircuitOpenError(RuntimeError):
+    """ Request refused without being sent because the endpoint's breaker is open """
+
+
+# Class 'AdaptiveTimeout'
+class AdaptiveTimeout:
+    """ Per-method request deadlines derived from the observed latency distribution """
+
+    # Class initialization
+    def __init__(self, multiplier: float = 3.0, floor: float = 0.5, ceiling: float = 10.0, window: int = 200, minsamples: int = 20):
+        """ Initializer description """
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = ceiling
+        self.window = window
+        self.minsamples = minsamples
+        self.expired: dict[str, int] = {}
+        self._samples: dict[str, deque[float]] = {}
+        self._p99: dict[str, float] = {}
+
+    # Function 'observe'
+    def observe(self, method: str, latency: float) -> None:
+        """ Add one successful latency sample for `method` """
+        samples = self._samples.setdefault(method, deque(maxlen = self.window))
+        samples.append(latency)
+        if len(samples) % 10 == 0:
+            self._p99.pop(method, None)
+
+    # Function 'expire'
+    def expire(self, method: str, timeout: float) -> None:
+        """ Count a timed out call, feeding its deadline back so a slower node widens the window """
+        self.expired[method] = self.expired.get(method, 0) + 1
+        self.observe(method, timeout)
+
+    # Function 'p99'
+    def p99(self, method: str) -> float | None:
+        """ 99th percentile latency of `method`, None until enough samples """
+        samples = self._samples.get(method)
+        if samples is None or len(samples) < self.minsamples:
+            return None
+        if method not in self._p99:
+            ordered = sorted(samples)
+            self._p99[method] = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return self._p99[method]
+
+    # Function 'timeout'
+    def timeout(self, methods: str | list[str]) -> float:
+        """ Deadline for a call, or for a batch the longest deadline of its methods """
+        if isinstance(methods, str):
+            methods = [methods]
+
+        deadline = self.floor
+        for method in methods:
+            p99 = self.p99(method)
+            if p99 is None:
+                return self.ceiling
+            deadline = max(deadline, p99 * self.multiplier)
+        return min(deadline, self.ceiling)
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return the current deadline and expiry count of every observed method """
+        return {method: {"timeout": round(self.timeout(method), 3), "expired": self.expired.get(method, 0)} for method in sorted(self._samples)}
+
+
+# Class 'CircuitBreaker'
+class CircuitBreaker:
+    """ Open after consecutive failures, fail fast while open and let one trial through after a cooldown """
+
+    # Class initialization
+    def __init__(self, threshold: int = 3, cooldown: float = 15.0, maxbackoff: int = 8):
+        """ Initializer description """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.maxbackoff = maxbackoff
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self.openedat = 0.0
+        self.retryat = 0.0
+        self._opened = False
+        self._trial = False
+
+    # Function 'state'
+    @property
+    def state(self) -> str:
+        """ closed, open, or half-open once the cooldown has elapsed """
+        if not self._opened:
+            return "closed"
+        return "half-open" if time.monotonic() >= self.retryat else "open"
+
+    # Function 'available'
+    def available(self) -> bool:
+        """ True if a request may be sent now """
+        state = self.state
+        return state == "closed" or (state == "half-open" and not self._trial)
+
+    # Function 'attempt'
+    def attempt(self) -> None:
+        """ Claim the right to send, raising CircuitOpenError while the breaker is open """
+        if not self.available():
+            self.rejected += 1
+            raise CircuitOpenError(f"Circuit breaker is {self.state}, retrying in {max(0.0, self.retryat - time.monotonic()):.1f}s")
+        if self._opened:
+            self._trial = True
+
+    # Function 'success'
+    def success(self) -> bool:
+        """ Record a success, returning True if it closed an open breaker """
+        closed = self._opened
+        self.failures = 0
+        self._opened = False
+        self._trial = False
+        return closed
+
+    # Function 'failure'
+    def failure(self) -> bool:
+        """ Record a failure, returning True if it opened the breaker """
+        self.failures += 1
+        if self._opened:
+            # The half-open trial failed, back off further
+            self._trial = False
+            self.retryat = time.monotonic() + self.cooldown * min(2 ** self.trips, self.maxbackoff)
+            self.trips += 1
+            return False
+        if self.failures < self.threshold:
+            return False
+
+        self._opened = True
+        self.trips += 1
+        self.openedat = time.monotonic()
+        self.retryat = self.openedat + self.cooldown * min(2 ** (self.trips - 1), self.maxbackoff)
+        return True
+
+    # Function 'release'
+    def release(self) -> None:
+        """ Give back a trial slot when the request was cancelled before an outcome """
+        self._trial = False
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return the breaker state and counters """
+        return {"state": self.state, "failures": self.failures, "trips": self.trips, "rejected": self.rejected}
@@ -0,0 +1,246 @@
+# Import libraries
+import asyncio
+import logging
+import os
+import random
+import time
+
+# Import packages
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+from typing import Final
+from sqlalchemy import create_engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+# Import local packages
+from core.resend import SendJob
+from utils.models import PumpBase
+from utils.models import PumpTableLandings
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+# Define 'EXPIRED_DELAY'
+# Slots a blockhash stays valid, the delay charged to a transaction that never landed
+EXPIRED_DELAY: Final[int] = 151
+
+# Define 'SETTLED'
+SETTLED: Final[tuple[str, ...]] = ("landed", "failed", "expired")
+
+# Define 'TRADES'
+# Only trades compete for the pump accounts, cleanup lands fast without a fee and would teach the model to pay nothing
+TRADES: Final[tuple[str, ...]] = ("buy", "sell")
+
+
+# Class 'LandingRecord'
+@dataclass(slots = True)
+class LandingRecord:
+    """ Fee paid by one transaction and how many slots it took to land """
+
+    # Define 'created'
+    # Unix time of the first submission
+    created: float
+
+    # Define 'label'
+    label: str
+
+    # Define 'fee'
+    # Micro-lamports per compute unit
+    fee: int
+
+    # Define 'sendslot'
+    sendslot: int
+
+    # Define 'landedslot'
+    # None when the transaction expired without landing
+    landedslot: int | None
+
+    # Define 'status'
+    status: str
+
+    # Function 'delay'
+    @property
+    def delay(self) -> int:
+        """ Slots from the first submission to landing, the blockhash lifetime if it never landed """
+        if self.landedslot is None:
+            return EXPIRED_DELAY
+        return max(0, self.landedslot - self.sendslot)
+
+    # Function 'level'
+    @property
+    def level(self) -> int:
+        """ Fee level, fees within a factor of two share one """
+        return self.fee.bit_length()
+
+
+# Class 'LandingFeeOptimizer'
+class LandingFeeOptimizer:
+    """ Cheapest priority fee expected to land within a target number of slots, learned from past sends """
+
+    # Class initialization
+    def __init__(self, client: Any, target: int, hard_cap: int, buckets: int = 6, confidence: float = 0.8, minsamples: int = 8, history: int = 5000, explore: float = 0.1, interval: float = 30.0, database: str | None = None):
+        """ Initializer description """
+        self.client = client
+        self.target = target
+        self.hard_cap = hard_cap
+        self.buckets = buckets
+        self.confidence = confidence
+        self.minsamples = minsamples
+        self.explore = explore
+        self.interval = interval
+        self.records: deque[LandingRecord] = deque(maxlen = history)
+        self.counts = {"recorded": 0, "optimized": 0, "explored": 0, "escalated": 0, "fallback": 0}
+        self.random = random.Random()
+        self._unsaved: list[LandingRecord] = []
+        self._curves: dict[int | None, list[tuple[int, int, int, int]]] = {}
+        self._task: asyncio.Task | None = None
+
+        # === Trades Database ===
+        if database is None:
+            datapathdir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+            dbtradesdir = os.path.join(datapathdir, "database")
+            os.makedirs(dbtradesdir, exist_ok=True)
+            database = os.path.join(dbtradesdir, "trades.db")
+        self.dbtradeengine = create_engine(f"sqlite:///{database}")
+        PumpBase.metadata.create_all(self.dbtradeengine)
+        self.TradesSession = sessionmaker(bind=self.dbtradeengine)
+
+        client.resender.on_settled(self.record)
+
+    # Function 'bucket'
+    def bucket(self, created: float) -> int:
+        """ Time-of-day bucket of a Unix time, in UTC """
+        return time.gmtime(created).tm_hour * self.buckets // 24
+
+    # Function 'load'
+    def load(self) -> int:
+        """ Read the most recent records of previous sessions """
+        sessiondb = self.TradesSession()
+        try:
+            rows = sessiondb.query(PumpTableLandings).filter(PumpTableLandings.label.in_(TRADES), PumpTableLandings.fee > 0).order_by(PumpTableLandings.id.desc()).limit(self.records.maxlen).all()
+        except SQLAlchemyError as e:
+            logger.warning(f"Failed to load landing records: {e!s}")
+            return 0
+        finally:
+            sessiondb.close()
+
+        for row in reversed(rows):
+            self.records.append(LandingRecord(row.created, row.label, row.fee, row.sendslot, row.landedslot, row.status))
+        self._curves.clear()
+        return len(rows)
+
+    # Function 'record'
+    def record(self, job: SendJob) -> None:
+        """ Keep the fee and landing delay of a settled trade sent with a priority fee """
+        if job.status not in SETTLED or job.sendslot is None or job.label not in TRADES or not job.fee:
+            return
+        landedslot = job.landedslot if job.landed is not None else None
+        record = LandingRecord(job.created, job.label, job.fee, job.sendslot, landedslot, job.status)
+        self.records.append(record)
+        self._unsaved.append(record)
+        self.counts["recorded"] += 1
+        self._curves.clear()
+
+    # Function 'flush'
+    def flush(self) -> int:
+        """ Write the records not saved yet """
+        records, self._unsaved = self._unsaved, []
+        if not records:
+            return 0
+        sessiondb = self.TradesSession()
+        try:
+            sessiondb.add_all(PumpTableLandings(created=int(record.created), label=record.label, fee=record.fee, sendslot=record.sendslot, landedslot=record.landedslot, status=record.status) for record in records)
+            sessiondb.commit()
+        except SQLAlchemyError as e:
+            sessiondb.rollback()
+            logger.warning(f"Failed to save {len(records)} landing record(s): {e!s}")
+            return 0
+        finally:
+            sessiondb.close()
+        return len(records)
+
+    # Function 'curve'
+    def curve(self, bucket: int | None = None) -> list[tuple[int, int, int, int]]:
+        """ Level, landing delay at the confidence quantile, samples and dearest fee paid, per fee level """
+        if bucket in self._curves:
+            return self._curves[bucket]
+
+        delays: dict[int, list[int]] = {}
+        fees: dict[int, int] = {}
+        for record in self.records:
+            if bucket is None or self.bucket(record.created) == bucket:
+                delays.setdefault(record.level, []).append(record.delay)
+                fees[record.level] = max(fees.get(record.level, 0), record.fee)
+
+        curve = []
+        slowest = 0
+        # Walk from the highest fee down so a cheaper level never looks faster than a dearer one
+        for level in sorted(delays, reverse = True):
+            samples = sorted(delays[level])
+            if len(samples) < self.minsamples:
+                continue
+            slowest = max(slowest, samples[int(self.confidence * (len(samples) - 1))])
+            curve.append((level, slowest, len(samples), fees[level]))
+        curve.reverse()
+
+        self._curves[bucket] = curve
+        return curve
+
+    # Function 'fee'
+    def fee(self, now: float | None = None) -> int | None:
+        """ Cheapest non-zero fee expected to land within the target, None until enough trades were recorded """
+        curve = self.curve(self.bucket(time.time() if now is None else now)) or self.curve()
+        if not curve:
+            self.counts["fallback"] += 1
+            return None
+
+        fee = next((fee for _, delay, _, fee in curve if delay <= self.target), None)
+        if fee is None:
+            # Nothing recorded lands fast enough, try twice the dearest fee paid
+            fee = max(1, curve[-1][3] * 2)
+            self.counts["escalated"] += 1
+        elif fee > 1 and self.random.random() < self.explore:
+            # Occasionally try half as much, otherwise the model never learns that a cheaper level suffices
+            fee //= 2
+            self.counts["explored"] += 1
+        else:
+            self.counts["optimized"] += 1
+        # A hard cap of zero leaves the fee to the dynamic and fixed settings
+        return min(max(fee, 1), self.hard_cap) or None
+
+    # Function 'start'
+    def start(self) -> None:
+        """ Load previous records and save new ones periodically """
+        if self._task is None:
+            loaded = self.load()
+            logger.info(f"Loaded {loaded} landing record(s), targeting {self.target} slot(s)")
+            self._task = asyncio.create_task(self._loop())
+
+    # Function '_loop'
+    async def _loop(self) -> None:
+        """ Save every interval until closed """
+        while True:
+            await asyncio.sleep(self.interval)
+            await asyncio.to_thread(self.flush)
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop the periodic save and write what is left """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions = True)
+            self._task = None
+        await asyncio.to_thread(self.flush)
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return the record count, the decision counters and the curve of the current bucket """
+        return {
+            "records": len(self.records),
+            "unsaved": len(self._unsaved),
+            "target": self.target,
+            **self.counts,
+            "curve": [{"fee": fee, "delay": delay, "samples": samples} for _, delay, samples, fee in self.curve(self.bucket(time.time())) or self.curve()]
+        }
@@ -0,0 +1,186 @@
+# Import libraries
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+
+# Import packages
+from contextlib import contextmanager
+from collections.abc import Iterator
+from typing import Any
+from typing import Final
+
+# Define 'PRIORITIES'
+# Lower value is served first
+PRIORITIES: Final[dict[str, int]] = {"send": 0, "confirm": 1, "curve": 2, "screening": 3, "cleanup": 4}
+
+# Define 'RESERVES'
+# Share of the bucket a class must leave untouched for the classes above it
+RESERVES: Final[dict[str, float]] = {"send": 0.0, "confirm": 0.0, "curve": 0.1, "screening": 0.3, "cleanup": 0.5}
+
+# Define 'MAX_WAITS'
+# Longest queueing delay a class accepts before it is shed, None never sheds
+MAX_WAITS: Final[dict[str, float | None]] = {"send": None, "confirm": None, "curve": 2.0, "screening": 1.0, "cleanup": None}
+
+# Define 'METHOD_PRIORITIES'
+METHOD_PRIORITIES: Final[dict[str, str]] = {
+    "sendTransaction": "send",
+    "simulateTransaction": "send",
+    "getSignatureStatuses": "confirm",
+    "getHealth": "cleanup",
+}
+
+# Define 'current_priority'
+current_priority: contextvars.ContextVar[str | None] = contextvars.ContextVar("current_priority", default = None)
+
+
+# Function 'priority_for'
+def priority_for(method: str | None = None) -> str:
+    """ Priority class of a call: the caller's class if set, otherwise derived from the method """
+    return current_priority.get() or METHOD_PRIORITIES.get(method or "", "curve")
+
+
+# Function 'priority'
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """ Tag every RPC call made inside the block with a priority class """
+    if name not in PRIORITIES:
+        raise ValueError(f"Unknown priority class '{name}', expected one of {tuple(PRIORITIES)}")
+    token = current_priority.set(name)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+# Class 'RateLimitError'
+class RateLimitError(RuntimeError):
+    """ Call shed because the request budget would not allow it within its class deadline """
+
+
+# Class 'RateLimiter'
+class RateLimiter:
+    """ Token bucket that serves queued calls by priority class and sheds low-value work first """
+
+    # Class initialization
+    def __init__(self, rate: float, burst: float | None = None, maxwaits: dict[str, float | None] | None = None):
+        """ Initializer description """
+        self.rate = rate
+        self.burst = burst or max(rate, 1.0)
+        self.maxwaits = {**MAX_WAITS, **(maxwaits or {})}
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.stats_ = {name: {"granted": 0, "shed": 0, "waited": 0, "wait": 0.0, "maxwait": 0.0, "maxdepth": 0} for name in PRIORITIES}
+        self._seq = itertools.count()
+        self._waiters: list[tuple[int, int, str, float, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    # Function '_refill'
+    def _refill(self) -> None:
+        """ Add the tokens accrued since the last update """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    # Function '_floor'
+    def _floor(self, name: str) -> float:
+        """ Tokens that must remain after a call of class `name` """
+        # A reserve larger than the bucket minus one token would starve the class for good
+        return min(self.burst * RESERVES[name], max(0.0, self.burst - 1))
+
+    # Function 'depth'
+    def depth(self, name: str | None = None) -> int:
+        """ Number of queued calls, for one class or all of them """
+        return sum(1 for waiter in self._waiters if name is None or waiter[2] == name)
+
+    # Function 'acquire'
+    async def acquire(self, name: str = "curve") -> None:
+        """ Wait for a token, raising RateLimitError if the class deadline cannot be met """
+        level = PRIORITIES[name]
+        stats = self.stats_[name]
+        self._refill()
+        ahead = sum(1 for waiter in self._waiters if waiter[0] <= level)
+        if not ahead and self.tokens - 1 >= self._floor(name):
+            self.tokens -= 1
+            stats["granted"] += 1
+            return
+
+        maxwait = self.maxwaits.get(name)
+        if maxwait is not None and (ahead + 1 + self._floor(name) - self.tokens) / self.rate > maxwait:
+            stats["shed"] += 1
+            raise RateLimitError(f"RPC budget exhausted, shedding '{name}' call")
+
+        future = asyncio.get_running_loop().create_future()
+        started = time.monotonic()
+        heapq.heappush(self._waiters, (level, next(self._seq), name, started, future))
+        stats["maxdepth"] = max(stats["maxdepth"], self.depth(name))
+        if self._timer is not None and self._waiters[0][4] is future:
+            # The timer was armed for a lower class that needs more tokens
+            self._timer.cancel()
+            self._timer = None
+        self._schedule()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                # The token was granted while the caller went away, give it back
+                self.tokens += 1
+            self._waiters = [waiter for waiter in self._waiters if waiter[4] is not future]
+            heapq.heapify(self._waiters)
+            raise
+
+        waited = time.monotonic() - started
+        stats["granted"] += 1
+        stats["waited"] += 1
+        stats["wait"] += waited
+        stats["maxwait"] = max(stats["maxwait"], waited)
+
+    # Function '_schedule'
+    def _schedule(self) -> None:
+        """ Arm a timer for when the head of the queue can be served """
+        if self._timer is not None or not self._waiters:
+            return
+        _, _, name, _, _ = self._waiters[0]
+        delay = max(0.0, (1 + self._floor(name) - self.tokens) / self.rate)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    # Function '_release'
+    def _release(self) -> None:
+        """ Serve queued calls in priority order while tokens allow """
+        self._timer = None
+        self._refill()
+        while self._waiters:
+            _, _, name, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.tokens - 1 < self._floor(name):
+                break
+            heapq.heappop(self._waiters)
+            self.tokens -= 1
+            future.set_result(None)
+        self._schedule()
+
+    # Function 'penalize'
+    def penalize(self) -> None:
+        """ Empty the bucket after the node answered 429 so every class backs off """
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return per-class grant, shed, queue depth and wait-time metrics """
+        result: dict[str, Any] = {"rate": self.rate, "tokens": round(self.tokens, 2)}
+        for name, stats in self.stats_.items():
+            if not stats["granted"] and not stats["shed"]:
+                continue
+            result[name] = {
+                "granted": stats["granted"],
+                "shed": stats["shed"],
+                "queued": self.depth(name),
+                "maxdepth": stats["maxdepth"],
+                "avgwait": round(stats["wait"] / stats["waited"], 4) if stats["waited"] else 0.0,
+                "maxwait": round(stats["maxwait"], 4)
+            }
+        return result
@@ -0,0 +1,184 @@
+# Import libraries
+import asyncio
+import base64
+import hashlib
+import logging
+import struct
+
+# Import packages
+from dataclasses import dataclass
+from typing import Any
+from typing import Final
+from solders.pubkey import Pubkey
+
+# Import local packages
+from core.curve import BondingCurveState
+from core.curve import CURVE_LAYOUT
+from core.curve import EXPECTED_DISCRIMINATOR
+from core.pubkeys import PumpAddresses
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+# Define 'GLOBAL_DISCRIMINATOR'
+GLOBAL_DISCRIMINATOR: Final[bytes] = hashlib.sha256(b"account:Global").digest()[:8]
+
+# Define 'GLOBAL_LAYOUT'
+# Leading fields of the Global account, newer program versions append more after them
+GLOBAL_LAYOUT: Final[struct.Struct] = struct.Struct("<8s?32s32s5Q")
+
+
+# Class 'GlobalState'
+@dataclass(frozen = True, slots = True)
+class GlobalState:
+    """ Parameters of the pump program read from its Global account """
+
+    # Define 'initialized'
+    initialized: bool
+
+    # Define 'authority'
+    authority: Pubkey
+
+    # Define 'fee_recipient'
+    fee_recipient: Pubkey
+
+    # Define 'initial_virtual_token_reserves'
+    initial_virtual_token_reserves: int
+
+    # Define 'initial_virtual_sol_reserves'
+    initial_virtual_sol_reserves: int
+
+    # Define 'initial_real_token_reserves'
+    initial_real_token_reserves: int
+
+    # Define 'token_total_supply'
+    token_total_supply: int
+
+    # Define 'fee_basis_points'
+    fee_basis_points: int
+
+    # Function 'from_bytes'
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GlobalState":
+        """ Decode the Global account, raising ValueError on foreign or truncated data """
+        if len(data) < GLOBAL_LAYOUT.size:
+            raise ValueError(f"Global account data too short: {len(data)} bytes")
+        discriminator, initialized, authority, recipient, vtoken, vsol, rtoken, supply, fee = GLOBAL_LAYOUT.unpack_from(data)
+        if discriminator != GLOBAL_DISCRIMINATOR:
+            raise ValueError("Invalid Global account discriminator")
+        return cls(initialized, Pubkey.from_bytes(authority), Pubkey.from_bytes(recipient), vtoken, vsol, rtoken, supply, fee)
+
+    # Function 'to_bytes'
+    def to_bytes(self) -> bytes:
+        """ Encode the fields back into the Global account layout """
+        return GLOBAL_LAYOUT.pack(GLOBAL_DISCRIMINATOR, self.initialized, bytes(self.authority), bytes(self.fee_recipient), self.initial_virtual_token_reserves, self.initial_virtual_sol_reserves, self.initial_real_token_reserves, self.token_total_supply, self.fee_basis_points)
+
+    # Function 'initial_curve'
+    def initial_curve(self) -> BondingCurveState:
+        """ Bonding curve of a token nobody has traded yet """
+        return BondingCurveState(CURVE_LAYOUT.pack(EXPECTED_DISCRIMINATOR, self.initial_virtual_token_reserves, self.initial_virtual_sol_reserves, self.initial_real_token_reserves, 0, self.token_total_supply, False))
+
+
+# Define 'DEFAULT_GLOBAL'
+# Mainnet values, used until the account is read
+DEFAULT_GLOBAL: Final[GlobalState] = GlobalState(True, Pubkey.default(), PumpAddresses.FEE, 1_073_000_000 * 10**6, 30 * 10**9, 793_100_000 * 10**6, 10**15, 100)
+
+
+# Class 'GlobalAccount'
+class GlobalAccount:
+    """ Pump Global account read once and kept current by accountSubscribe """
+
+    # Class initialization
+    def __init__(self, client: Any, address: Pubkey = PumpAddresses.GLOBAL):
+        """ Initializer description """
+        self.client = client
+        self.hub = client.wshub
+        self.address = address
+        self.state = DEFAULT_GLOBAL
+        self.loaded = False
+        self.slot = 0
+        self.updates = 0
+        self._subscription: Any = None
+        self._lock = asyncio.Lock()
+        if self.hub is not None:
+            self.hub.on_state(self._on_state)
+
+    # Function 'get'
+    def get(self) -> GlobalState:
+        """ Return the cached parameters, the mainnet defaults until the account is read """
+        return self.state
+
+    # Function 'load'
+    async def load(self) -> GlobalState:
+        """ Read the account once and subscribe to its changes """
+        async with self._lock:
+            if not self.loaded:
+                await self.refresh()
+                if self.hub is not None and self._subscription is None:
+                    try:
+                        self._subscription = await self.hub.subscribe("accountSubscribe", [str(self.address), {"encoding": "base64", "commitment": "confirmed"}], self._on_update)
+                    except Exception as e:
+                        logger.warning(f"accountSubscribe failed for the Global account: {e!s}")
+        return self.state
+
+    # Function 'refresh'
+    async def refresh(self) -> GlobalState:
+        """ Read the account over RPC """
+        response = await self.client.CallRPC("getAccountInfo", [str(self.address), {"encoding": "base64", "commitment": "confirmed"}])
+        if not response or not response.get("value"):
+            raise ValueError(f"Global account {self.address} not found")
+        self._store(response["value"], response.get("context", {}).get("slot", 0))
+        return self.state
+
+    # Function '_store'
+    def _store(self, value: dict[str, Any], slot: int) -> None:
+        """ Replace the cached parameters with a newer read of the account """
+        if slot < self.slot:
+            return
+        state = GlobalState.from_bytes(base64.b64decode(value["data"][0]))
+        if self.loaded and state != self.state:
+            logger.info(f"Global account changed at slot {slot}: fee {self.state.fee_basis_points} -> {state.fee_basis_points} bps, recipient {state.fee_recipient}")
+        self.state = state
+        self.slot = slot
+        self.loaded = True
+
+    # Function '_on_update'
+    def _on_update(self, result: dict[str, Any]) -> None:
+        """ Decode an accountNotification of the Global account """
+        value = (result or {}).get("value")
+        if not value:
+            return
+        try:
+            self._store(value, result.get("context", {}).get("slot", 0))
+            self.updates += 1
+        except Exception as e:
+            logger.warning(f"Invalid Global account update: {e!s}")
+
+    # Function '_on_state'
+    def _on_state(self, connected: bool) -> None:
+        """ Catch up on changes missed while the websocket was down """
+        if connected and self.loaded:
+            asyncio.ensure_future(self._catch_up())
+
+    # Function '_catch_up'
+    async def _catch_up(self) -> None:
+        """ Refresh after a reconnect, logging failures """
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.debug(f"Global account refresh after reconnect failed: {e!s}")
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Drop the subscription """
+        if self._subscription is not None:
+            try:
+                await self.hub.unsubscribe(self._subscription)
+            except Exception as e:
+                logger.debug(f"accountUnsubscribe failed for the Global account: {e!s}")
+            self._subscription = None
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return whether the account was read, its slot and the fee in use """
+        return {"loaded": self.loaded, "slot": self.slot, "updates": self.updates, "fee": self.state.fee_basis_points}
@@ -1,25 +1,34 @@
 # Import libraries
+import asyncio
 import logging
-import statistics
+import time
 
 # Import packages
 from abc import ABC
 from abc import abstractmethod
 from solders.pubkey import Pubkey
+from typing import Final
 
 # Import local packages
 from core.client import SolanaClient
+from core.landing import LandingFeeOptimizer
+from core.pubkeys import PumpAddresses
+from core.sketch import QuantileSketch
+from core.sketch import SlidingQuantileSketch
 
 # Define 'logger'
 logger = logging.getLogger(__name__)
 
+# Define 'FEE_QUANTILE'
+FEE_QUANTILE: Final[float] = 0.7
+
 
 # Class 'PriorityFeeHandler'
 class PriorityFeeHandler:
     """ Class description """
 
     # Class initialization
-    def __init__(self, client: SolanaClient, enable_dynamic_fee: bool, enable_fixed_fee: bool, fixed_fee: int, extra_fee: float, hard_cap: int):
+    def __init__(self, client: SolanaClient, enable_dynamic_fee: bool, enable_fixed_fee: bool, fixed_fee: int, extra_fee: float, hard_cap: int, sample_interval: float = 2.0, max_age: float = 10.0, block_fees: SlidingQuantileSketch | None = None, target_slots: int = 0):
         """ Initializer description """
         self.client = client
         self.enable_dynamic_fee = enable_dynamic_fee
@@ -27,12 +36,38 @@ class PriorityFeeHandler:
         self.fixed_fee = fixed_fee
         self.extra_fee = extra_fee
         self.hard_cap = hard_cap
-        self.dynamic_fee_plugin = DynamicPriorityFee(client)
+        self.sampler = PriorityFeeSampler(client, interval = sample_interval, max_age = max_age)
+        self.block_fees = block_fees
+        self.dynamic_fee_plugin = DynamicPriorityFee(client, self.sampler, block_fees, max_age)
         self.fixed_fee_plugin = FixedPriorityFee(fixed_fee)
+        self.optimizer = LandingFeeOptimizer(client, target_slots, hard_cap) if target_slots > 0 else None
+        if self.optimizer is not None:
+            logger.warning(f"Priority target of {target_slots} slot(s) set: once enough trades are recorded, the learned fee replaces the dynamic, fixed and extra fees, the hard cap still applies")
+
+    # Function 'start'
+    def start(self) -> None:
+        """ Start sampling recent fees in the background when the dynamic fee is enabled """
+        if self.enable_dynamic_fee:
+            self.sampler.start()
+        if self.optimizer is not None:
+            self.optimizer.start()
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop the background sampling and save the landing records """
+        await self.sampler.close()
+        if self.optimizer is not None:
+            await self.optimizer.close()
 
     # Function 'calculate_priority_fee'
     async def calculate_priority_fee(self, accounts: list[Pubkey] | None = None) -> int | None:
         """ Function description """
+        # Once enough trades were recorded, the fee comes from their landing delays instead of the settings
+        learned_fee = self.optimizer.fee() if self.optimizer is not None else None
+        if learned_fee is not None:
+            # Recorded fees already include the extra percentage, adding it again would compound every cycle
+            return learned_fee
+
         base_fee = await self._get_base_fee(accounts)
         if base_fee is None:
             return None
@@ -69,38 +104,147 @@ class PriorityFeePlugin(ABC):
         pass
 
 
+# Class 'PriorityFeeSampler'
+class PriorityFeeSampler:
+    """ Rolling window of recent prioritization fees on the pump program accounts, sampled in the background """
+
+    # Define 'ACCOUNTS'
+    # Write-locked by every pump trade, their fees reflect the contention a buy or sell competes with
+    ACCOUNTS = [PumpAddresses.PROGRAM, PumpAddresses.FEE]
+
+    # Class initialization
+    def __init__(self, client: SolanaClient, accounts: list[Pubkey] | None = None, interval: float = 2.0, max_age: float = 10.0, window: int = 150):
+        """ Initializer description """
+        self.client = client
+        self.accounts = accounts or self.ACCOUNTS
+        self.interval = interval
+        self.max_age = max_age
+        self.window = window
+        self.sketch = SlidingQuantileSketch(window)
+        self.current: int | None = None
+        self.sampled = 0.0
+        self.samples = 0
+        self.failures = 0
+        self.stale = 0
+        self._task: asyncio.Task | None = None
+
+    # Function 'running'
+    @property
+    def running(self) -> bool:
+        """ True while the background task samples """
+        return self._task is not None
+
+    # Function 'fee'
+    def fee(self) -> int | None:
+        """ Current fee percentile, None before the first sample or once samples are older than max_age """
+        if self.current is None:
+            return None
+        if time.monotonic() - self.sampled > self.max_age:
+            self.stale += 1
+            return None
+        return self.current
+
+    # Function 'sample'
+    async def sample(self) -> int | None:
+        """ Fetch recent fees once, merge them into the window and recompute the percentile """
+        response = await self.client.CallRPC("getRecentPrioritizationFees", [[str(account) for account in self.accounts]], priority = "cleanup")
+        if not response:
+            raise ValueError("Empty prioritization fees response")
+
+        # Consecutive responses overlap, only the slots past the last one seen are new
+        latest = self.sketch.latest
+        for entry in sorted(response, key = lambda entry: entry["slot"]):
+            if entry["slot"] > latest:
+                self.sketch.add(entry["slot"], entry["prioritizationFee"])
+
+        fee = self.sketch.quantile(FEE_QUANTILE)
+        if fee is None:
+            raise ValueError("No prioritization fees in the window")
+        self.current = int(fee)
+        self.sampled = time.monotonic()
+        self.samples += 1
+        return self.current
+
+    # Function 'start'
+    def start(self) -> None:
+        """ Start sampling on a schedule """
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    # Function '_loop'
+    async def _loop(self) -> None:
+        """ Sample every interval until closed """
+        while True:
+            try:
+                await self.sample()
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Failed to sample recent priority fees: {e!s}")
+            await asyncio.sleep(self.interval)
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop sampling """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions = True)
+            self._task = None
+
+    # Function 'stats'
+    def stats(self) -> dict[str, int | float | None]:
+        """ Return the current fee, its age and the sampling counters """
+        return {
+            "fee": self.current,
+            "age": round(time.monotonic() - self.sampled, 3) if self.samples else None,
+            "slots": self.sketch.stats()["slots"],
+            "samples": self.samples,
+            "failures": self.failures,
+            "stale": self.stale
+        }
+
+
 # Class 'DynamicPriorityFee'
 class DynamicPriorityFee(PriorityFeePlugin):
     """ Class description """
 
     # Class initialization
-    def __init__(self, client: SolanaClient):
+    def __init__(self, client: SolanaClient, sampler: PriorityFeeSampler | None = None, block_fees: SlidingQuantileSketch | None = None, max_age: float = 10.0):
         """ Initializer description """
         self.client = client
+        self.sampler = sampler
+        self.block_fees = block_fees
+        self.max_age = max_age
 
     # Function 'get_priority_fee'
     async def get_priority_fee(self, accounts: list[Pubkey] | None = None) -> int | None:
         """ Function description """
+        # Prices paid by the pump transactions of recent blocks, when the block listener feeds them
+        if self.block_fees is not None and self.block_fees.count and self.block_fees.age() <= self.max_age:
+            return int(self.block_fees.quantile(FEE_QUANTILE))
+
+        # A running sampler answers from memory, a stale one defers to the fixed fee instead of adding a round trip
+        if self.sampler is not None and self.sampler.running:
+            fee = self.sampler.fee()
+            if fee is None:
+                logger.warning("Sampled priority fees are stale or missing, falling back")
+            return fee
+
         try:
-            body = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getRecentPrioritizationFees",
-                "params": [[str(account) for account in accounts]] if accounts else [],
-            }
-
-            response = await self.client.PostRPC(body)
-            if not response or "result" not in response:
+            params = [[str(account) for account in accounts]] if accounts else []
+            response = await self.client.CallRPC("getRecentPrioritizationFees", params)
+            if response is None:
                 logger.error("Failed to fetch recent prioritization fees: invalid response")
                 return None
 
-            fees = [fee["prioritizationFee"] for fee in response["result"]]
+            fees = [fee["prioritizationFee"] for fee in response]
             if not fees:
                 logger.warning("No prioritization fees found in the response")
                 return None
 
-            prior_fee = int(statistics.quantiles(fees, n=10)[-3])
-            return prior_fee
+            sketch = QuantileSketch()
+            for fee in fees:
+                sketch.add(fee)
+            return int(sketch.quantile(FEE_QUANTILE))
 
         except Exception as e:
             logger.error(f"Failed to fetch recent priority fee: {str(e)}", exc_info=True)
@@ -0,0 +1,216 @@
+# Import libraries
+import bisect
+import logging
+import os
+import time
+
+# Import packages
+from collections import deque
+from pathlib import Path
+from typing import Any
+from typing import Final
+
+# Import local packages
+from core import codec
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+# Define 'BUCKETS'
+# Upper bounds of the latency histogram buckets in seconds, the last bucket is open-ended
+BUCKETS: Final[tuple[float, ...]] = (0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0, 10.0)
+
+# Define 'LABELS'
+LABELS: Final[tuple[str, ...]] = tuple(f"<={bound * 1000:g}ms" for bound in BUCKETS) + (f">{BUCKETS[-1] * 1000:g}ms",)
+
+
+# Class 'LatencyHistogram'
+class LatencyHistogram:
+    """ Fixed-bucket latency histogram, constant memory and a bisect per sample """
+
+    __slots__ = ("counts", "total", "maximum")
+
+    # Class initialization
+    def __init__(self):
+        """ Initializer description """
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.maximum = 0.0
+
+    # Function 'add'
+    def add(self, latency: float) -> None:
+        """ Count one sample """
+        self.counts[bisect.bisect_left(BUCKETS, latency)] += 1
+        self.total += latency
+        if latency > self.maximum:
+            self.maximum = latency
+
+    # Function 'merge'
+    def merge(self, other: "LatencyHistogram") -> None:
+        """ Add the samples of another histogram """
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    # Function 'quantile'
+    def quantile(self, share: float) -> float | None:
+        """ Upper bound of the bucket holding the quantile, the maximum for the open bucket """
+        count = sum(self.counts)
+        if not count:
+            return None
+        rank = share * count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank and bucket:
+                return min(BUCKETS[index], self.maximum) if index < len(BUCKETS) else self.maximum
+        return self.maximum
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return the quantiles and bucket counts in milliseconds """
+        count = sum(self.counts)
+
+        def ms(value: float | None) -> float | None:
+            return round(value * 1000, 1) if value is not None else None
+
+        return {
+            "mean": ms(self.total / count) if count else None,
+            "p50": ms(self.quantile(0.50)),
+            "p90": ms(self.quantile(0.90)),
+            "p99": ms(self.quantile(0.99)),
+            "max": ms(self.maximum) if count else None,
+            "buckets": {label: bucket for label, bucket in zip(LABELS, self.counts) if bucket}
+        }
+
+
+# Class 'MethodProfile'
+class MethodProfile:
+    """ Counters of one RPC method on one endpoint """
+
+    __slots__ = ("calls", "errors", "cancelled", "inflight", "sent", "received", "histogram")
+
+    # Class initialization
+    def __init__(self):
+        """ Initializer description """
+        self.calls = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.inflight = 0
+        self.sent = 0
+        self.received = 0
+        self.histogram = LatencyHistogram()
+
+    # Function 'merge'
+    def merge(self, other: "MethodProfile") -> None:
+        """ Add the counters of another profile """
+        self.calls += other.calls
+        self.errors += other.errors
+        self.cancelled += other.cancelled
+        self.inflight += other.inflight
+        self.sent += other.sent
+        self.received += other.received
+        self.histogram.merge(other.histogram)
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return the counters with the latency summary """
+        return {"calls": self.calls, "errors": self.errors, "cancelled": self.cancelled, "inflight": self.inflight, "sent": self.sent, "received": self.received, **self.histogram.stats()}
+
+
+# Class 'RPCProfiler'
+class RPCProfiler:
+    """ Per-method and per-endpoint RPC latency, payload, error and in-flight accounting with a slow-call log """
+
+    # Class initialization
+    def __init__(self, slowcall: float = 1.0, slowlog: int = 100):
+        """ Initializer description """
+        self.slowcall = slowcall
+        self.started = time.time()
+        self.slow: deque[dict[str, Any]] = deque(maxlen = slowlog)
+        self._profiles: dict[tuple[str, str], MethodProfile] = {}
+
+    # Function 'profile'
+    def profile(self, method: str, endpoint: str) -> MethodProfile:
+        """ Return the counters of a method on an endpoint """
+        key = (method, endpoint)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = self._profiles[key] = MethodProfile()
+        return profile
+
+    # Function 'begin'
+    def begin(self, methods: list[str], endpoint: str, sent: int) -> None:
+        """ Count a request leaving for an endpoint, a batch is split evenly across its calls """
+        share = sent // len(methods)
+        for method in methods:
+            profile = self.profile(method, endpoint)
+            profile.inflight += 1
+            profile.sent += share
+
+    # Function 'end'
+    def end(self, methods: list[str], endpoint: str, latency: float, received: int = 0, error: BaseException | None = None) -> None:
+        """ Record the outcome of a request started with begin() """
+        share = received // len(methods)
+        for method in methods:
+            profile = self.profile(method, endpoint)
+            profile.inflight -= 1
+            profile.calls += 1
+            profile.received += share
+            if error is not None:
+                profile.errors += 1
+            else:
+                profile.histogram.add(latency)
+
+        if latency >= self.slowcall:
+            names = ", ".join(sorted(set(methods)))
+            self.slow.append({"time": time.strftime("%Y-%m-%d %H:%M:%S"), "methods": names, "calls": len(methods), "endpoint": endpoint, "latency": round(latency * 1000, 1), "error": str(error) if error is not None else None})
+            logger.warning(f"Slow RPC call: {names} on {endpoint} took {latency * 1000:.0f} ms{f' ({error!s})' if error is not None else ''}")
+
+    # Function 'abandon'
+    def abandon(self, methods: list[str], endpoint: str) -> None:
+        """ Close a request that was cancelled, e.g. the losing side of a hedge """
+        for method in methods:
+            profile = self.profile(method, endpoint)
+            profile.inflight -= 1
+            profile.cancelled += 1
+
+    # Function 'snapshot'
+    def snapshot(self) -> dict[str, Any]:
+        """ Return every counter per method, per method and endpoint, and the slow-call log """
+        methods: dict[str, MethodProfile] = {}
+        endpoints: dict[str, dict[str, Any]] = {}
+        for (method, endpoint), profile in sorted(self._profiles.items()):
+            methods.setdefault(method, MethodProfile()).merge(profile)
+            endpoints.setdefault(endpoint, {})[method] = profile.stats()
+
+        return {
+            "time": time.time(),
+            "uptime": round(time.time() - self.started, 1),
+            "slowcall": round(self.slowcall * 1000, 1),
+            "methods": {method: profile.stats() for method, profile in methods.items()},
+            "endpoints": endpoints,
+            "slow": list(reversed(self.slow))
+        }
+
+    # Function 'dump'
+    def dump(self, path: str | Path) -> None:
+        """ Write the snapshot as JSON, replacing the previous file atomically """
+        path = Path(path)
+        path.parent.mkdir(parents = True, exist_ok = True)
+        temporary = path.with_suffix(path.suffix + ".tmp")
+        temporary.write_bytes(codec.dumpb(self.snapshot()))
+        os.replace(temporary, path)
+
+
+# Function 'load_snapshots'
+def load_snapshots(directory: str | Path, pattern: str = "*-rpc.json") -> dict[str, dict[str, Any]]:
+    """ Read the snapshots written by running bots, keyed by bot name """
+    snapshots = {}
+    suffix = pattern.lstrip("*")
+    for path in sorted(Path(directory).glob(pattern)):
+        try:
+            snapshots[path.name.removesuffix(suffix)] = codec.loads(path.read_bytes())
+        except Exception as e:
+            logger.debug(f"Skipping unreadable RPC profile {path}: {e!s}")
+    return snapshots
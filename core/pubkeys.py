@@ -20,6 +20,7 @@ class SystemAddresses:
     ASSOCIATED_TOKEN_PROGRAM: Final[Pubkey] = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
     RENT: Final[Pubkey] = Pubkey.from_string("SysvarRent111111111111111111111111111111111")
     SOL: Final[Pubkey] = Pubkey.from_string("So11111111111111111111111111111111111111112")
+    COMPUTE_BUDGET_PROGRAM: Final[Pubkey] = Pubkey.from_string("ComputeBudget111111111111111111111111111111")
 
 
 # Class 'PumpAddresses'
@@ -0,0 +1,286 @@
+# Import packages
+from dataclasses import dataclass
+from typing import Any
+from typing import Final
+
+# Import local packages
+from core.pubkeys import LAMPORTS_PER_SOL
+from core.pubkeys import TOKEN_DECIMALS
+
+# Import optional packages
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Define 'FEE_BASIS_POINTS'
+# Trading fee of the pump program, charged on the SOL side of every trade
+FEE_BASIS_POINTS: Final[int] = 100
+
+# Define 'BASIS_POINTS'
+BASIS_POINTS: Final[int] = 10_000
+
+# Define 'U64_MAX'
+U64_MAX: Final[int] = 2**64 - 1
+
+# Define 'QUOTE_DTYPE'
+# Record returned by the vectorized quotes, one per curve and size
+QUOTE_DTYPE = np.dtype([("tokens", "<u8"), ("lamports", "<u8"), ("fee", "<u8"), ("price", "<f8")]) if np is not None else None
+
+
+# Class 'Quote'
+@dataclass(frozen = True, slots = True)
+class Quote:
+    """ Exact amounts of one trade against a bonding curve, in raw token units and lamports """
+
+    # Define 'tokens'
+    tokens: int
+
+    # Define 'lamports'
+    # Paid including the fee for a buy, received net of the fee for a sell
+    lamports: int
+
+    # Define 'fee'
+    fee: int
+
+    # Define 'spot'
+    # Curve price in SOL per token before the trade
+    spot: float
+
+    # Function 'price'
+    @property
+    def price(self) -> float:
+        """ Average fill price in SOL per token, fee included """
+        if self.tokens == 0:
+            return self.spot
+        return (self.lamports / LAMPORTS_PER_SOL) / (self.tokens / 10**TOKEN_DECIMALS)
+
+    # Function 'impact'
+    @property
+    def impact(self) -> float:
+        """ Relative distance between the fill price and the spot price """
+        return self.price / self.spot - 1
+
+    # Function 'amount'
+    @property
+    def amount(self) -> float:
+        """ Token amount in decimal form """
+        return self.tokens / 10**TOKEN_DECIMALS
+
+    # Function 'sol'
+    @property
+    def sol(self) -> float:
+        """ SOL amount in decimal form """
+        return self.lamports / LAMPORTS_PER_SOL
+
+    # Function 'max_cost'
+    def max_cost(self, slippage: float) -> int:
+        """ Maximum lamports a buy may pay for this quote under `slippage` """
+        return min(int(self.lamports * (1 + slippage)), U64_MAX)
+
+    # Function 'min_output'
+    def min_output(self, slippage: float) -> int:
+        """ Minimum lamports a sell must receive for this quote under `slippage` """
+        return max(int(self.lamports * (1 - slippage)), 0)
+
+
+# Function '_u64'
+def _u64(value: int, name: str) -> int:
+    """ Reject amounts the program could not hold in a u64 """
+    if not 0 <= value <= U64_MAX:
+        raise ValueError(f"{name} does not fit in a u64: {value}")
+    return value
+
+
+# Function '_reserves'
+def _reserves(curve: Any) -> tuple[int, int, int]:
+    """ Virtual SOL, virtual token and real token reserves of a tradable curve """
+    if curve.complete:
+        raise ValueError("Bonding curve is complete")
+    if curve.virtual_token_reserves <= 0 or curve.virtual_sol_reserves <= 0:
+        raise ValueError("Invalid reserve state")
+    return curve.virtual_sol_reserves, curve.virtual_token_reserves, curve.real_token_reserves
+
+
+# Function '_spot'
+def _spot(vsol: int, vtoken: int) -> float:
+    """ Spot price in SOL per token """
+    return (vsol / LAMPORTS_PER_SOL) / (vtoken / 10**TOKEN_DECIMALS)
+
+
+# Function 'trade_fee'
+def trade_fee(lamports: int, fee_bps: int = FEE_BASIS_POINTS) -> int:
+    """ Fee charged on a SOL amount, rounded up as the program does """
+    return -(-lamports * fee_bps // BASIS_POINTS)
+
+
+# Function 'buy_cost'
+def buy_cost(vsol: int, vtoken: int, tokens: int) -> int:
+    """ Lamports the curve takes for `tokens`, fee excluded """
+    if tokens == 0:
+        return 0
+    return tokens * vsol // (vtoken - tokens) + 1
+
+
+# Function 'buy_tokens'
+def buy_tokens(vsol: int, vtoken: int, budget: int, fee_bps: int = FEE_BASIS_POINTS) -> int:
+    """ Most tokens whose cost plus fee stays within `budget` lamports """
+    # Largest cost whose rounded-up fee still fits, then largest amount with cost <= that
+    cost = budget * BASIS_POINTS // (BASIS_POINTS + fee_bps)
+    if cost == 0:
+        return 0
+    return (cost * vtoken - 1) // (vsol + cost)
+
+
+# Function 'sell_proceeds'
+def sell_proceeds(vsol: int, vtoken: int, tokens: int) -> int:
+    """ Lamports the curve pays for `tokens`, fee excluded """
+    return tokens * vsol // (vtoken + tokens)
+
+
+# Function 'quote_buy'
+def quote_buy(curve: Any, lamports: int, fee_bps: int = FEE_BASIS_POINTS) -> Quote:
+    """ Exact tokens bought by spending at most `lamports`, fee included """
+    vsol, vtoken, real = _reserves(curve)
+    tokens = min(buy_tokens(vsol, vtoken, _u64(lamports, "Buy amount"), fee_bps), real)
+    cost = buy_cost(vsol, vtoken, tokens)
+    fee = trade_fee(cost, fee_bps)
+    return Quote(tokens, cost + fee, fee, _spot(vsol, vtoken))
+
+
+# Function 'quote_buy_tokens'
+def quote_buy_tokens(curve: Any, tokens: int, fee_bps: int = FEE_BASIS_POINTS) -> Quote:
+    """ Exact lamports paid for `tokens`, fee included """
+    vsol, vtoken, real = _reserves(curve)
+    tokens = min(_u64(tokens, "Token amount"), real)
+    cost = buy_cost(vsol, vtoken, tokens)
+    fee = trade_fee(cost, fee_bps)
+    return Quote(tokens, _u64(cost + fee, "Buy cost"), fee, _spot(vsol, vtoken))
+
+
+# Function 'quote_sell'
+def quote_sell(curve: Any, tokens: int, fee_bps: int = FEE_BASIS_POINTS) -> Quote:
+    """ Exact lamports received for selling `tokens`, fee deducted """
+    vsol, vtoken, _ = _reserves(curve)
+    proceeds = sell_proceeds(vsol, vtoken, _u64(tokens, "Token amount"))
+    fee = trade_fee(proceeds, fee_bps)
+    return Quote(tokens, proceeds - fee, fee, _spot(vsol, vtoken))
+
+
+# Function '_mul'
+def _mul(a: "np.ndarray", b: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """ Full 128-bit product of two u64 arrays as high and low words """
+    mask = np.uint64(0xFFFFFFFF)
+    alo, ahi = a & mask, a >> 32
+    blo, bhi = b & mask, b >> 32
+    low, cross1, cross2 = alo * blo, alo * bhi, ahi * blo
+    middle = (low >> 32) + (cross1 & mask) + (cross2 & mask)
+    return ahi * bhi + (cross1 >> 32) + (cross2 >> 32) + (middle >> 32), (low & mask) | (middle << 32)
+
+
+# Function '_add'
+def _add(a: "np.ndarray", b: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """ Sum of two u64 arrays modulo 2**64, and where it wrapped """
+    total = a + b
+    return total, total < a
+
+
+# Function '_muldiv'
+def _muldiv(a: "np.ndarray", b: "np.ndarray", c: "np.ndarray", carry: "np.ndarray | None" = None) -> tuple["np.ndarray", "np.ndarray"]:
+    """ Floor of a * b / c with u128 intermediates, and whether it left a remainder, c is 2**64 larger where `carry` is set """
+    if carry is not None and carry.any():
+        # A divisor past the u64 range is rare enough to be divided as Python integers
+        quotient, remainder = _muldiv(a, b, np.where(carry, np.uint64(U64_MAX), c))
+        for index in zip(*np.nonzero(carry)):
+            value, rest = divmod(int(a[index]) * int(b[index]), int(c[index]) + 2**64)
+            quotient[index] = value
+            remainder[index] = rest != 0
+        return quotient, remainder
+
+    with np.errstate(divide = "ignore", invalid = "ignore", over = "ignore"):
+        divisor = np.where(c == 0, np.uint64(1), c)
+        estimate = np.floor(a.astype(np.float64) * b.astype(np.float64) / divisor.astype(np.float64))
+    quotient = np.minimum(estimate, float(U64_MAX >> 11 << 11)).astype(np.uint64)
+    high, low = _mul(a, b)
+
+    # The float estimate is off by a few units at most, step it onto the exact quotient
+    for _ in range(4):
+        rhigh, rlow = _mul(quotient, divisor)
+        over = (rhigh > high) | ((rhigh == high) & (rlow > low))
+        borrow = (low < rlow).astype(np.uint64)
+        remhigh, remlow = high - rhigh - borrow, low - rlow
+        under = ~over & ((remhigh > 0) | (remlow >= divisor))
+        if not (over.any() or under.any()):
+            return quotient, remlow != 0
+        quotient = quotient - over.astype(np.uint64) + under.astype(np.uint64)
+
+    # Quotients too large for the float estimate fall back to Python integers
+    exact = [divmod(x * y, z) for x, y, z in zip(a.ravel().tolist(), b.ravel().tolist(), divisor.ravel().tolist())]
+    quotient = np.array([value for value, _ in exact], dtype = np.uint64).reshape(a.shape)
+    return quotient, np.array([rest != 0 for _, rest in exact], dtype = bool).reshape(a.shape)
+
+
+# Function '_arrays'
+def _arrays(curves: Any, amounts: Any) -> tuple["np.ndarray", ...]:
+    """ Broadcast curve reserves against amounts as u64 arrays, with a mask of tradable curves """
+    if np is None:
+        raise RuntimeError("NumPy is required for vectorized quotes")
+    if isinstance(curves, np.ndarray):
+        fields = (curves["virtual_sol_reserves"], curves["virtual_token_reserves"], curves["real_token_reserves"], curves["complete"])
+    else:
+        fields = (curves.virtual_sol_reserves, curves.virtual_token_reserves, curves.real_token_reserves, curves.complete)
+    amounts = np.asarray(amounts)
+    if amounts.dtype.kind == "f" or (amounts.dtype.kind == "i" and (amounts < 0).any()):
+        raise ValueError("Amounts must be non-negative integers")
+    vsol, vtoken, real, complete, amounts = np.broadcast_arrays(*(np.asarray(value) for value in fields), amounts)
+    vsol, vtoken, real, amounts = (value.astype(np.uint64) for value in (vsol, vtoken, real, amounts))
+    valid = ~complete.astype(bool) & (vsol > 0) & (vtoken > 0)
+    return vsol, vtoken, real, amounts, valid
+
+
+# Function '_fees'
+def _fees(lamports: "np.ndarray", fee_bps: int) -> "np.ndarray":
+    """ Vectorized trade_fee """
+    fee, remainder = _muldiv(lamports, np.full_like(lamports, fee_bps), np.full_like(lamports, BASIS_POINTS))
+    return fee + remainder.astype(np.uint64)
+
+
+# Function '_records'
+def _records(tokens: "np.ndarray", lamports: "np.ndarray", fee: "np.ndarray", valid: "np.ndarray") -> "np.ndarray":
+    """ Pack quote columns into QUOTE_DTYPE records, zeroing untradable curves """
+    quotes = np.zeros(tokens.shape, dtype = QUOTE_DTYPE)
+    quotes["tokens"] = np.where(valid, tokens, 0)
+    quotes["lamports"] = np.where(valid, lamports, 0)
+    quotes["fee"] = np.where(valid, fee, 0)
+    with np.errstate(divide = "ignore", invalid = "ignore"):
+        quotes["price"] = np.where(quotes["tokens"] > 0, (quotes["lamports"] / LAMPORTS_PER_SOL) / (quotes["tokens"] / 10**TOKEN_DECIMALS), np.nan)
+    return quotes
+
+
+# Function 'quote_buy_ladder'
+def quote_buy_ladder(curves: Any, lamports: Any, fee_bps: int = FEE_BASIS_POINTS) -> "np.ndarray":
+    """ Vectorized quote_buy over budgets and curves, which broadcast against each other """
+    vsol, vtoken, real, budget, valid = _arrays(curves, lamports)
+    one = np.uint64(1)
+    cost, _ = _muldiv(budget, np.full_like(budget, BASIS_POINTS), np.full_like(budget, BASIS_POINTS + fee_bps))
+    total, carry = _add(vsol, cost)
+    tokens, remainder = _muldiv(cost, vtoken, total, carry)
+    tokens = np.where(cost > 0, tokens - (~remainder).astype(np.uint64), 0)
+    tokens = np.minimum(tokens, real)
+
+    # Price the amount actually bought, it may have been capped by the real reserves
+    with np.errstate(over = "ignore"):
+        paid, _ = _muldiv(tokens, vsol, np.where(tokens < vtoken, vtoken - tokens, one))
+    paid = np.where(tokens > 0, paid + one, 0)
+    fee = _fees(paid, fee_bps)
+    return _records(tokens, paid + fee, fee, valid)
+
+
+# Function 'quote_sell_ladder'
+def quote_sell_ladder(curves: Any, tokens: Any, fee_bps: int = FEE_BASIS_POINTS) -> "np.ndarray":
+    """ Vectorized quote_sell over token amounts and curves, which broadcast against each other """
+    vsol, vtoken, _, tokens, valid = _arrays(curves, tokens)
+    total, carry = _add(vtoken, tokens)
+    proceeds, _ = _muldiv(tokens, vsol, total, carry)
+    fee = _fees(proceeds, fee_bps)
+    return _records(tokens, proceeds - fee, fee, valid)
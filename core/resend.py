@@ -0,0 +1,315 @@
+# Import libraries
+import asyncio
+import logging
+import time
+
+# Import packages
+from collections import OrderedDict
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from solders.transaction import Transaction
+
+# Import local packages
+from core.blockhash import RecentBlockhash
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+
+# Class 'SendAttempt'
+@dataclass(slots = True)
+class SendAttempt:
+    """ One submission of a signed transaction to the cluster """
+
+    # Define 'signature'
+    signature: str
+
+    # Define 'generation'
+    # 0 for the original signing, incremented by every re-sign with a fresh blockhash
+    generation: int
+
+    # Define 'offset'
+    # Seconds since the first submission of the job
+    offset: float
+
+    # Define 'slot'
+    slot: int
+
+    # Define 'error'
+    error: str | None = None
+
+
+# Class 'SendJob'
+class SendJob:
+    """ Every signing and submission of one logical transaction until it lands or expires """
+
+    # Class initialization
+    def __init__(self, label: str, fee: int | None = None):
+        """ Initializer description """
+        self.label = label
+        self.fee = fee
+        self.started = time.monotonic()
+        self.created = time.time()
+        self.status = "pending"
+        self.landed: str | None = None
+        self.landedslot: int | None = None
+        self.signatures: list[str] = []
+        self.attempts: list[SendAttempt] = []
+        self.outcome: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.changed = asyncio.Event()
+
+    # Function 'record'
+    def record(self, signature: str, generation: int, slot: int, error: BaseException | None = None) -> None:
+        """ Add one submission """
+        if signature not in self.signatures:
+            self.signatures.append(signature)
+        self.attempts.append(SendAttempt(signature, generation, round(time.monotonic() - self.started, 3), slot, str(error) if error is not None else None))
+
+    # Function 'finish'
+    def finish(self, status: str, signature: str | None = None, slot: int | None = None) -> None:
+        """ Settle the job with its final status and the signature and slot it landed in, if any """
+        if self.outcome.done():
+            return
+        self.status = status
+        self.landed = signature
+        self.landedslot = slot
+        self.outcome.set_result(signature)
+        self.changed.set()
+
+    # Function 'sendslot'
+    @property
+    def sendslot(self) -> int | None:
+        """ Slot of the first submission """
+        return self.attempts[0].slot if self.attempts else None
+
+    # Function 'summary'
+    def summary(self) -> dict[str, Any]:
+        """ Return the job with its attempts, for landing-rate analysis """
+        return {
+            "label": self.label,
+            "status": self.status,
+            "fee": self.fee,
+            "landed": self.landed,
+            "sendslot": self.sendslot,
+            "landedslot": self.landedslot,
+            "duration": round(time.monotonic() - self.started, 3),
+            "resigns": max((attempt.generation for attempt in self.attempts), default = 0),
+            "attempts": [asdict(attempt) for attempt in self.attempts]
+        }
+
+
+# Class 'TransactionResender'
+class TransactionResender:
+    """ Rebroadcast signed transactions until they land or their blockhash expires, re-signing if allowed """
+
+    # Class initialization
+    def __init__(self, client: Any, interval: float = 0.4, history: int = 500):
+        """ Initializer description """
+        self.client = client
+        self.interval = interval
+        self.history: deque[dict[str, Any]] = deque(maxlen = history)
+        self.counts = {"landed": 0, "failed": 0, "expired": 0, "error": 0}
+        self.resigns = 0
+        self.sends = 0
+        self._jobs: OrderedDict[str, SendJob] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+        self._callbacks: list[Callable[[SendJob], None]] = []
+
+    # Function 'on_settled'
+    def on_settled(self, callback: Callable[[SendJob], None]) -> None:
+        """ Register a callback invoked with every job once it has landed, failed, expired or stopped on an error """
+        self._callbacks.append(callback)
+
+    # Function 'submit'
+    async def submit(self, build: Callable[[RecentBlockhash], Transaction], skip_preflight: bool = True, maxretries: int = 3, resigns: int = 0, label: str = "transaction", fee: int | None = None) -> str:
+        """ Sign with a tracked blockhash, send, and keep the transaction alive in the background """
+        entry = await self.client.blockhashes.get()
+        transaction = build(entry)
+        job = SendJob(label, fee)
+
+        for attempt in range(maxretries):
+            try:
+                signature = await self._send(job, transaction, 0, skip_preflight)
+                break
+            except Exception as e:
+                if attempt == maxretries - 1 or self.client.blockhashes.remaining(entry) <= 0:
+                    job.finish("failed")
+                    self._finished(job)
+                    logger.error(f"Failed to send transaction after {attempt + 1} attempts")
+                    raise
+                logger.warning(f"Transaction attempt {attempt + 1} failed: {e!s}, retrying in {self.interval}s")
+                await asyncio.sleep(self.interval)
+
+        task = asyncio.create_task(self._run(job, build, transaction, entry, skip_preflight, resigns))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return signature
+
+    # Function '_send'
+    async def _send(self, job: SendJob, transaction: Transaction, generation: int, skip_preflight: bool) -> str:
+        """ Submit once and record the attempt """
+        signature = str(transaction.signatures[0])
+        slot = self.client.blockhashes.currentslot()
+        self.sends += 1
+        try:
+            await self.client.send_transaction(transaction, skip_preflight)
+        except Exception as e:
+            job.record(signature, generation, slot, e)
+            raise
+        job.record(signature, generation, slot)
+        self._track(signature, job)
+        return signature
+
+    # Function '_track'
+    def _track(self, signature: str, job: SendJob) -> None:
+        """ Map a signature to its job, keeping a bounded number of recent jobs """
+        self._jobs[signature] = job
+        self._jobs.move_to_end(signature)
+        while len(self._jobs) > 1024:
+            self._jobs.popitem(last = False)
+
+    # Function '_run'
+    async def _run(self, job: SendJob, build: Callable[[RecentBlockhash], Transaction], transaction: Transaction, entry: RecentBlockhash, skip_preflight: bool, resigns: int) -> None:
+        """ Rebroadcast until the job lands, fails or runs out of blockhashes """
+        blockhashes = self.client.blockhashes
+        poller = self.client.confirmer.poller
+        generation = 0
+        try:
+            while True:
+                signature = str(transaction.signatures[0])
+                landed = poller.watch(signature, "processed")
+                try:
+                    while not job.outcome.done():
+                        # The slot estimate runs out early, only the block height says the blockhash is gone
+                        if blockhashes.remaining(entry) <= 0 and await blockhashes.expired(entry):
+                            break
+                        await asyncio.wait([landed, job.outcome], timeout = self.interval, return_when = asyncio.FIRST_COMPLETED)
+                        if landed.done() or job.outcome.done():
+                            break
+                        try:
+                            await self._send(job, transaction, generation, skip_preflight)
+                        except Exception as e:
+                            logger.debug(f"Rebroadcast of {signature} failed: {e!s}")
+                finally:
+                    poller.forget(signature, landed)
+
+                if job.outcome.done():
+                    return
+                if landed.done():
+                    job.finish("landed" if landed.result() else "failed", signature, poller.slot(signature))
+                    return
+
+                # Expired, but an earlier signature may have landed unnoticed
+                if await self._settled(job):
+                    return
+                if generation >= resigns:
+                    job.finish("expired")
+                    logger.warning(f"Stopped resending {job.label} {signature}: blockhash expired after {len(job.attempts)} attempt(s)")
+                    return
+
+                generation += 1
+                self.resigns += 1
+                entry = await blockhashes.get()
+                transaction = build(entry)
+                logger.info(f"Re-signed {job.label} {signature} with a fresh blockhash as {transaction.signatures[0]}")
+                try:
+                    await self._send(job, transaction, generation, skip_preflight)
+                except Exception as e:
+                    logger.debug(f"Send of re-signed {job.label} failed: {e!s}")
+                job.changed.set()
+        except asyncio.CancelledError:
+            job.finish("cancelled")
+            raise
+        except Exception as e:
+            # Not an expiry, kept out of the landing rate and the fee model
+            job.finish("error")
+            logger.warning(f"Resending {job.label} stopped: {e!s}")
+        finally:
+            job.finish("expired")
+            self._finished(job)
+
+    # Function '_settled'
+    async def _settled(self, job: SendJob) -> bool:
+        """ Check every signature of an expired job once, settling it if one of them landed """
+        response = await self.client.CallRPC("getSignatureStatuses", [job.signatures], priority = "confirm")
+        for signature, status in zip(job.signatures, response["value"]):
+            if status is not None:
+                job.finish("landed" if status.get("err") is None else "failed", signature, status.get("slot"))
+                return True
+        return False
+
+    # Function '_finished'
+    def _finished(self, job: SendJob) -> None:
+        """ Count and keep the record of a settled job """
+        self.counts[job.status] = self.counts.get(job.status, 0) + 1
+        self.history.append(job.summary())
+        for callback in self._callbacks:
+            try:
+                callback(job)
+            except Exception as e:
+                logger.warning(f"Settled job callback failed: {e!s}")
+
+    # Function 'job'
+    def job(self, signature: str) -> SendJob | None:
+        """ Job a signature was sent for, None if it did not go through the resender """
+        return self._jobs.get(signature)
+
+    # Function 'confirm'
+    async def confirm(self, job: SendJob, commitment: str = "confirmed") -> bool:
+        """ Wait for the job to reach `commitment`, following it across re-signs """
+        while True:
+            # A job that expired before the call has already set and spent its change event
+            if job.outcome.done() and job.landed is None:
+                return False
+            job.changed.clear()
+            signature = job.landed or job.signatures[-1]
+            confirmed = asyncio.ensure_future(self.client.confirmer.wait(signature, commitment))
+            changed = asyncio.ensure_future(job.changed.wait())
+            try:
+                await asyncio.wait([confirmed, changed], return_when = asyncio.FIRST_COMPLETED)
+            finally:
+                changed.cancel()
+
+            if confirmed.done():
+                if confirmed.result():
+                    job.finish("landed", signature, self.client.confirmer.poller.slot(signature) or self.client.blockhashes.currentslot())
+                    return True
+                if job.landed is not None and job.landed != signature:
+                    continue
+                return False
+
+            if job.outcome.done() and job.landed is None:
+                confirmed.cancel()
+                return False
+            if job.landed == signature:
+                return await confirmed
+            confirmed.cancel()
+
+    # Function 'records'
+    def records(self) -> list[dict[str, Any]]:
+        """ Return the most recent settled jobs with their attempts, newest first """
+        return list(reversed(self.history))
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return landing counters and the mean number of sends per landed job """
+        settled = self.counts["landed"] + self.counts["failed"] + self.counts["expired"]
+        landed = [record for record in self.history if record["status"] == "landed"]
+        return {
+            **self.counts,
+            "pending": len(self._tasks),
+            "sends": self.sends,
+            "resigns": self.resigns,
+            "landingrate": round(self.counts["landed"] / settled, 3) if settled else None,
+            "sendsperlanding": round(sum(len(record["attempts"]) for record in landed) / len(landed), 2) if landed else None
+        }
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop every resend loop """
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions = True)
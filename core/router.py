@@ -0,0 +1,399 @@
+# Import libraries
+import aiohttp
+import asyncio
+import logging
+import time
+
+# Import packages
+from collections import deque
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+from typing import Final
+from urllib.parse import urlsplit
+
+# Import local packages
+from core import codec
+from core.batch import RPCBatcher
+from core.batch import RPCError
+from core.health import AdaptiveTimeout
+from core.health import CircuitBreaker
+from core.limiter import RateLimiter
+from core.limiter import priority_for
+from core.profiler import RPCProfiler
+from core.session import RPCSession
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+# Define 'ROLES'
+ROLES: Final[tuple[str, ...]] = ("read", "send", "both")
+
+# Define 'UNHEALTHY_CODES'
+# JSON-RPC errors about the node rather than the request: behind, missing blocks, skipped slots, throttled
+UNHEALTHY_CODES: Final[frozenset[int]] = frozenset({-32004, -32005, -32007, -32016, 429, -32429})
+
+# Define 'THROTTLED_CODES'
+THROTTLED_CODES: Final[frozenset[int]] = frozenset({429, -32429})
+
+
+# Class 'RPCEndpoint'
+class RPCEndpoint:
+    """ RPC node with its connection pool and rolling latency/error statistics """
+
+    # Define 'ALPHA'
+    ALPHA: Final[float] = 0.2
+
+    # Class initialization
+    def __init__(self, url: str, role: str = "both", name: str | None = None, poolsize: int = 20, keepalive: float = 60.0, dnscache: int = 300, ratelimit: float = 0.0):
+        """ Initializer description """
+        if role not in ROLES:
+            raise ValueError(f"Unknown endpoint role '{role}', expected one of {ROLES}")
+
+        self.url = url
+        self.role = role
+        self.name = name or urlsplit(url).netloc or url
+        self.session = RPCSession(url, poolsize, keepalive, dnscache)
+        self.limiter = RateLimiter(ratelimit) if ratelimit else None
+        self.breaker = CircuitBreaker()
+        self.timeouts = AdaptiveTimeout(ceiling = self.session.timeout)
+        self.latency: float | None = None
+        self.errors = 0.0
+        self.accepted = 0
+        self.inflight = 0
+        self.samples: deque[float] = deque(maxlen = 200)
+        self._p95: float | None = None
+
+    # Function 'serves'
+    def serves(self, role: str) -> bool:
+        """ Return True if the endpoint accepts requests of the given role """
+        return self.role == "both" or role == "both" or self.role == role
+
+    # Function 'score'
+    def score(self) -> float:
+        """ Lower is better, untested endpoints are tried first """
+        if self.latency is None:
+            return 0.0
+        return self.latency * (1.0 + 4.0 * self.errors) * (1 + self.inflight)
+
+    # Function 'record'
+    def record(self, latency: float, success: bool) -> None:
+        """ Fold one request outcome into the EWMA statistics """
+        self.errors += self.ALPHA * ((0.0 if success else 1.0) - self.errors)
+        if success:
+            self.latency = latency if self.latency is None else self.latency + self.ALPHA * (latency - self.latency)
+            self.samples.append(latency)
+            if len(self.samples) % 20 == 0:
+                self._p95 = None
+
+    # Function 'p95'
+    def p95(self) -> float | None:
+        """ 95th percentile of recent successful latencies, None until enough samples """
+        if len(self.samples) < 20:
+            return None
+        if self._p95 is None:
+            ordered = sorted(self.samples)
+            self._p95 = ordered[int(len(ordered) * 0.95) - 1]
+        return self._p95
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return routing statistics of the endpoint """
+        return {
+            "role": self.role,
+            "latency": round(self.latency, 4) if self.latency is not None else None,
+            "p95": round(self.p95(), 4) if self.p95() is not None else None,
+            "errors": round(self.errors, 3),
+            "accepted": self.accepted,
+            "breaker": self.breaker.stats(),
+            "timeouts": self.timeouts.stats(),
+            **({"limiter": self.limiter.stats()} if self.limiter is not None else {}),
+            **self.session.stats()
+        }
+
+
+# Class 'EndpointRouter'
+class EndpointRouter:
+    """ Route JSON-RPC requests to the healthiest endpoint and hedge slow reads """
+
+    # Class initialization
+    def __init__(self, endpoints: list[RPCEndpoint], hedge: bool = True, hedgedelay: float = 0.5, ejectafter: int = 3, ejectfor: float = 5.0, slowcall: float = 1.0):
+        """ Initializer description """
+        if not endpoints:
+            raise ValueError("At least one RPC endpoint is required")
+
+        self.endpoints = endpoints
+        self.hedge = hedge
+        self.hedgedelay = hedgedelay
+        self.ejectafter = ejectafter
+        self.ejectfor = ejectfor
+        self.hedges = 0
+        self.profiler = RPCProfiler(slowcall)
+        self.endpoint = endpoints[0].url
+        self.timeout = endpoints[0].session.timeout
+        self._probe_task: asyncio.Task | None = None
+        for endpoint in endpoints:
+            endpoint.breaker = CircuitBreaker(ejectafter, ejectfor)
+
+    # Function 'from_config'
+    @classmethod
+    def from_config(cls, rpcendpoint: str, rpcendpoints: list[dict[str, Any]] | None = None, poolsize: int = 20, keepalive: float = 60.0, dnscache: int = 300, ratelimit: float = 0.0, slowcall: float = 1.0) -> "EndpointRouter":
+        """ Build a router from the primary endpoint and the optional `rpcs` list """
+        endpoints = [RPCEndpoint(rpcendpoint, "both", poolsize = poolsize, keepalive = keepalive, dnscache = dnscache, ratelimit = ratelimit)]
+        for entry in rpcendpoints or []:
+            url = entry["url"] if isinstance(entry, dict) else str(entry)
+            role = entry.get("role", "both") if isinstance(entry, dict) else "both"
+            rate = entry.get("ratelimit", ratelimit) if isinstance(entry, dict) else ratelimit
+            if url == rpcendpoint:
+                endpoints[0].role = role
+                endpoints[0].limiter = RateLimiter(rate) if rate else None
+                continue
+            endpoints.append(RPCEndpoint(url, role, poolsize = poolsize, keepalive = keepalive, dnscache = dnscache, ratelimit = rate))
+
+        names = [endpoint.name for endpoint in endpoints]
+        for index, endpoint in enumerate(endpoints):
+            if names.count(endpoint.name) > 1:
+                endpoint.name = f"{endpoint.name}#{index}"
+        return cls(endpoints, slowcall = slowcall)
+
+    # Function 'select'
+    def select(self, role: str = "read") -> list[RPCEndpoint]:
+        """ Return the endpoints serving `role`, best first, open breakers last so they fail fast """
+        candidates = [endpoint for endpoint in self.endpoints if endpoint.serves(role)] or list(self.endpoints)
+        healthy = [endpoint for endpoint in candidates if endpoint.breaker.available()]
+        return sorted(healthy or candidates, key = lambda endpoint: endpoint.score())
+
+    # Function 'pick'
+    def pick(self, role: str = "read", exclude: tuple[RPCEndpoint, ...] = ()) -> RPCEndpoint | None:
+        """ Return the best endpoint for `role` that is not excluded """
+        for endpoint in self.select(role):
+            if endpoint not in exclude:
+                return endpoint
+        return None
+
+    # Function 'post_json'
+    async def post_json(self, body: Any, role: str = "read", priority: str | None = None) -> Any:
+        """ Send a JSON-RPC body to the best endpoint, hedging reads that run past their p95 """
+        self.start()
+        priority = priority or priority_for(body.get("method") if isinstance(body, dict) else None)
+        primary = self.pick(role)
+        if role != "read" or not self.hedge or len(self.endpoints) == 1:
+            return await self._timed(primary, body, priority)
+
+        first = asyncio.create_task(self._timed(primary, body, priority))
+        tasks = [first]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout = primary.p95() or self.hedgedelay)
+            if first in done and first.exception() is None:
+                return first.result()
+
+            secondary = self.pick(role, exclude = (primary,))
+            if secondary is None:
+                return await first
+
+            self.hedges += 1
+            tasks.append(asyncio.create_task(self._timed(secondary, body, priority)))
+            error: BaseException | None = None
+            pending = {task for task in tasks if not task.done()}
+            for task in tasks:
+                if task.done():
+                    error = task.exception()
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    # Function 'broadcast'
+    async def broadcast(self, body: Any) -> tuple[Any, RPCEndpoint]:
+        """ Send a body to every send endpoint at once and return the first accepted result """
+        self.start()
+        priority = priority_for("sendTransaction")
+        endpoints = [endpoint for endpoint in self.endpoints if endpoint.serves("send")] or list(self.endpoints)
+        tasks = {asyncio.create_task(self._timed(endpoint, body, priority)): endpoint for endpoint in endpoints}
+        pending = set(tasks)
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        return RPCBatcher.unwrap(task.result()), tasks[task]
+                    except Exception as e:
+                        error = e
+            raise error
+        finally:
+            # Slower endpoints keep sending, nobody waits for their outcome
+            for task in pending:
+                task.add_done_callback(self._discard)
+
+    # Function '_discard'
+    @staticmethod
+    def _discard(task: asyncio.Task) -> None:
+        """ Retrieve the outcome of a broadcast request nobody waits for """
+        if not task.cancelled():
+            task.exception()
+
+    # Function 'post'
+    async def post(self, payload: str | bytes, role: str = "read") -> str:
+        """ Send a serialized payload to the best endpoint without hedging """
+        self.start()
+        endpoint = self.pick(role)
+        return await self._guarded(endpoint, lambda: endpoint.session.post(payload), ["provider"], priority_for(), len(payload))
+
+    # Function '_timed'
+    async def _timed(self, endpoint: RPCEndpoint, body: Any, priority: str = "curve") -> Any:
+        """ Post to one endpoint and record its latency and outcome """
+        methods = [entry.get("method", "batch") for entry in body] if isinstance(body, list) else [body.get("method", "batch")]
+        payload = codec.dumpb(body)
+        return await self._guarded(endpoint, lambda: endpoint.session.post_bytes(payload), methods, priority, len(payload), codec.loads)
+
+    # Function '_guarded'
+    async def _guarded(self, endpoint: RPCEndpoint, request: Callable[[], Awaitable[Any]], methods: list[str], priority: str, sent: int, decode: Callable[[Any], Any] | None = None) -> Any:
+        """ Run one request behind the endpoint's breaker, rate limit and adaptive deadline, and profile it """
+        endpoint.breaker.attempt()
+        try:
+            await self._admit(endpoint, priority)
+        except BaseException:
+            endpoint.breaker.release()
+            raise
+
+        timeout = endpoint.timeouts.timeout(methods)
+        self.profiler.begin(methods, endpoint.name, sent)
+        started = time.monotonic()
+        endpoint.inflight += 1
+        try:
+            reply = await asyncio.wait_for(request(), timeout)
+            received = len(reply)
+            if decode is not None:
+                reply = decode(reply)
+        except asyncio.CancelledError:
+            endpoint.breaker.release()
+            self.profiler.abandon(methods, endpoint.name)
+            raise
+        except TimeoutError as e:
+            for method in set(methods):
+                endpoint.timeouts.expire(method, timeout)
+            error = TimeoutError(f"{', '.join(sorted(set(methods)))} timed out after {timeout:.2f}s on {endpoint.name}")
+            self._failed(endpoint, time.monotonic() - started, error)
+            self.profiler.end(methods, endpoint.name, time.monotonic() - started, error = error)
+            raise error from e
+        except Exception as e:
+            self._failed(endpoint, time.monotonic() - started, e)
+            self.profiler.end(methods, endpoint.name, time.monotonic() - started, error = e)
+            raise
+        finally:
+            endpoint.inflight -= 1
+
+        latency = time.monotonic() - started
+        error = self.unhealthy(reply) if decode is not None else None
+        if error is not None:
+            # The node answered about itself, behind or throttled, which counts against its score, and against its
+            # breaker when another endpoint can take the traffic, a sole node that lags is still better than none
+            self._failed(endpoint, latency, error, trip = len(self.endpoints) > 1)
+            self.profiler.end(methods, endpoint.name, latency, received, error = error)
+            # Raising lets a hedged read fail over, a reply with some results is still returned
+            if not self.answered(reply):
+                raise error
+            return reply
+
+        self.profiler.end(methods, endpoint.name, latency, received)
+        endpoint.record(latency, True)
+        for method in set(methods):
+            endpoint.timeouts.observe(method, latency)
+        if endpoint.breaker.success():
+            logger.info(f"RPC endpoint {endpoint.name} is healthy again")
+        return reply
+
+    # Function 'unhealthy'
+    @staticmethod
+    def unhealthy(reply: Any) -> RPCError | None:
+        """ First error of a decoded reply that says the node is behind or throttled, None if there is none """
+        for entry in reply if isinstance(reply, list) else [reply]:
+            error = entry.get("error") if isinstance(entry, dict) else None
+            if isinstance(error, dict) and error.get("code") in UNHEALTHY_CODES:
+                return RPCError(error["code"], error.get("message", "unknown error"))
+        return None
+
+    # Function 'answered'
+    @staticmethod
+    def answered(reply: Any) -> bool:
+        """ True if a decoded reply carries at least one result """
+        return any(isinstance(entry, dict) and "result" in entry for entry in (reply if isinstance(reply, list) else [reply]))
+
+    # Function '_admit'
+    @staticmethod
+    async def _admit(endpoint: RPCEndpoint, priority: str) -> None:
+        """ Take a token from the endpoint's request budget, waiting behind higher priority calls """
+        if endpoint.limiter is not None:
+            await endpoint.limiter.acquire(priority)
+
+    # Function '_failed'
+    def _failed(self, endpoint: RPCEndpoint, latency: float, error: BaseException | None = None, trip: bool = True) -> None:
+        """ Record a failed request and, if `trip`, open the endpoint's breaker after repeated failures """
+        throttled = isinstance(error, aiohttp.ClientResponseError) and error.status == 429 or isinstance(error, RPCError) and error.code in THROTTLED_CODES
+        if endpoint.limiter is not None and throttled:
+            endpoint.limiter.penalize()
+        endpoint.record(latency, False)
+        if not trip:
+            endpoint.breaker.release()
+        elif endpoint.breaker.failure():
+            logger.warning(f"Opened circuit breaker of RPC endpoint {endpoint.name} after {endpoint.breaker.failures} consecutive failures")
+
+    # Function 'start'
+    def start(self) -> None:
+        """ Start the background probe of endpoints with an open breaker """
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
+    # Function '_probe_loop'
+    async def _probe_loop(self, interval: float = 1.0) -> None:
+        """ Use a getHealth probe as the half-open trial so traffic resumes as soon as a node recovers """
+        body = {"jsonrpc": "2.0", "id": 1, "method": "getHealth"}
+        while True:
+            await asyncio.sleep(interval)
+            for endpoint in self.endpoints:
+                if endpoint.breaker.state != "half-open" or not endpoint.breaker.available():
+                    continue
+                endpoint.breaker.attempt()
+                try:
+                    reply = await asyncio.wait_for(endpoint.session.post_json(body), endpoint.timeouts.ceiling)
+                    if reply.get("result") != "ok":
+                        raise RuntimeError(reply.get("error"))
+                except Exception as e:
+                    endpoint.breaker.failure()
+                    logger.debug(f"Probe of RPC endpoint {endpoint.name} failed: {e!s}")
+                    continue
+
+                endpoint.breaker.success()
+                endpoint.errors = 0.0
+                logger.info(f"RPC endpoint {endpoint.name} is healthy again")
+
+    # Function 'warmup'
+    async def warmup(self, connections: int = 1) -> None:
+        """ Warm up the connection pool of every endpoint """
+        await asyncio.gather(*(endpoint.session.warmup(connections) for endpoint in self.endpoints))
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return per-endpoint routing and pool statistics """
+        return {"hedges": self.hedges, "endpoints": {endpoint.name: endpoint.stats() for endpoint in self.endpoints}}
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop probing and close every endpoint pool """
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+        for endpoint in self.endpoints:
+            await endpoint.session.close()
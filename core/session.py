@@ -0,0 +1,130 @@
+# Import libraries
+import aiohttp
+import asyncio
+import logging
+
+# Import packages
+from typing import Any
+from solana.rpc.providers.async_http import AsyncHTTPProvider
+from solders.rpc.requests import Body
+
+# Import local packages
+from core import codec
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+
+# Class 'RPCSession'
+class RPCSession:
+    """ Long-lived keep-alive connection pool bound to a single RPC endpoint """
+
+    # Class initialization
+    def __init__(self, endpoint: str, poolsize: int = 20, keepalive: float = 60.0, dnscache: int = 300, timeout: float = 10.0):
+        """ Initializer description """
+        self.endpoint = endpoint
+        self.poolsize = poolsize
+        self.keepalive = keepalive
+        self.dnscache = dnscache
+        self.timeout = timeout
+        self.opened = 0
+        self.reused = 0
+        self.requests = 0
+        self._session: aiohttp.ClientSession | None = None
+
+    # Function '_on_connection_create'
+    async def _on_connection_create(self, session, context, params) -> None:
+        """ Count a freshly opened TCP/TLS connection """
+        self.opened += 1
+
+    # Function '_on_connection_reuse'
+    async def _on_connection_reuse(self, session, context, params) -> None:
+        """ Count a request served by an idle pooled connection """
+        self.reused += 1
+
+    # Function 'get_session'
+    def get_session(self) -> aiohttp.ClientSession:
+        """ Return the pooled session, creating it on first use """
+        if self._session is None or self._session.closed:
+            trace = aiohttp.TraceConfig()
+            trace.on_connection_create_end.append(self._on_connection_create)
+            trace.on_connection_reuseconn.append(self._on_connection_reuse)
+            connector = aiohttp.TCPConnector(
+                limit = self.poolsize,
+                limit_per_host = self.poolsize,
+                use_dns_cache = True,
+                ttl_dns_cache = self.dnscache,
+                keepalive_timeout = self.keepalive
+            )
+            self._session = aiohttp.ClientSession(
+                connector = connector,
+                timeout = aiohttp.ClientTimeout(self.timeout),
+                trace_configs = [trace],
+                headers = {"Content-Type": "application/json"}
+            )
+        return self._session
+
+    # Function 'post'
+    async def post(self, payload: str | bytes) -> str:
+        """ Send an already serialized JSON-RPC payload and return the raw reply """
+        self.requests += 1
+        async with self.get_session().post(self.endpoint, data = payload) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    # Function 'post_bytes'
+    async def post_bytes(self, payload: bytes) -> bytes:
+        """ Send an encoded JSON-RPC payload and return the undecoded reply """
+        self.requests += 1
+        async with self.get_session().post(self.endpoint, data = payload) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    # Function 'post_json'
+    async def post_json(self, body: Any) -> Any:
+        """ Send a JSON-RPC body and return the decoded reply """
+        return codec.loads(await self.post_bytes(codec.dumpb(body)))
+
+    # Function 'warmup'
+    async def warmup(self, connections: int = 1) -> None:
+        """ Open up to `connections` sockets ahead of the first trade """
+        body = {"jsonrpc": "2.0", "id": 1, "method": "getHealth"}
+        results = await asyncio.gather(*(self.post_json(body) for _ in range(max(1, min(connections, self.poolsize)))), return_exceptions = True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning(f"RPC pool warm-up: {len(failures)}/{len(results)} connection(s) failed: {failures[0]!s}")
+
+    # Function 'stats'
+    def stats(self) -> dict[str, int]:
+        """ Return connection pool counters """
+        return {"requests": self.requests, "opened": self.opened, "reused": self.reused}
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Close the pooled session and every idle connection """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# Class 'PooledHTTPProvider'
+class PooledHTTPProvider(AsyncHTTPProvider):
+    """ AsyncClient provider that routes requests through a shared RPCSession or EndpointRouter """
+
+    # Class initialization
+    def __init__(self, pool: Any):
+        """ Initializer description """
+        super().__init__(pool.endpoint, timeout = pool.timeout)
+        self.pool = pool
+
+    # Function 'make_request_unparsed'
+    async def make_request_unparsed(self, body: Body) -> str:
+        """ Send a single solders request body over the shared pool """
+        request_kwargs = self._before_request(body = body)
+        return await self.pool.post(request_kwargs["content"])
+
+    # Function 'make_batch_request_unparsed'
+    async def make_batch_request_unparsed(self, reqs: tuple[Body, ...]) -> str:
+        """ Send a solders batch request over the shared pool """
+        request_kwargs = self._before_batch_request(reqs)
+        return await self.pool.post(request_kwargs["content"])
@@ -0,0 +1,162 @@
+# Import libraries
+import bisect
+import heapq
+import math
+import time
+
+# Import packages
+from typing import Final
+
+# Define 'RELATIVE_ACCURACY'
+# Every quantile is within this relative distance of an actual value of the stream
+RELATIVE_ACCURACY: Final[float] = 0.01
+
+
+# Class 'QuantileSketch'
+# DDSketch rather than t-digest or KLL: bucket counts subtract exactly, which the sliding window needs to drop a
+# slot, and the error is relative to the value, so a p90 fee stays as tight as a p50 one
+class QuantileSketch:
+    """ Log-bucketed streaming quantile sketch with bounded relative error, mergeable and subtractable """
+
+    # Class initialization
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY):
+        """ Initializer description """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.loggamma = math.log(self.gamma)
+        self.buckets: dict[int, int] = {}
+        self.keys: list[int] = []
+        self.zeros = 0
+        self.count = 0
+
+    # Function 'add'
+    def add(self, value: float, count: int = 1) -> None:
+        """ Insert a non-negative value `count` times """
+        if value <= 0:
+            self.zeros += count
+        else:
+            key = math.ceil(math.log(value) / self.loggamma)
+            if key not in self.buckets:
+                bisect.insort(self.keys, key)
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += count
+
+    # Function 'merge'
+    def merge(self, other: "QuantileSketch", sign: int = 1) -> None:
+        """ Add the values of a sketch with the same accuracy, or remove them with sign=-1 """
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.buckets.items():
+            total = self.buckets.get(key, 0) + sign * count
+            if total > 0:
+                if key not in self.buckets:
+                    bisect.insort(self.keys, key)
+                self.buckets[key] = total
+            elif self.buckets.pop(key, None) is not None:
+                del self.keys[bisect.bisect_left(self.keys, key)]
+        self.zeros += sign * other.zeros
+        self.count += sign * other.count
+
+    # Function 'quantile'
+    def quantile(self, q: float) -> float | None:
+        """ Value at quantile q in [0, 1], None while the sketch is empty """
+        if self.count <= 0:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.zeros:
+            return 0.0
+        running = self.zeros
+        # Keys are kept sorted as buckets come and go, so a lookup is a single walk
+        for key in self.keys:
+            running += self.buckets[key]
+            if running > rank:
+                return 2 * self.gamma**key / (self.gamma + 1)
+        return 2 * self.gamma**self.keys[-1] / (self.gamma + 1)
+
+
+# Class 'SlidingQuantileSketch'
+class SlidingQuantileSketch:
+    """ Quantile sketch over the most recent slots, one sub-sketch per slot subtracted as it leaves the window """
+
+    # Class initialization
+    def __init__(self, window: int = 150, relative_accuracy: float = RELATIVE_ACCURACY):
+        """ Initializer description """
+        self.window = window
+        self.relative_accuracy = relative_accuracy
+        self.total = QuantileSketch(relative_accuracy)
+        self.latest = 0
+        self.updated = 0.0
+        self._slots: dict[int, QuantileSketch] = {}
+        self._order: list[int] = []
+        self._cache: dict[float, float | None] = {}
+
+    # Function 'count'
+    @property
+    def count(self) -> int:
+        """ Number of values in the window """
+        return self.total.count
+
+    # Function 'add'
+    def add(self, slot: int, value: float, count: int = 1) -> None:
+        """ Insert a value observed at `slot`, ignored if the slot already left the window """
+        self.advance(slot)
+        if slot <= self.latest - self.window:
+            return
+        sketch = self._slots.get(slot)
+        if sketch is None:
+            sketch = self._slots[slot] = QuantileSketch(self.relative_accuracy)
+            heapq.heappush(self._order, slot)
+        sketch.add(value, count)
+        self.total.add(value, count)
+        self.updated = time.monotonic()
+        self._cache.clear()
+
+    # Function 'advance'
+    def advance(self, slot: int) -> None:
+        """ Move the window to end at `slot`, dropping the slots that fall out of it """
+        if slot <= self.latest:
+            return
+        self.latest = slot
+        self.updated = time.monotonic()
+        cutoff = slot - self.window
+        while self._order and self._order[0] <= cutoff:
+            self.total.merge(self._slots.pop(heapq.heappop(self._order)), -1)
+            self._cache.clear()
+
+    # Function 'merge'
+    def merge(self, other: "SlidingQuantileSketch") -> None:
+        """ Add every slot of another sliding sketch, such as one fed by a different source """
+        self.advance(other.latest)
+        for slot, sketch in other._slots.items():
+            if slot <= self.latest - self.window:
+                continue
+            if slot not in self._slots:
+                self._slots[slot] = QuantileSketch(self.relative_accuracy)
+                heapq.heappush(self._order, slot)
+            self._slots[slot].merge(sketch)
+            self.total.merge(sketch)
+        self._cache.clear()
+
+    # Function 'quantile'
+    def quantile(self, q: float) -> float | None:
+        """ Value at quantile q over the window, cached until the window changes """
+        if q not in self._cache:
+            self._cache[q] = self.total.quantile(q)
+        return self._cache[q]
+
+    # Function 'age'
+    def age(self) -> float:
+        """ Seconds since the last value or slot was seen """
+        return time.monotonic() - self.updated
+
+    # Function 'stats'
+    def stats(self) -> dict[str, int | float | None]:
+        """ Return the window size and a few quantiles """
+        return {
+            "values": self.count,
+            "slots": len(self._slots),
+            "latest": self.latest,
+            "p50": self.quantile(0.5),
+            "p70": self.quantile(0.7),
+            "p90": self.quantile(0.9)
+        }
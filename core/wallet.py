@@ -1,22 +1,42 @@
 # Import libraries
+import asyncio
 import base58
-import requests
+import logging
 
 # Import packages
+from collections import OrderedDict
+from typing import Any
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from spl.token.instructions import get_associated_token_address
 
+# Import local packages
+from core.pubkeys import LAMPORTS_PER_SOL
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
 
 # Class 'Wallet'
 class Wallet:
-    """Handles Solana wallet keypair and associated addresses."""
+    """Handles Solana wallet keypair, associated addresses and SOL balance."""
 
-    def __init__(self, private_key: str):
-        """Initialize the wallet from a base58-encoded private key."""
+    def __init__(self, private_key: str, client: Any = None, atacapacity: int = 1024):
+        """Initialize the wallet from a base58-encoded private key, reading the balance through `client`."""
         self._private_key = private_key
         self._keypair = self._load_keypair(private_key)
         self.validkey = self._keypair is not None
+        self.client = client
+        self.hub = client.wshub if client is not None else None
+        self.atacapacity = atacapacity
+        self.lamports: int | None = None
+        self.slot = 0
+        self.updates = 0
+        self._atas: OrderedDict[Pubkey, Pubkey] = OrderedDict()
+        self._subscription: Any = None
+        self._lock = asyncio.Lock()
+        if self.hub is not None:
+            self.hub.on_state(self._on_state)
 
     @property
     def validprikey(self) -> bool:
@@ -37,9 +57,21 @@ class Wallet:
             raise ValueError("Cannot access keypair from an invalid keypair.")
         return self._keypair
 
+    @property
+    def sol(self) -> float | None:
+        """Return the last known balance in SOL, None before it was read."""
+        return self.lamports / LAMPORTS_PER_SOL if self.lamports is not None else None
+
     def get_associated_token_address(self, mint: Pubkey) -> Pubkey:
-        """Return the associated token account address for the given mint."""
-        return get_associated_token_address(self.pubkey, mint)
+        """Return the associated token account address for the given mint, derived once per mint."""
+        ata = self._atas.get(mint)
+        if ata is None:
+            ata = self._atas[mint] = get_associated_token_address(self.pubkey, mint)
+            if len(self._atas) > self.atacapacity:
+                self._atas.popitem(last=False)
+        else:
+            self._atas.move_to_end(mint)
+        return ata
 
     @staticmethod
     def _load_keypair(private_key: str) -> Keypair | None:
@@ -50,30 +82,80 @@ class Wallet:
         except (ValueError, TypeError, AssertionError):
             return None
 
-    def balance(self, rpc_url: str = "https://api.mainnet-beta.solana.com") -> float | None:
+    async def load(self) -> float | None:
         """
-        Retrieve the SOL balance (in SOL) using raw JSON-RPC and solders.pubkey.
+        Read the SOL balance once and follow it with an accountSubscribe on the wallet address.
 
-        Parameters:
-        - rpc_url (str): The RPC endpoint to query
+        Returns:
+        - float | None: Balance in SOL, or None on failure
+        """
+        async with self._lock:
+            if self.lamports is None:
+                await self.refresh()
+            if self.hub is not None and self._subscription is None:
+                try:
+                    self._subscription = await self.hub.subscribe("accountSubscribe", [str(self.pubkey), {"encoding": "base64", "commitment": "confirmed"}], self._on_update)
+                except Exception as e:
+                    logger.warning(f"accountSubscribe failed for the wallet, balance will be read on demand: {e!s}")
+        return self.sol
+
+    async def balance(self) -> float | None:
+        """
+        Return the SOL balance, from memory while the subscription keeps it current.
 
         Returns:
         - float | None: Balance in SOL, or None on failure
         """
+        if self._subscription is not None and self.hub.connected.is_set() and self.lamports is not None:
+            return self.sol
+        return await self.refresh()
+
+    async def refresh(self) -> float | None:
+        """
+        Retrieve the SOL balance with getBalance through the configured RPC.
+
+        Returns:
+        - float | None: Balance in SOL, or None on failure
+        """
+        if self.client is None:
+            raise ValueError("Cannot read the balance of a wallet without a client.")
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getBalance",
-                "params": [str(self.pubkey)]
-            }
-            headers = {"Content-Type": "application/json"}
-            response = requests.post(rpc_url, json=payload, headers=headers, timeout=10)
-            result = response.json()
-
-            if "result" in result and "value" in result["result"]:
-                lamports = result["result"]["value"]
-                return lamports / 1_000_000_000
+            response = await self.client.CallRPC("getBalance", [str(self.pubkey), {"commitment": "confirmed"}])
+            self._store(response["value"], response.get("context", {}).get("slot", 0))
         except Exception as e:
-            print(f"Error fetching balance: {e}")
-        return None
\ No newline at end of file
+            logger.error(f"Error fetching balance: {e!s}")
+            return None
+        return self.sol
+
+    def _store(self, lamports: int, slot: int) -> None:
+        """Replace the balance with a newer read."""
+        if slot < self.slot:
+            return
+        self.lamports = lamports
+        self.slot = slot
+
+    def _on_update(self, result: dict[str, Any]) -> None:
+        """Take the balance from an accountNotification of the wallet."""
+        value = (result or {}).get("value")
+        if not value:
+            return
+        self._store(value["lamports"], result.get("context", {}).get("slot", 0))
+        self.updates += 1
+
+    def _on_state(self, connected: bool) -> None:
+        """Catch up on changes missed while the websocket was down."""
+        if connected and self.lamports is not None:
+            asyncio.ensure_future(self.refresh())
+
+    async def close(self) -> None:
+        """Drop the balance subscription."""
+        if self._subscription is not None:
+            try:
+                await self.hub.unsubscribe(self._subscription)
+            except Exception as e:
+                logger.debug(f"accountUnsubscribe failed for the wallet: {e!s}")
+            self._subscription = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return the balance, its slot and the cached token accounts."""
+        return {"sol": self.sol, "slot": self.slot, "updates": self.updates, "subscribed": self._subscription is not None, "atas": len(self._atas)}
@@ -0,0 +1,256 @@
+# Import libraries
+import asyncio
+import itertools
+import logging
+
+import websockets
+
+# Import packages
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+# Import local packages
+from core import codec
+from core.batch import RPCError
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+
+# Class 'Subscription'
+@dataclass(eq = False)
+class Subscription:
+    """ Websocket subscription kept alive across reconnects """
+
+    # Define 'method'
+    method: str
+
+    # Define 'params'
+    params: list[Any]
+
+    # Define 'callback'
+    callback: Callable[[Any], None]
+
+    # Define 'oneshot'
+    oneshot: bool = False
+
+    # Define 'serverid'
+    serverid: int | None = None
+
+
+# Class 'WebsocketHub'
+class WebsocketHub:
+    """ Single multiplexed websocket connection shared by every subscription """
+
+    # Class initialization
+    def __init__(self, endpoint: str, pinginterval: float = 20.0, requesttimeout: float = 10.0, maxbackoff: float = 30.0):
+        """ Initializer description """
+        self.endpoint = endpoint
+        self.pinginterval = pinginterval
+        self.requesttimeout = requesttimeout
+        self.maxbackoff = maxbackoff
+        self.notifications = 0
+        self.reconnects = 0
+        self.connected = asyncio.Event()
+        self.subscriptions: set[Subscription] = set()
+        self._ids = itertools.count(1)
+        self._byserver: dict[int, Subscription] = {}
+        self._requests: dict[int, asyncio.Future] = {}
+        self._listeners: list[Callable[[bool], None]] = []
+        self._websocket: Any = None
+        self._task: asyncio.Task | None = None
+
+    # Function 'start'
+    def start(self) -> None:
+        """ Start the connection loop if it is not running """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    # Function 'on_state'
+    def on_state(self, callback: Callable[[bool], None]) -> None:
+        """ Register a callback invoked with True on connect and False on disconnect """
+        self._listeners.append(callback)
+
+    # Function '_notify_state'
+    def _notify_state(self, connected: bool) -> None:
+        """ Tell every listener about a connection state change """
+        for callback in self._listeners:
+            try:
+                callback(connected)
+            except Exception as e:
+                logger.error(f"Websocket state callback failed: {e!s}")
+
+    # Function '_run'
+    async def _run(self) -> None:
+        """ Keep the connection open, restoring every subscription after a reconnect """
+        failures = 0
+        while True:
+            try:
+                async with websockets.connect(self.endpoint, ping_interval = self.pinginterval, ping_timeout = self.pinginterval, max_size = None) as websocket:
+                    self._websocket = websocket
+                    reader = asyncio.create_task(self._reader(websocket))
+                    try:
+                        await asyncio.gather(*(self._restore(subscription) for subscription in list(self.subscriptions)))
+                        failures = 0
+                        self.connected.set()
+                        self._notify_state(True)
+                        logger.info(f"Websocket connected with {len(self.subscriptions)} subscription(s)")
+                        await reader
+                    finally:
+                        reader.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Websocket connection lost: {e!s}")
+            finally:
+                self._reset()
+
+            failures += 1
+            self.reconnects += 1
+            await asyncio.sleep(min(0.5 * 2 ** failures, self.maxbackoff))
+
+    # Function '_reset'
+    def _reset(self) -> None:
+        """ Forget server-side state after the connection drops """
+        was_connected = self.connected.is_set()
+        self.connected.clear()
+        self._websocket = None
+        self._byserver.clear()
+        for subscription in self.subscriptions:
+            subscription.serverid = None
+        for future in self._requests.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Websocket connection closed"))
+        self._requests.clear()
+        if was_connected:
+            self._notify_state(False)
+
+    # Function '_reader'
+    async def _reader(self, websocket: Any) -> None:
+        """ Route replies to pending requests and notifications to subscriptions """
+        async for message in websocket:
+            try:
+                self._dispatch(codec.loads(message))
+            except Exception as e:
+                logger.error(f"Failed to handle websocket message: {e!s}")
+
+    # Function '_dispatch'
+    def _dispatch(self, data: dict[str, Any]) -> None:
+        """ Handle a single decoded websocket message """
+        if data.get("id") is not None:
+            future = self._requests.pop(data["id"], None)
+            if future is None or future.done():
+                return
+            if "error" in data:
+                error = data["error"] or {}
+                future.set_exception(RPCError(error.get("code"), error.get("message", "unknown error")))
+            else:
+                future.set_result(data.get("result"))
+            return
+
+        params = data.get("params") or {}
+        subscription = self._byserver.get(params.get("subscription"))
+        if subscription is None:
+            return
+
+        self.notifications += 1
+        if subscription.oneshot:
+            # The node drops one-shot subscriptions after their first notification
+            self._byserver.pop(subscription.serverid, None)
+            self.subscriptions.discard(subscription)
+            subscription.serverid = None
+        subscription.callback(params.get("result"))
+
+    # Function '_request'
+    async def _request(self, method: str, params: list[Any]) -> Any:
+        """ Send a JSON-RPC request over the websocket and wait for its reply """
+        if self._websocket is None:
+            raise ConnectionError("Websocket is not connected")
+
+        requestid = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._requests[requestid] = future
+        try:
+            await self._websocket.send(codec.dumps({"jsonrpc": "2.0", "id": requestid, "method": method, "params": params}))
+            return await asyncio.wait_for(future, self.requesttimeout)
+        finally:
+            self._requests.pop(requestid, None)
+
+    # Function '_activate'
+    async def _activate(self, subscription: Subscription) -> None:
+        """ Register a subscription with the node """
+        serverid = await self._request(subscription.method, subscription.params)
+        if subscription not in self.subscriptions:
+            await self._release(subscription.method, serverid)
+            return
+        subscription.serverid = serverid
+        self._byserver[serverid] = subscription
+
+    # Function '_restore'
+    async def _restore(self, subscription: Subscription) -> None:
+        """ Re-register a subscription after a reconnect, dropping it if the node rejects it """
+        try:
+            await self._activate(subscription)
+        except RPCError as e:
+            self.subscriptions.discard(subscription)
+            logger.error(f"Node rejected {subscription.method}: {e!s}")
+
+    # Function '_release'
+    async def _release(self, method: str, serverid: int) -> None:
+        """ Cancel a server-side subscription, ignoring a dropped connection """
+        try:
+            await self._request(method.replace("Subscribe", "Unsubscribe"), [serverid])
+        except Exception as e:
+            logger.debug(f"Failed to cancel {method} {serverid}: {e!s}")
+
+    # Function 'subscribe'
+    async def subscribe(self, method: str, params: list[Any], callback: Callable[[Any], None], oneshot: bool = False) -> Subscription:
+        """ Subscribe now if connected, otherwise as soon as the connection is (re)established """
+        self.start()
+        subscription = Subscription(method, params, callback, oneshot)
+        self.subscriptions.add(subscription)
+        if self.connected.is_set():
+            try:
+                await self._activate(subscription)
+            except RPCError:
+                self.subscriptions.discard(subscription)
+                raise
+            except Exception as e:
+                logger.debug(f"{method} deferred until reconnect: {e!s}")
+        return subscription
+
+    # Function 'unsubscribe'
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        """ Drop a subscription locally and on the node """
+        self.subscriptions.discard(subscription)
+        serverid = subscription.serverid
+        if serverid is None:
+            return
+
+        subscription.serverid = None
+        self._byserver.pop(serverid, None)
+        if self.connected.is_set():
+            await self._release(subscription.method, serverid)
+
+    # Function 'stats'
+    def stats(self) -> dict[str, Any]:
+        """ Return connection and subscription counters """
+        return {
+            "connected": self.connected.is_set(),
+            "subscriptions": len(self.subscriptions),
+            "notifications": self.notifications,
+            "reconnects": self.reconnects
+        }
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop the connection loop and close the socket """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.subscriptions.clear()
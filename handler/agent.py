@@ -20,8 +20,11 @@ from sqlalchemy.orm import sessionmaker
 # Import local packages
 from core.client import SolanaClient
 from core.curve import BondingCurveHandler
+from core.curve import CurveStateCache
+from core.params import GlobalAccount
 from core.priority import PriorityFeeHandler
 from core.pubkeys import PumpAddresses
+from core.sketch import SlidingQuantileSketch
 from core.wallet import Wallet
 from handler.base import TokenInfo
 from handler.base import TradeResult
@@ -30,6 +33,7 @@ from handler.cleanup import CleanupHandler
 from handler.seller import TokenSeller
 from monitoring.listeners import BlockListener
 from monitoring.listeners import LogsListener
+from monitoring.market import CurveTable
 from utils.models import PumpBase
 from utils.models import PumpTableTrades
 from utils.models import PumpTableWallet
@@ -59,6 +63,14 @@ class PumpAgent:
         initbalance: int = 10,
         maxopentrades: int = 5,
 
+        # Network
+        rpcpoolsize: int = 20,
+        rpcbatchwindow: float = 0.002,
+        rpcendpoints: list[dict] | None = None,
+        rpcbroadcast: bool = False,
+        rpcratelimit: float = 0.0,
+        rpcslowcall: float = 1.0,
+
         # Monitoring
         chainlistener: str = "logs",
         chaininterval: int = 15,
@@ -82,7 +94,6 @@ class PumpAgent:
         buyslippage: float = 0.0,
         sellslippage: float = 0.0,
         fastmode: bool = False,
-        fasttokens: int = 15,
         stoploss: float = 0.0,
         takeprofit: float = 0.0,
         trailprofit: bool = False,
@@ -98,6 +109,7 @@ class PumpAgent:
         priolamports: int = 200_000,
         prioextrafee: float = 0.0,
         priohardcap: int = 200_000,
+        priotarget: int = 0,
 
         # Retries
         maxattempts: int = 3,
@@ -123,29 +135,34 @@ class PumpAgent:
         maxliquidity: int = 5):
         """ Initializer description """
         # Client
-        self.solanaclient = SolanaClient(rpcendpoint)
+        self.solanaclient = SolanaClient(rpcendpoint, poolsize=rpcpoolsize, batchwindow=rpcbatchwindow, rpcendpoints=rpcendpoints, broadcast=rpcbroadcast, wssendpoint=wssendpoint, ratelimit=rpcratelimit, slowcall=rpcslowcall, profilepath=f"logs/{botname}-rpc.json")
 
         # Wallet
-        self.wallet = Wallet(privatekey)
+        self.wallet = Wallet(privatekey, self.solanaclient)
+
+        # Program parameters, read once at startup and followed with accountSubscribe
+        self.globalaccount = GlobalAccount(self.solanaclient)
 
         # Main
         self.botname = botname
         self.sandbox = sandbox
         self.maxopentrades = maxopentrades
         self.liveopentrades: set[str] = set()
-        if self.sandbox is True:
-            self.initbalance = initbalance
-        else:
-            self.initbalance = self.wallet.balance()
+        # A live balance is read in agentstart, without blocking the constructor
+        self.initbalance = initbalance if self.sandbox is True else None
 
         # Monitoring
         chainlistener = chainlistener.lower()
         self.chaininterval = chaininterval
+        self.curvetable: CurveTable | None = None
+        self.feesketch: SlidingQuantileSketch | None = None
         if chainlistener == "logs":
-            self.tokenlistener = LogsListener(wssendpoint, PumpAddresses.PROGRAM, chaininterval)
+            self.curvetable = CurveTable(self.solanaclient, self.globalaccount)
+            self.tokenlistener = LogsListener(wssendpoint, PumpAddresses.PROGRAM, chaininterval, self.curvetable)
             logger.info("Using logsSubscribe listener for token monitoring")
         else:
-            self.tokenlistener = BlockListener(wssendpoint, PumpAddresses.PROGRAM, chaininterval)
+            self.feesketch = SlidingQuantileSketch()
+            self.tokenlistener = BlockListener(wssendpoint, PumpAddresses.PROGRAM, chaininterval, self.feesketch)
             logger.info("Using blockSubscribe listener for token monitoring")
 
         # Filters
@@ -167,7 +184,6 @@ class PumpAgent:
         self.buyslippage = buyslippage
         self.sellslippage = sellslippage
         self.fastmode = fastmode
-        self.fasttokens = fasttokens
         self.stoploss = stoploss                    # Not used
         self.takeprofit = takeprofit                # Not used
         self.trailprofit = trailprofit              # Not used
@@ -179,6 +195,7 @@ class PumpAgent:
 
         # Curve Handler
         self.curvehandler = BondingCurveHandler(self.solanaclient)
+        self.curvecache = CurveStateCache(self.solanaclient, self.curvehandler)
 
         # Priotity
         self.priorityorderfee = PriorityFeeHandler(
@@ -187,7 +204,9 @@ class PumpAgent:
             enable_fixed_fee = priofixed,
             fixed_fee = priolamports,
             extra_fee = prioextrafee,
-            hard_cap = priohardcap
+            hard_cap = priohardcap,
+            block_fees = self.feesketch,
+            target_slots = priotarget
         )
 
         # Retries
@@ -229,9 +248,10 @@ class PumpAgent:
             self.buyamount,
             self.buyslippage,
             self.maxattempts,
-            self.fasttokens,
             self.fastmode,
-            self.sandbox)
+            self.sandbox,
+            self.globalaccount,
+            self.curvetable)
 
         # Seller
         self.seller = TokenSeller(
@@ -241,7 +261,8 @@ class PumpAgent:
             self.priorityorderfee,
             self.sellslippage,
             self.maxattempts,
-            self.sandbox)
+            self.sandbox,
+            self.globalaccount)
 
         # === Define 'database' path ===
         datapathdir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -265,6 +286,12 @@ class PumpAgent:
         self.WalletSession = sessionmaker(bind=self.dbwalletengine)
 
         # === Update Wallet Balance ===
+        if self.initbalance is not None:
+            self.initwallet()
+
+    # Function 'initwallet'
+    def initwallet(self) -> None:
+        """ Store the starting balance unless the wallet database already has one """
         sessdbwallet = self.WalletSession()
         try:
             balance = sessdbwallet.query(PumpTableWallet).get(1)
@@ -468,17 +495,22 @@ class PumpAgent:
             entry_price = buyresult.price
             start_time = datetime.now().timestamp()
             timeout = self.tokenidleshort
-            interval = 5  # seconds
+            interval = 5  # seconds, logging period and polling fallback without notifications
+            version = 0
+            logged = 0.0
 
+            await self.curvecache.track(tokendata.boundingcurve)
             while True:
 
-                await asyncio.sleep(interval)
-
-                curvestate = await self.curvehandler.get_curve_state(tokendata.boundingcurve)
+                # Wake up on every curve update, or at the latest when the interval or timeout expires
+                remaining = timeout - (datetime.now().timestamp() - start_time)
+                curvestate, version = await self.curvecache.wait(tokendata.boundingcurve, version, max(0.0, min(interval, remaining)))
                 current_price = curvestate.calculate_price()
                 variation = ((current_price - entry_price) / entry_price) * 100
 
-                logger.critical(f"[{tokendata.symbol}] Price variation: {variation:.2f}%")
+                if monotonic() - logged >= interval:
+                    logger.critical(f"[{tokendata.symbol}] Price variation: {variation:.2f}%")
+                    logged = monotonic()
 
                 if variation <= -self.stoploss:
                     logger.critical(f"S/L triggered for token {tokendata.mint} ({variation:.2f}%)")
@@ -499,6 +531,9 @@ class PumpAgent:
         except Exception as e:
             logger.error(f"Error during SL/TP monitoring for {tokendata.symbol}: {e!s}")
 
+        finally:
+            await self.curvecache.release(tokendata.boundingcurve)
+
     # Function 'handlefailedorder'
     async def handlefailedorder(self, tokendata: TokenInfo, buyresult: TradeResult) -> None:
         """ Function description """
@@ -552,6 +587,16 @@ class PumpAgent:
         for key in old_keys:
             self.tokentimestamps.pop(key, None)
 
+        if self.curvetable is not None:
+            await self.curvetable.close()
+            logger.info(f"Curve table: {self.curvetable.stats()}")
+        if self.feesketch is not None:
+            logger.info(f"Block fee sketch: {self.feesketch.stats()}")
+        await self.globalaccount.close()
+        await self.wallet.close()
+        await self.priorityorderfee.close()
+        if self.priorityorderfee.optimizer is not None:
+            logger.info(f"Landing fee optimizer: {self.priorityorderfee.optimizer.stats()}")
         await self.solanaclient.close()
 
     # Function 'TokenQueue'
@@ -606,11 +651,27 @@ class PumpAgent:
         logger.info(f"Max. Token Age: {self.tokenmaxage} seconds")
 
         try:
-            healthresp = await self.solanaclient.GetHealth()
-            logger.info(f"RPC warm-up successful (getHealth passed: {healthresp})")
+            healthresp = await self.solanaclient.warmup()
+            logger.info(f"RPC warm-up successful (getHealth passed: {healthresp}, pool: {self.solanaclient.pool_stats()})")
         except Exception as e:
             logger.warning(f"RPC warm-up failed: {e!s}")
 
+        try:
+            params = await self.globalaccount.load()
+            logger.info(f"Global account loaded (fee: {params.fee_basis_points} bps, recipient: {params.fee_recipient})")
+        except Exception as e:
+            logger.warning(f"Global account read failed, using mainnet defaults: {e!s}")
+
+        if self.sandbox is False:
+            self.initbalance = await self.wallet.load()
+            if self.initbalance is not None:
+                logger.info(f"Wallet balance: {self.initbalance} SOL")
+                self.initwallet()
+
+        if self.curvetable is not None:
+            self.curvetable.start()
+        self.priorityorderfee.start()
+
         try:
             if not self.nostopping:
                 logger.info("Running in single token mode - will process one token and exit")
@@ -15,15 +15,19 @@ from typing import Final
 # Import local packages
 from core.client import SolanaClient
 from core.curve import BondingCurveHandler
+from core.params import DEFAULT_GLOBAL
+from core.params import GlobalAccount
 from core.priority import PriorityFeeHandler
 from core.pubkeys import LAMPORTS_PER_SOL
 from core.pubkeys import PumpAddresses
 from core.pubkeys import SystemAddresses
 from core.pubkeys import TOKEN_DECIMALS
+from core.quote import quote_buy
 from core.wallet import Wallet
 from handler.base import TokenInfo
 from handler.base import Trader
 from handler.base import TradeResult
+from monitoring.market import CurveTable
 
 # Define 'logger'
 logger = logging.getLogger(__name__)
@@ -46,9 +50,10 @@ class TokenBuyer(Trader):
         amount: float,
         slippage: float = 0.01,
         max_retries: int = 5,
-        extreme_fast_token_amount: int = 0,
         extreme_fast_mode: bool = False,
-        sandbox: bool = False):
+        sandbox: bool = False,
+        params: GlobalAccount | None = None,
+        curvetable: CurveTable | None = None):
         """ Initializer description """
 
         # Validate wallet object
@@ -64,31 +69,37 @@ class TokenBuyer(Trader):
         self.slippage = slippage
         self.max_retries = max_retries
         self.extreme_fast_mode = extreme_fast_mode
-        self.extreme_fast_token_amount = extreme_fast_token_amount
         self.sandbox = sandbox
+        self.params = params
+        self.curvetable = curvetable
 
     # Function 'execute'
     async def execute(self, token_info: TokenInfo, *args, **kwargs) -> TradeResult:
         """ Function description """
         try:
             amount_lamports = int(self.amount * LAMPORTS_PER_SOL)
+            params = self.params.get() if self.params is not None else DEFAULT_GLOBAL
             if self.extreme_fast_mode:
-                token_amount = self.extreme_fast_token_amount
-                token_price_sol = self.amount / token_amount
+                # No read on the critical path: the curve replayed from the logs, or the initial curve of a token nobody traded yet
+                curve_state = self.curvetable.get(token_info.mint) if self.curvetable is not None else None
+                curve_state = curve_state or params.initial_curve()
             else:
                 curve_state = await self.curve_manager.get_curve_state(token_info.boundingcurve)
-                token_price_sol = curve_state.calculate_price()
-                token_amount = self.amount / token_price_sol
 
-            max_amount_lamports = int(amount_lamports * (1 + self.slippage))
-            totalcost = (max_amount_lamports / LAMPORTS_PER_SOL)
+            quote = quote_buy(curve_state, amount_lamports, params.fee_basis_points)
+            token_amount_raw = quote.tokens
+            token_price_sol = quote.price
+            max_amount_lamports = quote.max_cost(self.slippage)
+            totalcost = quote.sol
+            logger.info(f"Quoted {quote.amount:.6f} tokens for {quote.sol:.6f} SOL (fee {quote.fee / LAMPORTS_PER_SOL:.6f} SOL, impact {quote.impact:.2%})")
 
+            token_amount = token_amount_raw / 10**TOKEN_DECIMALS
             if self.sandbox is False:
                 associated_token_account = self.wallet.get_associated_token_address(token_info.mint)
-                tx_signature = await self._send_buy_transaction(token_info, associated_token_account, token_amount, max_amount_lamports)
+                tx_signature = await self._send_buy_transaction(token_info, associated_token_account, token_amount_raw, max_amount_lamports, params.fee_recipient)
 
             logger.info(f"Buying {token_amount:.6f} tokens at {token_price_sol:.8f} SOL per token")
-            logger.info(f"Total cost: {self.amount:.6f} SOL (max: {max_amount_lamports / LAMPORTS_PER_SOL:.6f} SOL)")
+            logger.info(f"Total cost: {totalcost:.6f} SOL (max: {max_amount_lamports / LAMPORTS_PER_SOL:.6f} SOL)")
 
             if self.sandbox is True:
                 tx_signature = base58.b58encode(os.urandom(64)).decode('utf-8')
@@ -108,11 +119,11 @@ class TokenBuyer(Trader):
             return TradeResult(success=False, error_message=str(e))
 
     # Function '_send_buy_transaction'
-    async def _send_buy_transaction(self, token_info: TokenInfo, associated_token_account: Pubkey, token_amount: float, max_amount_lamports: int) -> str:
+    async def _send_buy_transaction(self, token_info: TokenInfo, associated_token_account: Pubkey, token_amount_raw: int, max_amount_lamports: int, fee_recipient: Pubkey = PumpAddresses.FEE) -> str:
         """ Function description """
         accounts = [
             AccountMeta(pubkey = PumpAddresses.GLOBAL, is_signer = False, is_writable=False),
-            AccountMeta(pubkey = PumpAddresses.FEE, is_signer = False, is_writable=True),
+            AccountMeta(pubkey = fee_recipient, is_signer = False, is_writable=True),
             AccountMeta(pubkey = token_info.mint, is_signer = False, is_writable=False),
             AccountMeta(pubkey = token_info.boundingcurve, is_signer = False, is_writable=True),
             AccountMeta(pubkey = token_info.basecurve, is_signer = False, is_writable=True),
@@ -126,12 +137,12 @@ class TokenBuyer(Trader):
         ]
 
         idempotent_ata_ix = create_idempotent_associated_token_account(self.wallet.pubkey, self.wallet.pubkey, token_info.mint, SystemAddresses.TOKEN_PROGRAM)
-        token_amount_raw = int(token_amount * 10**TOKEN_DECIMALS)
         data = (EXPECTED_DISCRIMINATOR + struct.pack("<Q", token_amount_raw) + struct.pack("<Q", max_amount_lamports))
         buy_ix = Instruction(PumpAddresses.PROGRAM, data, accounts)
 
         try:
-            return await self.client.build_and_send_transaction([idempotent_ata_ix, buy_ix], self.wallet.keypair, skip_preflight=True, max_retries=self.max_retries, priority_fee=await self.priority_fee_manager.calculate_priority_fee(self._get_relevant_accounts(token_info)))
+            # An expired buy is not re-signed, the curve has moved on by the time its blockhash runs out
+            return await self.client.build_and_send_transaction([idempotent_ata_ix, buy_ix], self.wallet.keypair, skip_preflight=True, max_retries=self.max_retries, priority_fee=await self.priority_fee_manager.calculate_priority_fee(self._get_relevant_accounts(token_info)), label="buy")
         except Exception as e:
             logger.error(f"Buy transaction failed: {e!s}")
             raise
\ No newline at end of file
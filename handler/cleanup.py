@@ -12,6 +12,7 @@ from typing import List
 
 # Import local packages
 from core.client import SolanaClient
+from core.limiter import priority
 from core.priority import PriorityFeeHandler
 from core.pubkeys import SystemAddresses
 from core.wallet import Wallet
@@ -76,7 +77,7 @@ class AccountCleaner:
             instructions.append(close_ix)
 
             if instructions:
-                tx_sig = await self.client.build_and_send_transaction(instructions, self.wallet.keypair, skip_preflight=True, priority_fee=priority_fee)
+                tx_sig = await self.client.build_and_send_transaction(instructions, self.wallet.keypair, skip_preflight=True, priority_fee=priority_fee, resigns=1, label="cleanup")
                 await self.client.confirm_transaction(tx_sig)
                 logger.info(f"Closed successfully: {ata}")
 
@@ -114,7 +115,8 @@ class CleanupHandler:
             use_priority_fee=self.use_priority_fee,
             force_burn=self.force_burn
         )
-        await cleaner.cleanup_ata(mint)
+        with priority("cleanup"):
+            await cleaner.cleanup_ata(mint)
 
     # Function 'should_cleanup_after_failure'
     def should_cleanup_after_failure(self) -> bool:
@@ -157,8 +159,9 @@ class CleanupHandler:
                 use_priority_fee=self.use_priority_fee,
                 force_burn=self.force_burn
             )
-            for mint in mints:
-                await cleaner.cleanup_ata(mint)
+            with priority("cleanup"):
+                for mint in mints:
+                    await cleaner.cleanup_ata(mint)
 
 
 
@@ -18,11 +18,14 @@ from sqlalchemy.orm import sessionmaker
 # Import local packages
 from core.client import SolanaClient
 from core.curve import BondingCurveHandler
+from core.params import DEFAULT_GLOBAL
+from core.params import GlobalAccount
 from core.priority import PriorityFeeHandler
 from core.pubkeys import LAMPORTS_PER_SOL
 from core.pubkeys import PumpAddresses
 from core.pubkeys import SystemAddresses
 from core.pubkeys import TOKEN_DECIMALS
+from core.quote import quote_sell
 from core.wallet import Wallet
 from handler.base import TokenInfo
 from handler.base import Trader
@@ -49,7 +52,8 @@ class TokenSeller(Trader):
          priority_fee_manager: PriorityFeeHandler,
          slippage: float = 0.25,
          max_retries: int = 5,
-         sandbox: bool = False):
+         sandbox: bool = False,
+         params: GlobalAccount | None = None):
         """ Initializer description """
         self.client = client
         self.wallet = wallet
@@ -58,6 +62,7 @@ class TokenSeller(Trader):
         self.slippage = slippage
         self.max_retries = max_retries
         self.sandbox = sandbox
+        self.params = params
 
         # === Trades Database ===
         datapathdir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -92,32 +97,33 @@ class TokenSeller(Trader):
             if self.sandbox is False:
                 token_balance = await self.client.get_token_account_balance(associated_token_account)
             else:
-                token_balance = await self._get_token_balance_from_db(str(token_info.mint))
+                # The trades database keeps the decimal amount bought
+                token_balance_decimal = await self._get_token_balance_from_db(str(token_info.mint))
+                token_balance = int(token_balance_decimal * 10 ** TOKEN_DECIMALS) if token_balance_decimal is not None else 0
 
-            token_balance_decimal = token_balance / 10 ** TOKEN_DECIMALS
-            logger.info(f"Token balance: {token_balance_decimal}")
+            logger.info(f"Token balance: {token_balance / 10 ** TOKEN_DECIMALS}")
 
             if token_balance == 0:
                 return TradeResult(success=False, error_message="No tokens to sell")
 
             curve_state = await self.curve_manager.get_curve_state(token_info.boundingcurve)
-            token_price_sol = curve_state.calculate_price()
-            expected_sol_output = float(token_balance_decimal) * float(token_price_sol)
-            min_sol_output = int((expected_sol_output * (1 - self.slippage)) * LAMPORTS_PER_SOL)
+            params = self.params.get() if self.params is not None else DEFAULT_GLOBAL
+            quote = quote_sell(curve_state, token_balance, params.fee_basis_points)
+            min_sol_output = quote.min_output(self.slippage)
 
-            logger.info(f"Selling {token_balance} tokens at ~{token_price_sol:.8f} SOL each")
-            logger.info(f"Expected SOL output: {expected_sol_output:.8f} | Min with slippage: {min_sol_output / LAMPORTS_PER_SOL:.8f} SOL")
+            logger.info(f"Selling {token_balance} tokens at ~{quote.price:.8f} SOL each (spot {quote.spot:.8f}, impact {quote.impact:.2%})")
+            logger.info(f"Expected SOL output: {quote.sol:.8f} | Min with slippage: {min_sol_output / LAMPORTS_PER_SOL:.8f} SOL")
 
             if self.sandbox is True:
                 tx_signature = base58.b58encode(os.urandom(64)).decode("utf-8")
                 logger.info(f"Fake sell confirmed (sandbox mode): {tx_signature}")
                 await asyncio.sleep(2)
-                return TradeResult(success=True, tx_signature=tx_signature, amount=token_balance, price=token_price_sol)
+                return TradeResult(success=True, tx_signature=tx_signature, amount=quote.amount, total=quote.sol, price=quote.price)
             else:
-                tx_signature = await self._send_sell_transaction(token_info, associated_token_account, token_balance, min_sol_output)
+                tx_signature = await self._send_sell_transaction(token_info, associated_token_account, token_balance, min_sol_output, params.fee_recipient)
                 success = await self.client.confirm_transaction(tx_signature)
                 if success:
-                    return TradeResult(success=True, tx_signature=tx_signature, amount=token_balance_decimal, price=token_price_sol)
+                    return TradeResult(success=True, tx_signature=tx_signature, amount=quote.amount, total=quote.sol, price=quote.price)
                 return TradeResult(success=False, error_message="Transaction failed to confirm")
 
         except Exception as e:
@@ -125,11 +131,11 @@ class TokenSeller(Trader):
             return TradeResult(success=False, error_message=str(e))
 
     # Function '_send_sell_transaction'
-    async def _send_sell_transaction(self, token_info: TokenInfo, associated_token_account: Pubkey, token_amount: int, min_sol_output: int) -> str:
+    async def _send_sell_transaction(self, token_info: TokenInfo, associated_token_account: Pubkey, token_amount: int, min_sol_output: int, fee_recipient: Pubkey = PumpAddresses.FEE) -> str:
         """ Function description """
         accounts = [
             AccountMeta(pubkey = PumpAddresses.GLOBAL, is_signer = False, is_writable = False),
-            AccountMeta(pubkey = PumpAddresses.FEE, is_signer = False, is_writable = True),
+            AccountMeta(pubkey = fee_recipient, is_signer = False, is_writable = True),
             AccountMeta(pubkey = token_info.mint, is_signer = False, is_writable = False),
             AccountMeta(pubkey = token_info.boundingcurve, is_signer = False, is_writable = True),
             AccountMeta(pubkey = token_info.basecurve,is_signer = False, is_writable = True),
@@ -146,7 +152,8 @@ class TokenSeller(Trader):
         sell_ix = Instruction(PumpAddresses.PROGRAM, data, accounts)
 
         try:
-            return await self.client.build_and_send_transaction([sell_ix], self.wallet.keypair, skip_preflight=True, max_retries=self.max_retries, priority_fee=await self.priority_fee_manager.calculate_priority_fee(self._get_relevant_accounts(token_info)))
+            # An expired sell is re-signed with a fresh blockhash, its minimum output still bounds the price
+            return await self.client.build_and_send_transaction([sell_ix], self.wallet.keypair, skip_preflight=True, max_retries=self.max_retries, priority_fee=await self.priority_fee_manager.calculate_priority_fee(self._get_relevant_accounts(token_info)), resigns=self.max_retries, label="sell")
         except Exception as e:
             logger.error(f"Sell transaction failed: {str(e)}")
             raise
\ No newline at end of file
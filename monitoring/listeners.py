@@ -1,6 +1,5 @@
 # Import libraries
 import asyncio
-import json
 import logging
 
 import requests
@@ -14,7 +13,10 @@ from datetime import UTC
 from solders.pubkey import Pubkey
 
 # Import local packages
+from core import codec
+from core.sketch import SlidingQuantileSketch
 from monitoring.base import BaseTokenListener
+from monitoring.market import CurveTable
 from monitoring.processor import LogsProcessor
 from monitoring.processor import PumpProcessor
 from handler.base import TokenInfo
@@ -30,11 +32,12 @@ class BlockListener(BaseTokenListener):
     """ Class description """
 
     # Class initialization
-    def __init__(self, wss_endpoint: str, pump_program: Pubkey, chaininterval: int):
+    def __init__(self, wss_endpoint: str, pump_program: Pubkey, chaininterval: int, feesketch: SlidingQuantileSketch | None = None):
         """ Initializer description """
         self.wss_endpoint = wss_endpoint
         self.pump_program = pump_program
         self.chaininterval = chaininterval
+        self.feesketch = feesketch
         self.event_processor = PumpProcessor(pump_program)
         self.ping_interval = 20
 
@@ -197,7 +200,7 @@ class BlockListener(BaseTokenListener):
     # Function '_subscribe_to_program'
     async def _subscribe_to_program(self, websocket) -> None:
         """ Function description """
-        subscription_message = json.dumps(
+        subscription_message = codec.dumps(
             {
                 "jsonrpc": "2.0",
                 "id": 1,
@@ -241,31 +244,34 @@ class BlockListener(BaseTokenListener):
         """ Function description """
         try:
             response = await asyncio.wait_for(websocket.recv(), timeout=30)
-            data = json.loads(response)
-
-            if "method" not in data or data["method"] != "blockNotification":
-                return None
-
-            if "params" not in data or "result" not in data["params"]:
+            if not codec.mentions(response, "blockNotification"):
                 return None
 
-            block_data = data["params"]["result"]
-            if "value" not in block_data or "block" not in block_data["value"]:
+            block = codec.decode_block(response)
+            if block is None:
                 return None
 
-            block = block_data["value"]["block"]
-            if "transactions" not in block:
+            if self.feesketch is None:
+                for transaction in block.transactions:
+                    token_info = self.event_processor.process_transaction(transaction)
+                    if token_info:
+                        return token_info
                 return None
 
-            for tx in block["transactions"]:
-                if not isinstance(tx, dict) or "transaction" not in tx:
+            # Every pump transaction of the block feeds the fee sketch, not only those before the first Create
+            token_info = None
+            self.feesketch.advance(block.slot)
+            for data in block.transactions:
+                transaction = self.event_processor.decode_transaction(data)
+                if transaction is None:
                     continue
-
-                token_info = self.event_processor.process_transaction(
-                    tx["transaction"][0]
-                )
-                if token_info:
-                    return token_info
+                price = self.event_processor.compute_unit_price(transaction)
+                if price is None:
+                    continue
+                self.feesketch.add(block.slot, price)
+                if token_info is None:
+                    token_info = self.event_processor.process_transaction(transaction)
+            return token_info
 
         except TimeoutError:
             logger.debug("No data received for 30 seconds")
@@ -283,11 +289,12 @@ class LogsListener(BaseTokenListener):
     """ Class description """
 
     # Class initialization
-    def __init__(self, wss_endpoint: str, pump_program: Pubkey, chaininterval: int):
+    def __init__(self, wss_endpoint: str, pump_program: Pubkey, chaininterval: int, curvetable: CurveTable | None = None):
         """ Initializer description """
         self.wss_endpoint = wss_endpoint
         self.pump_program = pump_program
         self.chaininterval = chaininterval
+        self.curvetable = curvetable
         self.event_processor = LogsProcessor(pump_program)
         self.ping_interval = 20
 
@@ -364,9 +371,18 @@ class LogsListener(BaseTokenListener):
                     await self._subscribe_to_logs(websocket)
                     ping_task = asyncio.create_task(self._ping_loop(websocket))
 
+                    # With a curve table, trades keep being applied while a detected token is screened
+                    tokens: asyncio.Queue = asyncio.Queue()
+                    reader_task = asyncio.create_task(self._read_logs(websocket, tokens)) if self.curvetable is not None else None
+
                     try:
                         while True:
-                            token_info = await self._wait_for_token_creation(websocket)
+                            if reader_task is None:
+                                token_info = await self._wait_for_token_creation(websocket)
+                            else:
+                                token_info = await tokens.get()
+                                if isinstance(token_info, Exception):
+                                    raise token_info
                             if not token_info:
                                 continue
 
@@ -382,6 +398,13 @@ class LogsListener(BaseTokenListener):
                                 token_info.volume = marketinfo["volume"]
                                 token_info.marketcap = marketinfo["marketcap"]
 
+                            # The replayed curve is fresher than the API and known even when the API fails
+                            localcurve = self.curvetable.entry(token_info.mint) if self.curvetable is not None else None
+                            if localcurve is not None:
+                                token_info.liquidity = localcurve.liquidity
+                                token_info.marketcap = localcurve.marketcap
+
+                            if marketinfo or localcurve is not None:
                                 if float(token_info.liquidity) <= minliquidity:
                                     logger.warning(f"Skipping token {token_info.symbol} - Minimum L/P of {minliquidity} SOL not reached")
                                     continue
@@ -441,6 +464,9 @@ class LogsListener(BaseTokenListener):
                     except websockets.exceptions.ConnectionClosed:
                         logger.warning("WebSocket connection closed. Reconnecting...")
                         ping_task.cancel()
+                    finally:
+                        if reader_task is not None:
+                            reader_task.cancel()
 
             except Exception as e:
                 logger.error(f"WebSocket connection error: {str(e)}")
@@ -450,7 +476,7 @@ class LogsListener(BaseTokenListener):
     # Function '_subscribe_to_logs'
     async def _subscribe_to_logs(self, websocket) -> None:
         """ Function description """
-        subscription_message = json.dumps(
+        subscription_message = codec.dumps(
             {
                 "jsonrpc": "2.0",
                 "id": 1,
@@ -465,7 +491,7 @@ class LogsListener(BaseTokenListener):
         await websocket.send(subscription_message)
         logger.info(f"Subscribed to logs mentioning program: {self.pump_program}")
         response = await websocket.recv()
-        response_data = json.loads(response)
+        response_data = codec.loads(response)
 
         if "result" in response_data:
             logger.info(f"Subscription confirmed with ID: {response_data['result']}")
@@ -490,20 +516,42 @@ class LogsListener(BaseTokenListener):
         except Exception as e:
             logger.error(f"Ping error: {str(e)}")
 
+    # Function '_read_logs'
+    async def _read_logs(self, websocket, tokens: asyncio.Queue) -> None:
+        """ Apply every trade and queue every created token as notifications arrive """
+        try:
+            while True:
+                token_info = await self._wait_for_token_creation(websocket)
+                if token_info:
+                    tokens.put_nowait(token_info)
+        except websockets.exceptions.ConnectionClosed as e:
+            tokens.put_nowait(e)
+
     # Function '_wait_for_token_creation'
     async def _wait_for_token_creation(self, websocket) -> TokenInfo | None:
         """ Function description """
         try:
             response = await asyncio.wait_for(websocket.recv(), timeout=30)
-            data = json.loads(response)
 
-            if "method" not in data or data["method"] != "logsNotification":
+            # Buys and sells make up most notifications, only Create logs are worth parsing without a curve table
+            if self.curvetable is None:
+                if not codec.mentions(response, "logsNotification", "Program log: Instruction: Create"):
+                    return None
+            elif not codec.mentions(response, "logsNotification", "Program data:"):
+                return None
+
+            event = codec.decode_logs(response)
+            if event is None:
                 return None
 
-            log_data = data["params"]["result"]["value"]
-            logs = log_data.get("logs", [])
-            signature = log_data.get("signature", "unknown")
-            return self.event_processor.process_program_logs(logs, signature)
+            # Events of a failed transaction were rolled back with it
+            if self.curvetable is not None and event.err is None:
+                self.curvetable.apply(self.event_processor.process_trade_logs(event.logs, event.slot))
+
+            token_info = self.event_processor.process_program_logs(event.logs, event.signature)
+            if token_info is not None and self.curvetable is not None:
+                self.curvetable.register(token_info.mint, token_info.boundingcurve, event.slot)
+            return token_info
 
         except asyncio.TimeoutError:
             logger.debug("No data received for 30 seconds")
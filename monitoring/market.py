@@ -0,0 +1,258 @@
+# Import libraries
+import asyncio
+import base64
+import logging
+import time
+
+# Import packages
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Final
+from solders.pubkey import Pubkey
+
+# Import local packages
+from core.curve import BondingCurveState
+from core.curve import CURVE_STATE_SIZE
+from core.params import DEFAULT_GLOBAL
+from core.params import GlobalAccount
+from core.pubkeys import LAMPORTS_PER_SOL
+from core.pubkeys import PumpAddresses
+from core.pubkeys import TOKEN_DECIMALS
+from monitoring.processor import TradeEvent
+
+# Define 'logger'
+logger = logging.getLogger(__name__)
+
+# Define 'MAX_MULTIPLE_ACCOUNTS'
+MAX_MULTIPLE_ACCOUNTS: Final[int] = 100
+
+
+# Class 'MarketCurve'
+@dataclass(slots = True)
+class MarketCurve:
+    """ Local state of one token's bonding curve """
+
+    # Define 'mint'
+    mint: Pubkey
+
+    # Define 'state'
+    state: BondingCurveState
+
+    # Define 'curve'
+    # Bonding curve account, derived from the mint when the Create event was not seen
+    curve: Pubkey | None = None
+
+    # Define 'slot'
+    # Slot of the last event or on-chain read applied
+    slot: int = 0
+
+    # Define 'synced'
+    # True when the state was read from the chain at `slot` rather than replayed from events
+    synced: bool = False
+
+    # Define 'trades'
+    trades: int = 0
+
+    # Define 'volume'
+    # Lamports traded through the curve since it entered the table
+    volume: int = 0
+
+    # Define 'created'
+    created: float = field(default_factory = time.time)
+
+    # Define 'updated'
+    updated: float = field(default_factory = time.monotonic)
+
+    # Function 'price'
+    @property
+    def price(self) -> float:
+        """ Token price in SOL """
+        return self.state.calculate_price()
+
+    # Function 'marketcap'
+    @property
+    def marketcap(self) -> float:
+        """ Market capitalization in SOL """
+        return self.price * self.state.token_total_supply / 10**TOKEN_DECIMALS
+
+    # Function 'liquidity'
+    @property
+    def liquidity(self) -> float:
+        """ SOL deposited in the curve """
+        return self.state.real_sol_reserves / LAMPORTS_PER_SOL
+
+
+# Class 'CurveTable'
+class CurveTable:
+    """ Bonding curves of every live token, replayed from TradeEvents and reconciled against the chain """
+
+    # Class initialization
+    def __init__(self, client: Any, params: GlobalAccount | None = None, interval: float = 10.0, batch: int = MAX_MULTIPLE_ACCOUNTS, capacity: int = 5000):
+        """ Initializer description """
+        self.client = client
+        self.params = params
+        self.interval = interval
+        self.batch = batch
+        self.capacity = capacity
+        self.curves: OrderedDict[Pubkey, MarketCurve] = OrderedDict()
+        self.counts = {"applied": 0, "stale": 0, "reconciled": 0, "drifted": 0, "evicted": 0}
+        self._dirty: OrderedDict[Pubkey, None] = OrderedDict()
+        self._task: asyncio.Task | None = None
+
+    # Function 'register'
+    def register(self, mint: Pubkey, curve: Pubkey | None = None, slot: int = 0) -> MarketCurve:
+        """ Add a token at its initial reserves, or attach the curve address to one already traded """
+        entry = self.curves.get(mint)
+        if entry is None:
+            entry = self._insert(mint, slot)
+        if curve is not None:
+            entry.curve = curve
+        return entry
+
+    # Function 'apply'
+    def apply(self, events: list[TradeEvent]) -> int:
+        """ Apply trade events in slot order, dropping those older than the state they would replace """
+        applied = 0
+        for event in events:
+            entry = self.curves.get(event.mint)
+            if entry is None:
+                entry = self._insert(event.mint, event.slot)
+            elif event.slot < entry.slot or (event.slot == entry.slot and entry.synced):
+                self.counts["stale"] += 1
+                continue
+
+            state = entry.state
+            state.virtual_sol_reserves = event.virtual_sol_reserves
+            state.virtual_token_reserves = event.virtual_token_reserves
+            state.real_sol_reserves = event.real_sol_reserves
+            state.real_token_reserves = event.real_token_reserves
+            state.complete = event.real_token_reserves == 0
+            entry.slot = event.slot
+            entry.synced = False
+            entry.trades += 1
+            entry.volume += event.sol_amount
+            entry.updated = time.monotonic()
+            self.curves.move_to_end(event.mint)
+            self._dirty[event.mint] = None
+            self._dirty.move_to_end(event.mint)
+            applied += 1
+
+        self.counts["applied"] += applied
+        return applied
+
+    # Function '_insert'
+    def _insert(self, mint: Pubkey, slot: int) -> MarketCurve:
+        """ Create an entry, evicting the least recently traded curve when the table is full """
+        while len(self.curves) >= self.capacity:
+            evicted, _ = self.curves.popitem(last = False)
+            self._dirty.pop(evicted, None)
+            self.counts["evicted"] += 1
+        # A created token starts at the initial reserves of the Global account until its first trade
+        initial = (self.params.get() if self.params is not None else DEFAULT_GLOBAL).initial_curve()
+        entry = self.curves[mint] = MarketCurve(mint, initial, slot = slot)
+        return entry
+
+    # Function 'entry'
+    def entry(self, mint: Pubkey) -> MarketCurve | None:
+        """ Return the local entry of a token, None if it was never seen """
+        return self.curves.get(mint)
+
+    # Function 'get'
+    def get(self, mint: Pubkey) -> BondingCurveState | None:
+        """ Return the local curve state of a token without a round trip """
+        entry = self.curves.get(mint)
+        return entry.state if entry is not None else None
+
+    # Function 'price'
+    def price(self, mint: Pubkey) -> float | None:
+        """ Token price in SOL, None if the token is unknown """
+        entry = self.curves.get(mint)
+        return entry.price if entry is not None else None
+
+    # Function 'marketcap'
+    def marketcap(self, mint: Pubkey) -> float | None:
+        """ Market capitalization in SOL, None if the token is unknown """
+        entry = self.curves.get(mint)
+        return entry.marketcap if entry is not None else None
+
+    # Function 'liquidity'
+    def liquidity(self, mint: Pubkey) -> float | None:
+        """ SOL deposited in the curve, None if the token is unknown """
+        entry = self.curves.get(mint)
+        return entry.liquidity if entry is not None else None
+
+    # Function 'reconcile'
+    async def reconcile(self) -> int:
+        """ Read the most recently traded curves from the chain and replace replayed states that drifted """
+        mints = list(reversed(self._dirty))[:self.batch]
+        if not mints:
+            return 0
+
+        curves = [self._curve(mint) for mint in mints]
+        config = {"encoding": "base64", "commitment": "processed", "dataSlice": {"offset": 0, "length": CURVE_STATE_SIZE}}
+        chunks = [range(start, min(start + MAX_MULTIPLE_ACCOUNTS, len(mints))) for start in range(0, len(mints), MAX_MULTIPLE_ACCOUNTS)]
+        responses = await asyncio.gather(*(self.client.CallRPC("getMultipleAccounts", [[str(curves[index]) for index in chunk], config], priority = "cleanup") for chunk in chunks))
+
+        reconciled = 0
+        for chunk, response in zip(chunks, responses):
+            slot = response.get("context", {}).get("slot", 0)
+            for index, value in zip(chunk, response["value"]):
+                entry = self.curves.get(mints[index])
+                if entry is None or not value or slot < entry.slot:
+                    continue
+                try:
+                    state = BondingCurveState(base64.b64decode(value["data"][0]))
+                except ValueError as e:
+                    logger.debug(f"Invalid curve account for {mints[index]}: {e!s}")
+                    continue
+
+                if any(getattr(state, name) != getattr(entry.state, name) for name in ("virtual_sol_reserves", "virtual_token_reserves", "real_sol_reserves", "real_token_reserves")):
+                    self.counts["drifted"] += 1
+                    logger.debug(f"Replayed curve of {mints[index]} drifted from the chain at slot {slot}")
+                entry.state.assign(state)
+                entry.slot = slot
+                entry.synced = True
+                self._dirty.pop(mints[index], None)
+                reconciled += 1
+
+        self.counts["reconciled"] += reconciled
+        return reconciled
+
+    # Function '_curve'
+    def _curve(self, mint: Pubkey) -> Pubkey:
+        """ Bonding curve account of a token, derived once from its mint """
+        entry = self.curves[mint]
+        if entry.curve is None:
+            entry.curve, _ = Pubkey.find_program_address([b"bonding-curve", bytes(mint)], PumpAddresses.PROGRAM)
+        return entry.curve
+
+    # Function 'start'
+    def start(self) -> None:
+        """ Start periodic reconciliation """
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._loop())
+
+    # Function '_loop'
+    async def _loop(self) -> None:
+        """ Reconcile every interval until closed """
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.warning(f"Curve reconciliation failed: {e!s}")
+
+    # Function 'close'
+    async def close(self) -> None:
+        """ Stop periodic reconciliation """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions = True)
+            self._task = None
+
+    # Function 'stats'
+    def stats(self) -> dict[str, int]:
+        """ Return the table size, pending reconciliations and event counters """
+        return {"curves": len(self.curves), "dirty": len(self._dirty), **self.counts}
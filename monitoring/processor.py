@@ -7,6 +7,7 @@ import os
 import struct
 
 # Import packages
+from dataclasses import dataclass
 from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
 from typing import Any
@@ -20,6 +21,45 @@ from handler.base import TokenInfo
 logger = logging.getLogger(__name__)
 
 
+# Class 'TradeEvent'
+@dataclass(slots = True)
+class TradeEvent:
+    """ Buy or sell emitted by the pump program, with the curve reserves right after it """
+
+    # Define 'mint'
+    mint: Pubkey
+
+    # Define 'sol_amount'
+    sol_amount: int
+
+    # Define 'token_amount'
+    token_amount: int
+
+    # Define 'is_buy'
+    is_buy: bool
+
+    # Define 'user'
+    user: Pubkey
+
+    # Define 'timestamp'
+    timestamp: int
+
+    # Define 'virtual_sol_reserves'
+    virtual_sol_reserves: int
+
+    # Define 'virtual_token_reserves'
+    virtual_token_reserves: int
+
+    # Define 'real_sol_reserves'
+    real_sol_reserves: int
+
+    # Define 'real_token_reserves'
+    real_token_reserves: int
+
+    # Define 'slot'
+    slot: int = 0
+
+
 # Class 'LogsProcessor'
 class LogsProcessor:
     """ Class description """
@@ -27,6 +67,13 @@ class LogsProcessor:
     # Define 'CREATE_DISCRIMINATOR'
     CREATE_DISCRIMINATOR: Final[int] = 8530921459188068891
 
+    # Define 'TRADE_DISCRIMINATOR'
+    TRADE_DISCRIMINATOR: Final[bytes] = struct.pack("<Q", 17177263679997991869)
+
+    # Define 'TRADE_LAYOUT'
+    # Leading fields of TradeEvent, newer program versions append fee and creator fields after them
+    TRADE_LAYOUT: Final[struct.Struct] = struct.Struct("<32sQQ?32sqQQQQ")
+
     # Class initialization
     def __init__(self, pump_program: Pubkey):
         """ Initializer description """
@@ -69,6 +116,30 @@ class LogsProcessor:
 
         return None
 
+    # Function 'process_trade_logs'
+    def process_trade_logs(self, logs: list[str], slot: int) -> list[TradeEvent]:
+        """ Decode every TradeEvent of a transaction, in emission order """
+        events = []
+        for log in logs:
+            if not log.startswith("Program data: "):
+                continue
+            try:
+                event = self._parse_trade_event(base64.b64decode(log[14:]), slot)
+            except ValueError:
+                continue
+            if event is not None:
+                events.append(event)
+        return events
+
+    # Function '_parse_trade_event'
+    def _parse_trade_event(self, data: bytes, slot: int) -> TradeEvent | None:
+        """ Function description """
+        if data[:8] != self.TRADE_DISCRIMINATOR or len(data) < 8 + self.TRADE_LAYOUT.size:
+            return None
+
+        mint, sol_amount, token_amount, is_buy, user, timestamp, vsol, vtoken, rsol, rtoken = self.TRADE_LAYOUT.unpack_from(data, 8)
+        return TradeEvent(Pubkey.from_bytes(mint), sol_amount, token_amount, is_buy, Pubkey.from_bytes(user), timestamp, vsol, vtoken, rsol, rtoken, slot)
+
     # Function '_parse_create_instruction'
     def _parse_create_instruction(self, data: bytes) -> dict | None:
         """ Function description """
@@ -163,12 +234,42 @@ class PumpProcessor:
                 ]
             }
 
+    # Define 'SET_COMPUTE_UNIT_PRICE'
+    SET_COMPUTE_UNIT_PRICE: Final[int] = 3
+
+    # Function 'decode_transaction'
+    @staticmethod
+    def decode_transaction(tx_data: str) -> VersionedTransaction | None:
+        """ Decode a base64 block transaction once, None if it is malformed """
+        try:
+            return VersionedTransaction.from_bytes(base64.b64decode(tx_data))
+        except Exception as e:
+            logger.debug(f"Invalid block transaction: {e!s}")
+            return None
+
+    # Function 'compute_unit_price'
+    def compute_unit_price(self, transaction: VersionedTransaction) -> int | None:
+        """ Micro-lamports per compute unit paid by a transaction invoking the pump program, None for other programs """
+        keys = transaction.message.account_keys
+        price = 0
+        invokes = False
+        for ix in transaction.message.instructions:
+            if ix.program_id_index >= len(keys):
+                continue
+            program_id = keys[ix.program_id_index]
+            if program_id == self.pump_program:
+                invokes = True
+            elif program_id == SystemAddresses.COMPUTE_BUDGET_PROGRAM:
+                data = bytes(ix.data)
+                if len(data) >= 9 and data[0] == self.SET_COMPUTE_UNIT_PRICE:
+                    price = int.from_bytes(data[1:9], "little")
+        return price if invokes else None
+
     # Function 'process_transaction'
-    def process_transaction(self, tx_data: str) -> TokenInfo | None:
+    def process_transaction(self, tx_data: str | VersionedTransaction) -> TokenInfo | None:
         """ Function description """
         try:
-            tx_data_decoded = base64.b64decode(tx_data)
-            transaction = VersionedTransaction.from_bytes(tx_data_decoded)
+            transaction = tx_data if isinstance(tx_data, VersionedTransaction) else VersionedTransaction.from_bytes(base64.b64decode(tx_data))
 
             for ix in transaction.message.instructions:
                 program_id_index = ix.program_id_index
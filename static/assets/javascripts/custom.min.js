@@ -33,12 +33,10 @@ $(document).ready(function()
     {
         const botstatus = $('[name="main.status"]').val();
         const sandbox = $('[name="main.sandbox"]').val();
-        const fastmode = $('[name="trade.fastmode"]').val();
         const holderscheck = $('[name="rules.holderscheck"]').val();
         const trailprofit = $('[name="trade.trailprofit"]').val();
 
         $('[name="main.initbalance"]').closest('.mb-3').toggle(botstatus === "True" && sandbox === "True");
-        $('[name="trade.fasttokens"]').closest('.mb-3').toggle(fastmode === "True");
         $('[name="rules.holdersbalance"]').closest('.mb-3').toggle(holderscheck === "True");
 
         const trailFields = [
@@ -134,7 +132,7 @@ $(document).ready(function()
         toggleChangeFields();
     });
 
-    $('[name="main.sandbox"], [name="filters.listener"], [name="trade.fastmode"], [name="trade.trailprofit"], [name="rules.holderscheck"]').on('change', toggleChangeFields);
+    $('[name="main.sandbox"], [name="filters.listener"], [name="trade.trailprofit"], [name="rules.holderscheck"]').on('change', toggleChangeFields);
 
     // Start bot
     $('#startBot').click(function() 
@@ -0,0 +1,6 @@
+# Import libraries
+import os
+import sys
+
+# Make the repository packages importable when pytest runs from any directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
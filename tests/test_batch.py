@@ -0,0 +1,118 @@
+# Import libraries
+import asyncio
+
+# Import packages
+import pytest
+
+# Import local packages
+from core.batch import RPCBatcher
+from core.batch import RPCError
+
+
+# Class 'Transport'
+class Transport:
+    """ Router stand-in answering every call with its method name, in reverse order """
+
+    # Class initialization
+    def __init__(self, drop: str | None = None):
+        """ Initializer description """
+        self.drop = drop
+        self.bodies: list = []
+
+    # Function 'post_json'
+    async def post_json(self, body, role = "read", priority = None):
+        """ Answer a single body or a batch """
+        self.bodies.append(body)
+        if isinstance(body, dict):
+            return {"jsonrpc": "2.0", "id": body["id"], "result": body["method"]}
+        replies = []
+        for entry in body:
+            if entry["method"] == self.drop:
+                continue
+            if entry["method"] == "fail":
+                replies.append({"jsonrpc": "2.0", "id": entry["id"], "error": {"code": -32602, "message": "Invalid params"}})
+            else:
+                replies.append({"jsonrpc": "2.0", "id": entry["id"], "result": entry["method"]})
+        return list(reversed(replies))
+
+
+# Function 'test_align_orders_replies_like_bodies'
+def test_align_orders_replies_like_bodies():
+    """ Replies come back in any order, missing ones become None """
+    bodies = [{"id": 1}, {"id": 2}, {"id": 3}]
+    replies = [{"id": 3, "result": "c"}, {"id": 1, "result": "a"}]
+    assert RPCBatcher.align(replies, bodies) == [{"id": 1, "result": "a"}, None, {"id": 3, "result": "c"}]
+
+
+# Function 'test_align_spreads_a_batch_level_error'
+def test_align_spreads_a_batch_level_error():
+    """ A single error object without an id, as nodes send for a rejected batch, applies to every call """
+    error = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid request"}}
+    assert RPCBatcher.align(error, [{"id": 1}, {"id": 2}]) == [error, error]
+
+
+# Function 'test_execute_returns_errors_in_place'
+def test_execute_returns_errors_in_place():
+    """ CallBatch keeps the order of the calls and returns failed calls as RPCError """
+    batcher = RPCBatcher(Transport(drop = "getBalance"))
+    results = asyncio.run(batcher.execute([("getSlot", []), ("fail", []), ("getBalance", []), ("getHealth", None)]))
+    assert results[0] == "getSlot"
+    assert isinstance(results[1], RPCError) and results[1].code == -32602
+    assert isinstance(results[2], RPCError) and results[2].code is None
+    assert results[3] == "getHealth"
+
+
+# Function 'test_submit_coalesces_concurrent_calls'
+def test_submit_coalesces_concurrent_calls():
+    """ Calls submitted within the window share one HTTP batch and each gets its own result """
+    transport = Transport()
+    batcher = RPCBatcher(transport, window = 0.01)
+
+    async def run() -> list:
+        return await asyncio.gather(*(batcher.submit(method) for method in ("getSlot", "getHealth", "getBlockHeight")))
+
+    assert asyncio.run(run()) == ["getSlot", "getHealth", "getBlockHeight"]
+    assert len(transport.bodies) == 1 and len(transport.bodies[0]) == 3
+
+
+# Function 'test_submit_raises_the_error_of_its_own_call'
+def test_submit_raises_the_error_of_its_own_call():
+    """ One failing call in a batch does not fail its neighbours """
+    batcher = RPCBatcher(Transport(), window = 0.01)
+
+    async def run() -> list:
+        return await asyncio.gather(batcher.submit("getSlot"), batcher.submit("fail"), return_exceptions = True)
+
+    ok, failed = asyncio.run(run())
+    assert ok == "getSlot"
+    assert isinstance(failed, RPCError)
+
+
+# Function 'test_transport_failure_reaches_every_caller'
+def test_transport_failure_reaches_every_caller():
+    """ A failed HTTP batch fails every call queued in it """
+
+    class Broken(Transport):
+        async def post_json(self, body, role = "read", priority = None):
+            raise TimeoutError("batch timed out")
+
+    batcher = RPCBatcher(Broken(), window = 0.01)
+
+    async def run() -> list:
+        return await asyncio.gather(batcher.submit("getSlot"), batcher.submit("getHealth"), return_exceptions = True)
+
+    assert all(isinstance(result, TimeoutError) for result in asyncio.run(run()))
+
+
+# Function 'test_maxbatch_splits_large_batches'
+@pytest.mark.parametrize("calls", [5, 12])
+def test_maxbatch_splits_large_batches(calls):
+    """ No HTTP batch carries more than maxbatch calls """
+    transport = Transport()
+    batcher = RPCBatcher(transport, window = 0.01, maxbatch = 5)
+
+    async def run() -> list:
+        return await asyncio.gather(*(batcher.submit(f"method{index}") for index in range(calls)))
+
+    assert asyncio.run(run()) == [f"method{index}" for index in range(calls)]
+    assert all(len(body) <= 5 if isinstance(body, list) else True for body in transport.bodies)
@@ -0,0 +1,142 @@
+# Import libraries
+import asyncio
+
+# Import packages
+import pytest
+
+# Import local packages
+from core.cache import RPCCache
+
+
+# Class 'Loader'
+class Loader:
+    """ Counting loader that answers after a delay """
+
+    # Class initialization
+    def __init__(self, delay: float = 0.01, error: BaseException | None = None):
+        """ Initializer description """
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    # Function '__call__'
+    async def __call__(self) -> int:
+        """ Return the number of calls so far, or raise the configured error """
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.calls
+
+
+# Function 'test_concurrent_calls_share_one_load'
+def test_concurrent_calls_share_one_load():
+    """ Identical concurrent calls wait on a single request """
+    cache = RPCCache()
+    loader = Loader()
+
+    async def run() -> list:
+        return await asyncio.gather(*(cache.fetch("getBalance", ["wallet"], loader) for _ in range(5)))
+
+    assert asyncio.run(run()) == [1] * 5
+    assert loader.calls == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+# Function 'test_cancelled_caller_does_not_cancel_the_shared_load'
+def test_cancelled_caller_does_not_cancel_the_shared_load():
+    """ The first caller giving up must not take the result away from the others """
+    cache = RPCCache()
+    loader = Loader(delay = 0.05)
+
+    async def run() -> int:
+        first = asyncio.create_task(cache.fetch("getBalance", ["wallet"], loader))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.fetch("getBalance", ["wallet"], loader))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == 1
+    assert loader.calls == 1
+
+
+# Function 'test_entries_expire_after_their_ttl'
+def test_entries_expire_after_their_ttl():
+    """ A cached reply is served until its TTL runs out, then loaded again """
+    cache = RPCCache({"getBalance": 0.05})
+    loader = Loader(delay = 0)
+
+    async def run() -> list:
+        first = await cache.fetch("getBalance", ["wallet"], loader)
+        cached = await cache.fetch("getBalance", ["wallet"], loader)
+        await asyncio.sleep(0.06)
+        return [first, cached, await cache.fetch("getBalance", ["wallet"], loader)]
+
+    assert asyncio.run(run()) == [1, 1, 2]
+    assert cache.stats()["hits"] == 1
+
+
+# Function 'test_errors_and_zero_ttls_are_not_cached'
+def test_errors_and_zero_ttls_are_not_cached():
+    """ Failures are never kept, and a TTL of 0 only coalesces """
+    cache = RPCCache()
+    failing = Loader(delay = 0, error = RuntimeError("node is behind"))
+    blockhash = Loader(delay = 0)
+
+    async def run() -> None:
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await cache.fetch("getBalance", ["wallet"], failing)
+            await cache.fetch("getLatestBlockhash", [], blockhash)
+
+    asyncio.run(run())
+    assert failing.calls == 2
+    assert blockhash.calls == 2
+    assert cache.stats()["size"] == 0
+
+
+# Function 'test_uncached_methods_bypass_the_cache'
+def test_uncached_methods_bypass_the_cache():
+    """ Methods without a TTL, such as sendTransaction, are never coalesced """
+    cache = RPCCache()
+    loader = Loader()
+
+    async def run() -> list:
+        return await asyncio.gather(*(cache.fetch("sendTransaction", ["tx"], loader) for _ in range(3)))
+
+    assert sorted(asyncio.run(run())) == [3, 3, 3]
+    assert loader.calls == 3
+
+
+# Function 'test_least_recently_used_entries_are_evicted'
+def test_least_recently_used_entries_are_evicted():
+    """ The cache stays within maxsize by dropping the entry used least recently """
+    cache = RPCCache(maxsize = 2)
+
+    async def run() -> None:
+        for account in ("a", "b"):
+            await cache.fetch("getBalance", [account], Loader(delay = 0))
+        await cache.fetch("getBalance", ["a"], Loader(delay = 0))
+        await cache.fetch("getBalance", ["c"], Loader(delay = 0))
+
+    asyncio.run(run())
+    assert cache.stats()["evictions"] == 1
+    assert cache.key("getBalance", ["b"]) not in cache._entries
+    assert cache.key("getBalance", ["a"]) in cache._entries
+
+
+# Function 'test_invalidate_drops_one_method'
+def test_invalidate_drops_one_method():
+    """ Invalidating a method leaves the other entries in place """
+    cache = RPCCache()
+
+    async def run() -> None:
+        await cache.fetch("getBalance", ["wallet"], Loader(delay = 0))
+        await cache.fetch("getHealth", None, Loader(delay = 0))
+        cache.invalidate("getBalance")
+
+    asyncio.run(run())
+    assert list(cache._entries) == [cache.key("getHealth", None)]
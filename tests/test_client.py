@@ -0,0 +1,53 @@
+# Import libraries
+import asyncio
+import json
+
+# Import packages
+import msgspec
+import pytest
+
+# Import local packages
+from core.batch import RPCError
+from core.client import SolanaClient
+from core.health import CircuitOpenError
+from core.limiter import RateLimitError
+
+# Define 'ERRORS'
+# Failures PostRPC and PostBatch turn into None instead of raising
+ERRORS = [
+    RateLimitError("RPC budget exhausted, shedding 'screening' call"),
+    msgspec.DecodeError("JSON is malformed"),
+    json.JSONDecodeError("Expecting value", "", 0),
+    CircuitOpenError("Circuit breaker is open"),
+    RPCError(-32005, "Node is behind"),
+    TimeoutError("getHealth timed out")
+]
+
+
+# Function 'failing'
+def failing(error: BaseException) -> SolanaClient:
+    """ Client whose router raises `error` on every request """
+    client = SolanaClient("http://127.0.0.1:1")
+
+    async def post_json(body, role = "read", priority = None):
+        raise error
+
+    client.rpcrouter.post_json = post_json
+    return client
+
+
+# Function 'test_post_rpc_returns_none_on_failure'
+@pytest.mark.parametrize("error", ERRORS, ids = lambda error: type(error).__name__)
+def test_post_rpc_returns_none_on_failure(error):
+    """ GetHealth and other PostRPC callers get None instead of an exception """
+    client = failing(error)
+    assert asyncio.run(client.PostRPC({"jsonrpc": "2.0", "id": 1, "method": "getHealth"})) is None
+    assert asyncio.run(client.GetHealth()) is None
+
+
+# Function 'test_post_batch_returns_none_on_failure'
+@pytest.mark.parametrize("error", ERRORS, ids = lambda error: type(error).__name__)
+def test_post_batch_returns_none_on_failure(error):
+    """ PostBatch follows the same contract """
+    client = failing(error)
+    assert asyncio.run(client.PostBatch([{"jsonrpc": "2.0", "id": 1, "method": "getSlot"}])) is None
@@ -0,0 +1,95 @@
+# Import libraries
+import asyncio
+import time
+
+# Import packages
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+# Import local packages
+from core.compute import BUDGET_UNITS
+from core.compute import ComputeBudgeter
+
+
+# Class 'Client'
+class Client:
+    """ Answers simulateTransaction after `delay` with a fixed unit count or error """
+
+    # Class initialization
+    def __init__(self, delay: float = 0.0, units: int = 50_000, error: object = None):
+        """ Initializer description """
+        self.delay = delay
+        self.units = units
+        self.error = error
+        self.calls = 0
+
+    # Function 'get_cached_blockhash'
+    async def get_cached_blockhash(self) -> Hash:
+        """ Any blockhash, the simulation replaces it """
+        return Hash.default()
+
+    # Function 'CallRPC'
+    async def CallRPC(self, method: str, params: list) -> dict:
+        """ Simulation result after the delay """
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"value": {"err": self.error, "unitsConsumed": self.units}}
+
+
+# Define 'INSTRUCTIONS'
+INSTRUCTIONS = [Instruction(Pubkey.new_unique(), bytes(8), [])]
+
+
+# Function 'test_first_send_does_not_wait_for_the_simulation'
+def test_first_send_does_not_wait_for_the_simulation():
+    """ The first send gets the default limit at once, later sends the measured one """
+
+    async def run() -> None:
+        budgeter = ComputeBudgeter(Client(delay = 0.5))
+        payer = Keypair()
+        started = time.monotonic()
+        assert await budgeter.limit(INSTRUCTIONS, payer) is None
+        assert time.monotonic() - started < 0.1
+        assert await budgeter.limit(INSTRUCTIONS, payer) is None
+        await asyncio.sleep(0.6)
+        assert await budgeter.limit(INSTRUCTIONS, payer) == int(50_000 * 1.2) + BUDGET_UNITS
+        assert budgeter.client.calls == 1 and budgeter.hits == 1 and budgeter.misses == 2
+
+    asyncio.run(run())
+
+
+# Function 'test_wait_bounds_the_first_send'
+def test_wait_bounds_the_first_send():
+    """ With a wait, a fast simulation sizes the first send and a slow one falls back after the wait """
+
+    async def run() -> None:
+        payer = Keypair()
+        fast = ComputeBudgeter(Client(delay = 0.01), wait = 1.0)
+        assert await fast.limit(INSTRUCTIONS, payer) == int(50_000 * 1.2) + BUDGET_UNITS
+        slow = ComputeBudgeter(Client(delay = 1.0), wait = 0.05)
+        started = time.monotonic()
+        assert await slow.limit(INSTRUCTIONS, payer) is None
+        assert time.monotonic() - started < 0.5
+        await slow.close()
+
+    asyncio.run(run())
+
+
+# Function 'test_state_errors_do_not_count_as_failures'
+def test_state_errors_do_not_count_as_failures():
+    """ A simulation that lost the race to a sell is retried after the state cooldown instead of failing the shape """
+
+    async def run() -> None:
+        client = Client(error = {"InstructionError": [2, {"Custom": 6001}]})
+        budgeter = ComputeBudgeter(client, statecooldown = 0.05, wait = 1.0)
+        payer = Keypair()
+        assert await budgeter.limit(INSTRUCTIONS, payer) is None
+        assert await budgeter.limit(INSTRUCTIONS, payer) is None
+        assert client.calls == 1 and budgeter.statefailures == 1 and budgeter.failures == 0
+        client.error = None
+        await asyncio.sleep(0.1)
+        assert await budgeter.limit(INSTRUCTIONS, payer) == int(50_000 * 1.2) + BUDGET_UNITS
+
+    asyncio.run(run())
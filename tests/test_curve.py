@@ -0,0 +1,79 @@
+# Import libraries
+import math
+
+# Import packages
+import numpy as np
+import pytest
+
+# Import local packages
+from core.curve import CURVE_LAYOUT
+from core.curve import EXPECTED_DISCRIMINATOR
+from core.curve import BondingCurveState
+from core.curve import curve_prices
+from core.curve import decode_curve_array
+
+
+# Define 'RESERVES'
+RESERVES = (1_073_000_000_000_000, 30_000_000_000, 793_100_000_000_000, 0, 1_000_000_000_000_000, False)
+
+
+# Function 'account'
+def account(*fields, discriminator: bytes = EXPECTED_DISCRIMINATOR, padding: int = 32) -> bytes:
+    """ Raw bonding curve account data, with trailing bytes like the real account """
+    return CURVE_LAYOUT.pack(discriminator, *fields) + bytes(padding)
+
+
+# Function 'test_state_decodes_every_field'
+def test_state_decodes_every_field():
+    """ The fixed layout maps onto the named fields, from bytes or a memoryview """
+    for data in (account(*RESERVES), memoryview(bytearray(account(*RESERVES)))):
+        state = BondingCurveState(data)
+        assert (state.virtual_token_reserves, state.virtual_sol_reserves, state.real_token_reserves) == RESERVES[:3]
+        assert (state.real_sol_reserves, state.token_total_supply, state.complete) == RESERVES[3:]
+    assert state.calculate_price() == pytest.approx((30_000_000_000 / 10**9) / (1_073_000_000_000_000 / 10**6))
+
+
+# Function 'test_state_rejects_bad_data'
+def test_state_rejects_bad_data():
+    """ A foreign discriminator or a short account raises ValueError """
+    with pytest.raises(ValueError):
+        BondingCurveState(account(*RESERVES, discriminator = bytes(8)))
+    with pytest.raises(ValueError):
+        BondingCurveState(account(*RESERVES)[:CURVE_LAYOUT.size - 1])
+
+
+# Function 'test_state_updates_in_place'
+def test_state_updates_in_place():
+    """ update and assign rewrite the same object, and a failed update leaves it untouched """
+    state = BondingCurveState(account(*RESERVES))
+    state.update(account(2, 3, 4, 5, 6, True))
+    assert (state.virtual_token_reserves, state.virtual_sol_reserves, state.complete) == (2, 3, True)
+    with pytest.raises(ValueError):
+        state.update(b"")
+    assert state.virtual_token_reserves == 2
+    state.assign(BondingCurveState(account(*RESERVES)))
+    assert state.virtual_token_reserves == RESERVES[0]
+    assert not hasattr(state, "__dict__")
+
+
+# Function 'test_array_matches_scalar_decode'
+def test_array_matches_scalar_decode():
+    """ Valid accounts decode to the same fields, invalid and short ones to zeroed records """
+    datas = [account(*RESERVES), account(2, 3, 4, 5, 6, True), account(*RESERVES, discriminator = bytes(8)), b"\x00" * 10]
+    records = decode_curve_array(datas)
+    for record, data in zip(records[:2], datas):
+        state = BondingCurveState(data)
+        assert int(record["virtual_token_reserves"]) == state.virtual_token_reserves
+        assert int(record["virtual_sol_reserves"]) == state.virtual_sol_reserves
+        assert int(record["token_total_supply"]) == state.token_total_supply
+        assert bool(record["complete"]) == state.complete
+    assert (records[2:] == np.zeros(2, dtype = records.dtype)).all()
+
+
+# Function 'test_prices_are_nan_for_empty_reserves'
+def test_prices_are_nan_for_empty_reserves():
+    """ Zeroed records price as NaN instead of dividing by zero """
+    prices = curve_prices(decode_curve_array([account(*RESERVES), b""]))
+    assert prices[0] == pytest.approx(BondingCurveState(account(*RESERVES)).calculate_price())
+    assert math.isnan(prices[1])
+    assert decode_curve_array([]).shape == (0,) and curve_prices(decode_curve_array([])).dtype == np.float64
@@ -0,0 +1,109 @@
+# Import libraries
+import time
+
+# Import packages
+import pytest
+
+# Import local packages
+from core.health import AdaptiveTimeout
+from core.health import CircuitBreaker
+from core.health import CircuitOpenError
+
+
+# Function 'cooled'
+def cooled(breaker: CircuitBreaker) -> None:
+    """ Skip the breaker to the end of its cooldown """
+    breaker.retryat = time.monotonic() - 0.001
+
+
+# Function 'test_breaker_opens_after_consecutive_failures'
+def test_breaker_opens_after_consecutive_failures():
+    """ Only `threshold` failures in a row open the breaker, a success in between resets the count """
+    breaker = CircuitBreaker(threshold = 3, cooldown = 60.0)
+    assert not breaker.failure() and not breaker.failure()
+    breaker.success()
+    assert not breaker.failure() and not breaker.failure()
+    assert breaker.failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.attempt()
+    assert breaker.rejected == 1
+
+
+# Function 'test_half_open_lets_one_trial_through'
+def test_half_open_lets_one_trial_through():
+    """ After the cooldown a single trial is allowed, its success closes the breaker """
+    breaker = CircuitBreaker(threshold = 1, cooldown = 60.0)
+    breaker.failure()
+    cooled(breaker)
+    assert breaker.state == "half-open"
+    breaker.attempt()
+    assert not breaker.available()
+    with pytest.raises(CircuitOpenError):
+        breaker.attempt()
+    assert breaker.success()
+    assert breaker.state == "closed" and breaker.available()
+
+
+# Function 'test_failed_trial_backs_off'
+def test_failed_trial_backs_off():
+    """ A failed half-open trial reopens the breaker with a doubled, capped cooldown """
+    breaker = CircuitBreaker(threshold = 1, cooldown = 10.0, maxbackoff = 4)
+    breaker.failure()
+    cooldowns = []
+    for _ in range(4):
+        cooled(breaker)
+        breaker.attempt()
+        started = time.monotonic()
+        breaker.failure()
+        assert breaker.state == "open"
+        cooldowns.append(round(breaker.retryat - started))
+    assert cooldowns == [20, 40, 40, 40]
+
+
+# Function 'test_released_trial_can_be_retried'
+def test_released_trial_can_be_retried():
+    """ A trial cancelled before its outcome gives the slot back """
+    breaker = CircuitBreaker(threshold = 1, cooldown = 60.0)
+    breaker.failure()
+    cooled(breaker)
+    breaker.attempt()
+    breaker.release()
+    assert breaker.available()
+
+
+# Function 'test_timeout_uses_the_ceiling_until_enough_samples'
+def test_timeout_uses_the_ceiling_until_enough_samples():
+    """ A method without history gets the ceiling, then a multiple of its p99 """
+    timeouts = AdaptiveTimeout(multiplier = 3.0, floor = 0.5, ceiling = 10.0, minsamples = 20)
+    assert timeouts.timeout("getSlot") == 10.0
+    for _ in range(20):
+        timeouts.observe("getSlot", 0.5)
+    assert timeouts.timeout("getSlot") == pytest.approx(1.5)
+
+
+# Function 'test_timeout_is_clamped_and_batches_take_the_longest'
+def test_timeout_is_clamped_and_batches_take_the_longest():
+    """ Deadlines stay within floor and ceiling, a batch waits for its slowest method """
+    timeouts = AdaptiveTimeout(multiplier = 3.0, floor = 0.5, ceiling = 10.0, minsamples = 20)
+    for _ in range(20):
+        timeouts.observe("fast", 0.01)
+        timeouts.observe("slow", 2.0)
+        timeouts.observe("stuck", 30.0)
+    assert timeouts.timeout("fast") == 0.5
+    assert timeouts.timeout(["fast", "slow"]) == pytest.approx(6.0)
+    assert timeouts.timeout("stuck") == 10.0
+    assert timeouts.timeout(["fast", "unknown"]) == 10.0
+
+
+# Function 'test_expired_calls_widen_the_deadline'
+def test_expired_calls_widen_the_deadline():
+    """ A timed out call feeds its deadline back so a slower node gets more time """
+    timeouts = AdaptiveTimeout(multiplier = 2.0, floor = 0.1, ceiling = 10.0, window = 20, minsamples = 20)
+    for _ in range(20):
+        timeouts.observe("getSlot", 0.1)
+    before = timeouts.timeout("getSlot")
+    for _ in range(10):
+        timeouts.expire("getSlot", before)
+    assert timeouts.timeout("getSlot") > before
+    assert timeouts.stats()["getSlot"]["expired"] == 10
@@ -0,0 +1,92 @@
+# Import libraries
+import asyncio
+
+# Import packages
+from types import SimpleNamespace
+
+# Import local packages
+from core.landing import LandingFeeOptimizer
+from core.priority import PriorityFeeHandler
+from core.resend import SendJob
+
+# Define 'DELAY'
+# Slots every simulated trade takes to land, whatever fee it paid
+DELAY = 2
+
+
+# Function 'handler'
+def handler(tmp_path, extra_fee: float = 0.5, hard_cap: int = 1_000_000, explore: float = 0.0) -> PriorityFeeHandler:
+    """ Fee handler with a fixed fee and a landing optimizer writing to a temporary database """
+    client = SimpleNamespace(resender = SimpleNamespace(on_settled = lambda callback: None))
+    fees = PriorityFeeHandler(client, False, True, 1000, extra_fee, hard_cap)
+    fees.optimizer = LandingFeeOptimizer(client, 4, hard_cap, minsamples = 4, explore = explore, database = str(tmp_path / "trades.db"))
+    fees.optimizer.random.seed(1)
+    return fees
+
+
+# Function 'trade'
+def trade(optimizer: LandingFeeOptimizer, fee: int, slot: int) -> None:
+    """ Record one buy that paid `fee` and landed DELAY slots after it was sent """
+    job = SendJob("buy", fee)
+    job.record(f"signature{slot}", 0, slot)
+    job.finish("landed", f"signature{slot}", slot + DELAY)
+    optimizer.record(job)
+
+
+# Function 'cycle'
+async def cycle(fees: PriorityFeeHandler, rounds: int) -> list[int]:
+    """ Send `rounds` trades with the fee the handler picks and return those fees """
+    paid = []
+    for slot in range(rounds):
+        fee = await fees.calculate_priority_fee()
+        trade(fees.optimizer, fee, slot * 10)
+        paid.append(fee)
+    return paid
+
+
+# Function 'test_constant_delay_keeps_the_fee_stable'
+def test_constant_delay_keeps_the_fee_stable(tmp_path):
+    """ The learned fee already includes extra, so a constant delay must not raise it cycle after cycle """
+    fees = handler(tmp_path)
+    paid = asyncio.run(cycle(fees, 200))
+    assert paid[0] == 1500
+    assert set(paid) == {1500}
+
+
+# Function 'test_exploration_never_raises_the_fee'
+def test_exploration_never_raises_the_fee(tmp_path):
+    """ Halved exploration fees that land as fast let the fee drift down, never up """
+    fees = handler(tmp_path, explore = 0.5)
+    paid = asyncio.run(cycle(fees, 300))
+    assert max(paid) == 1500
+    assert paid[-1] < 1500
+
+
+# Function 'test_learned_fee_is_capped'
+def test_learned_fee_is_capped(tmp_path):
+    """ The hard cap applies to the learned fee as well """
+    fees = handler(tmp_path, hard_cap = 1200)
+
+    async def run() -> int:
+        for slot in range(8):
+            trade(fees.optimizer, 5000, slot * 10)
+        return await fees.calculate_priority_fee()
+
+    assert asyncio.run(run()) == 1200
+
+
+# Function 'test_cleanup_and_unpaid_jobs_are_ignored'
+def test_cleanup_and_unpaid_jobs_are_ignored(tmp_path):
+    """ Only buys and sells that paid a fee teach the optimizer """
+    fees = handler(tmp_path)
+
+    async def run() -> None:
+        for slot in range(8):
+            job = SendJob("cleanup", 1000)
+            job.record("cleanup", 0, slot)
+            job.finish("landed", "cleanup", slot)
+            fees.optimizer.record(job)
+            trade(fees.optimizer, 0, slot)
+
+    asyncio.run(run())
+    assert fees.optimizer.fee() is None
@@ -0,0 +1,131 @@
+# Import libraries
+import asyncio
+
+# Import packages
+import pytest
+
+# Import local packages
+from core.limiter import RateLimiter
+from core.limiter import RateLimitError
+from core.limiter import priority
+from core.limiter import priority_for
+
+
+# Function 'test_priority_follows_the_caller_then_the_method'
+def test_priority_follows_the_caller_then_the_method():
+    """ A class set by the caller wins over the class of the method """
+    assert priority_for("sendTransaction") == "send"
+    assert priority_for("getAccountInfo") == "curve"
+    with priority("cleanup"):
+        assert priority_for("getAccountInfo") == "cleanup"
+    assert priority_for() == "curve"
+    with pytest.raises(ValueError):
+        with priority("urgent"):
+            pass
+
+
+# Function 'test_priority_reaches_tasks_created_inside_the_block'
+def test_priority_reaches_tasks_created_inside_the_block():
+    """ create_task copies the context, so background work keeps its caller's class """
+
+    async def run() -> str:
+        with priority("screening"):
+            task = asyncio.create_task(asyncio.sleep(0, priority_for()))
+        return await task
+
+    assert asyncio.run(run()) == "screening"
+
+
+# Function 'test_queued_calls_are_served_by_priority'
+def test_queued_calls_are_served_by_priority():
+    """ Once the bucket is empty, a send queued after a cleanup call still goes first """
+    served = []
+
+    async def call(limiter: RateLimiter, name: str) -> None:
+        await limiter.acquire(name)
+        served.append(name)
+
+    async def run() -> None:
+        limiter = RateLimiter(20.0, burst = 1.0)
+        limiter.tokens = 0.0
+        cleanup = asyncio.create_task(call(limiter, "cleanup"))
+        await asyncio.sleep(0)
+        send = asyncio.create_task(call(limiter, "send"))
+        await asyncio.gather(cleanup, send)
+
+    asyncio.run(run())
+    assert served == ["send", "cleanup"]
+
+
+# Function 'test_low_priority_calls_are_shed'
+def test_low_priority_calls_are_shed():
+    """ A screening call that could not be served within its deadline fails fast, a send never does """
+
+    async def run() -> None:
+        limiter = RateLimiter(1.5, burst = 4.0)
+        limiter.tokens = 0.0
+        with pytest.raises(RateLimitError):
+            await limiter.acquire("screening")
+        await asyncio.wait_for(limiter.acquire("send"), 1.0)
+
+    asyncio.run(run())
+
+
+# Function 'test_reserves_keep_tokens_for_higher_classes'
+def test_reserves_keep_tokens_for_higher_classes():
+    """ Cleanup stops at half the bucket, leaving the rest for sends """
+
+    async def run() -> RateLimiter:
+        limiter = RateLimiter(0.01, burst = 10.0)
+        for _ in range(5):
+            await limiter.acquire("cleanup")
+        queued = asyncio.create_task(limiter.acquire("cleanup"))
+        await asyncio.sleep(0.01)
+        assert not queued.done()
+        for _ in range(5):
+            await asyncio.wait_for(limiter.acquire("send"), 0.1)
+        queued.cancel()
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.depth() == 0
+
+
+# Function 'test_small_bucket_serves_every_class'
+def test_small_bucket_serves_every_class():
+    """ With a one-token bucket the reserves cannot be kept, every class is still served """
+
+    async def run() -> None:
+        limiter = RateLimiter(20.0, burst = 1.0)
+        limiter.tokens = 0.0
+        for name in ("cleanup", "screening", "curve"):
+            await asyncio.wait_for(limiter.acquire(name), 1.0)
+
+    asyncio.run(run())
+
+
+# Function 'test_cancelled_waiter_leaves_the_queue'
+def test_cancelled_waiter_leaves_the_queue():
+    """ A caller that gives up is removed and does not consume a token """
+
+    async def run() -> RateLimiter:
+        limiter = RateLimiter(5.0, burst = 1.0)
+        limiter.tokens = 0.0
+        waiter = asyncio.create_task(limiter.acquire("send"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.depth() == 0
+    assert limiter.stats_["send"]["granted"] == 0
+
+
+# Function 'test_penalize_empties_the_bucket'
+def test_penalize_empties_the_bucket():
+    """ A 429 from the node drains the bucket so every class backs off """
+    limiter = RateLimiter(10.0, burst = 10.0)
+    limiter.penalize()
+    assert limiter.tokens <= 0.0
@@ -0,0 +1,109 @@
+# Import libraries
+import random
+from types import SimpleNamespace
+
+# Import packages
+import numpy as np
+import pytest
+
+# Import local packages
+from core.quote import U64_MAX
+from core.quote import quote_buy
+from core.quote import quote_buy_ladder
+from core.quote import quote_buy_tokens
+from core.quote import quote_sell
+from core.quote import quote_sell_ladder
+
+
+# Function 'curve'
+def curve(vsol: int, vtoken: int, real: int, complete: bool = False) -> SimpleNamespace:
+    """ Curve reserves as the quote functions read them """
+    return SimpleNamespace(virtual_sol_reserves = vsol, virtual_token_reserves = vtoken, real_token_reserves = real, complete = complete)
+
+
+# Function 'columns'
+def columns(record: np.void) -> tuple[int, int, int]:
+    """ Integer columns of one ladder record """
+    return int(record["tokens"]), int(record["lamports"]), int(record["fee"])
+
+
+# Function 'test_buy_stays_within_budget'
+def test_buy_stays_within_budget():
+    """ A buy never spends more than its budget, and one more token would exceed it """
+    state = curve(30_000_000_000, 1_073_000_000_000_000, 793_100_000_000_000)
+    for budget in (1, 101, 10**6, 10**9, 10**10):
+        quote = quote_buy(state, budget)
+        assert quote.lamports <= budget
+        assert quote_buy_tokens(state, quote.tokens + 1).lamports > budget
+
+
+# Function 'test_buy_is_capped_by_real_reserves'
+def test_buy_is_capped_by_real_reserves():
+    """ A budget larger than the curve holds buys out the real reserves only """
+    state = curve(30_000_000_000, 1_073_000_000_000_000, 5_000_000)
+    assert quote_buy(state, 10**12).tokens == 5_000_000
+
+
+# Function 'test_scalar_quotes_reject_bad_input'
+def test_scalar_quotes_reject_bad_input():
+    """ Amounts outside a u64 and untradable curves raise ValueError """
+    state = curve(30_000_000_000, 1_073_000_000_000_000, 793_100_000_000_000)
+    with pytest.raises(ValueError):
+        quote_buy(state, U64_MAX + 1)
+    with pytest.raises(ValueError):
+        quote_sell(state, -1)
+    with pytest.raises(ValueError):
+        quote_sell(curve(1, 1, 0, complete = True), 1)
+
+
+# Function 'test_ladders_match_scalar_quotes'
+def test_ladders_match_scalar_quotes():
+    """ Vectorized quotes agree exactly with the scalar ones across typical curves """
+    rng = random.Random(3)
+    for _ in range(200):
+        vtoken = rng.randint(10**9, 2**50)
+        state = curve(rng.randint(10**6, 2**50), vtoken, rng.randint(0, vtoken - 1))
+        amounts = np.array([rng.randint(0, 2**50) for _ in range(8)], dtype = np.uint64)
+        buys, sells = quote_buy_ladder(state, amounts), quote_sell_ladder(state, amounts)
+        for amount, buy, sell in zip(amounts.tolist(), buys, sells):
+            expected = quote_buy(state, amount)
+            assert columns(buy) == (expected.tokens, expected.lamports, expected.fee)
+            expected = quote_sell(state, amount)
+            assert columns(sell) == (expected.tokens, expected.lamports, expected.fee)
+
+
+# Function 'test_ladders_do_not_wrap_near_u64'
+def test_ladders_do_not_wrap_near_u64():
+    """ Reserve plus amount past 2**64 is still divided exactly instead of wrapping """
+    rng = random.Random(5)
+    for _ in range(300):
+        vtoken = rng.randint(2**62, U64_MAX)
+        state = curve(rng.randint(2**62, U64_MAX), vtoken, rng.randint(0, vtoken - 1))
+        amount = rng.randint(2**62, U64_MAX)
+        expected = quote_buy(state, amount)
+        assert columns(quote_buy_ladder(state, np.array([amount], dtype = np.uint64))[0]) == (expected.tokens, expected.lamports, expected.fee)
+        expected = quote_sell(state, amount)
+        assert columns(quote_sell_ladder(state, np.array([amount], dtype = np.uint64))[0]) == (expected.tokens, expected.lamports, expected.fee)
+
+
+# Function 'test_ladder_wraps_only_some_elements'
+def test_ladder_wraps_only_some_elements():
+    """ Elements whose divisor overflows are fixed without disturbing the rest of the ladder """
+    state = curve(12_740_095_210_054_440_501, 17_829_964_394_069_928_509, 10**18)
+    amounts = [0, 10**9, 5_511_682_398_176_866_135, U64_MAX]
+    quotes = quote_sell_ladder(state, np.array(amounts, dtype = np.uint64))
+    for amount, record in zip(amounts, quotes):
+        expected = quote_sell(state, amount)
+        assert columns(record) == (expected.tokens, expected.lamports, expected.fee)
+
+
+# Function 'test_ladder_zeroes_untradable_curves'
+def test_ladder_zeroes_untradable_curves():
+    """ Complete or empty curves quote nothing and a NaN price """
+    curves = np.zeros(2, dtype = [("virtual_sol_reserves", "<u8"), ("virtual_token_reserves", "<u8"), ("real_token_reserves", "<u8"), ("complete", "?")])
+    curves[0] = (30_000_000_000, 1_073_000_000_000_000, 793_100_000_000_000, True)
+    quotes = quote_buy_ladder(curves, 10**9)
+    assert (quotes["tokens"] == 0).all() and (quotes["lamports"] == 0).all()
+    assert np.isnan(quotes["price"]).all()
+    with pytest.raises(ValueError):
+        quote_sell_ladder(curves, np.array([-1]))
@@ -0,0 +1,257 @@
+# Import libraries
+import asyncio
+import time
+
+# Import packages
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.transaction import Transaction
+
+# Import local packages
+from core.blockhash import RecentBlockhash
+from core.resend import SendJob
+from core.resend import TransactionResender
+
+
+# Class 'Blockhashes'
+class Blockhashes:
+    """ Blockhash tracker stand-in whose hashes expire on command """
+
+    # Class initialization
+    def __init__(self):
+        """ Initializer description """
+        self.issued: list[RecentBlockhash] = []
+        self.estimated: set[Hash] = set()
+        self.expired_: set[Hash] = set()
+
+    # Function 'get'
+    async def get(self) -> RecentBlockhash:
+        """ Hand out a fresh blockhash """
+        entry = RecentBlockhash(Hash.new_unique(), 1000, 0, time.monotonic())
+        self.issued.append(entry)
+        return entry
+
+    # Function 'remaining'
+    def remaining(self, entry: RecentBlockhash) -> int:
+        """ Slot estimate, run out once the test says so """
+        return 0 if entry.blockhash in self.estimated | self.expired_ else 100
+
+    # Function 'expired'
+    async def expired(self, entry: RecentBlockhash) -> bool:
+        """ Block height check, only true for hashes the test expired """
+        return entry.blockhash in self.expired_
+
+    # Function 'expire'
+    def expire(self, index: int = -1, height: bool = True) -> None:
+        """ Run a blockhash out, by slot estimate only or also by block height """
+        (self.expired_ if height else self.estimated).add(self.issued[index].blockhash)
+
+    # Function 'currentslot'
+    def currentslot(self) -> int:
+        """ Fixed slot """
+        return 100
+
+
+# Class 'Poller'
+class Poller:
+    """ Signature poller stand-in resolved by the test """
+
+    # Class initialization
+    def __init__(self):
+        """ Initializer description """
+        self.futures: dict[str, asyncio.Future] = {}
+        self.slots: dict[str, int] = {}
+
+    # Function 'watch'
+    def watch(self, signature: str, commitment: str = "confirmed") -> asyncio.Future:
+        """ Future of a signature """
+        if signature not in self.futures:
+            self.futures[signature] = asyncio.get_running_loop().create_future()
+        return self.futures[signature]
+
+    # Function 'forget'
+    def forget(self, signature: str, future: asyncio.Future) -> None:
+        """ Nothing to release """
+
+    # Function 'land'
+    def land(self, signature: str, slot: int = 105, success: bool = True) -> None:
+        """ Report a signature as processed """
+        self.slots[signature] = slot
+        self.watch(signature).set_result(success)
+
+    # Function 'slot'
+    def slot(self, signature: str) -> int | None:
+        """ Slot a signature landed in """
+        return self.slots.get(signature)
+
+
+# Class 'Confirmer'
+class Confirmer:
+    """ Confirmer stand-in sharing the poller's futures """
+
+    # Class initialization
+    def __init__(self, poller: Poller):
+        """ Initializer description """
+        self.poller = poller
+
+    # Function 'wait'
+    async def wait(self, signature: str, commitment: str = "confirmed", timeout: float = 60.0) -> bool:
+        """ Wait for the signature the test lands """
+        return await asyncio.shield(self.poller.watch(signature))
+
+
+# Class 'Client'
+class Client:
+    """ SolanaClient stand-in for the resender """
+
+    # Class initialization
+    def __init__(self, statuses: dict[str, dict] | None = None, error: BaseException | None = None):
+        """ Initializer description """
+        self.blockhashes = Blockhashes()
+        self.confirmer = Confirmer(Poller())
+        self.statuses = statuses or {}
+        self.error = error
+        self.sent: list[str] = []
+
+    # Function 'send_transaction'
+    async def send_transaction(self, transaction: Transaction, skip_preflight: bool = True) -> None:
+        """ Record the signature """
+        self.sent.append(str(transaction.signatures[0]))
+
+    # Function 'CallRPC'
+    async def CallRPC(self, method: str, params: list | None = None, priority: str | None = None) -> dict:
+        """ Answer getSignatureStatuses from the test's table """
+        if self.error is not None:
+            raise self.error
+        return {"value": [self.statuses.get(signature) for signature in params[0]]}
+
+
+# Function 'builder'
+def builder():
+    """ Build function signing an empty transaction with the blockhash it is given """
+    payer = Keypair()
+    return lambda entry: Transaction.new_signed_with_payer([], payer.pubkey(), [payer], entry.blockhash)
+
+
+# Function 'settle'
+async def settle(resender: TransactionResender) -> None:
+    """ Wait for every resend loop to finish """
+    await asyncio.wait_for(asyncio.gather(*resender._tasks), 2.0)
+
+
+# Function 'test_resigned_transaction_lands_with_its_new_signature'
+def test_resigned_transaction_lands_with_its_new_signature():
+    """ An expired hash is replaced, the job follows the new signature and lands with it """
+
+    async def run() -> tuple[TransactionResender, SendJob]:
+        client = Client()
+        resender = TransactionResender(client, interval = 0.01)
+        first = await resender.submit(builder(), resigns = 1, label = "sell", fee = 1000)
+        job = resender.job(first)
+        client.blockhashes.expire(0)
+        while len(job.signatures) < 2:
+            await asyncio.sleep(0.01)
+        client.confirmer.poller.land(job.signatures[1])
+        await settle(resender)
+        return resender, job
+
+    resender, job = asyncio.run(run())
+    assert job.status == "landed"
+    assert job.landed == job.signatures[1] and job.landedslot == 105
+    assert max(attempt.generation for attempt in job.attempts) == 1
+    assert resender.resigns == 1 and resender.counts["landed"] == 1
+
+
+# Function 'test_confirm_follows_the_job_across_resigns'
+def test_confirm_follows_the_job_across_resigns():
+    """ A caller waiting on the first signature is moved to the re-signed one """
+
+    async def run() -> tuple[bool, SendJob]:
+        client = Client()
+        resender = TransactionResender(client, interval = 0.01)
+        job = resender.job(await resender.submit(builder(), resigns = 1))
+        confirmed = asyncio.create_task(resender.confirm(job))
+        await asyncio.sleep(0.02)
+        client.blockhashes.expire(0)
+        while len(job.signatures) < 2:
+            await asyncio.sleep(0.01)
+        client.confirmer.poller.land(job.signatures[1])
+        result = await asyncio.wait_for(confirmed, 1.0)
+        await settle(resender)
+        return result, job
+
+    confirmed, job = asyncio.run(run())
+    assert confirmed
+    assert job.landed == job.signatures[1]
+
+
+# Function 'test_expires_without_resigns'
+def test_expires_without_resigns():
+    """ Without re-signs an expired job is settled as expired and confirm returns at once """
+
+    async def run() -> tuple[TransactionResender, SendJob, bool]:
+        client = Client()
+        resender = TransactionResender(client, interval = 0.01)
+        job = resender.job(await resender.submit(builder(), label = "buy"))
+        client.blockhashes.expire(0)
+        await settle(resender)
+        return resender, job, await asyncio.wait_for(resender.confirm(job), 0.5)
+
+    resender, job, confirmed = asyncio.run(run())
+    assert job.status == "expired" and job.landed is None
+    assert not confirmed
+    assert resender.counts["expired"] == 1 and resender.stats()["landingrate"] == 0.0
+
+
+# Function 'test_slot_estimate_alone_does_not_expire'
+def test_slot_estimate_alone_does_not_expire():
+    """ The slot estimate runs out early, the block height decides """
+
+    async def run() -> tuple[SendJob, int]:
+        client = Client()
+        resender = TransactionResender(client, interval = 0.01)
+        job = resender.job(await resender.submit(builder()))
+        client.blockhashes.expire(0, height = False)
+        await asyncio.sleep(0.1)
+        client.confirmer.poller.land(job.signatures[0])
+        await settle(resender)
+        return job, len(client.sent)
+
+    job, sent = asyncio.run(run())
+    assert job.status == "landed"
+    assert sent > 2
+
+
+# Function 'test_expired_job_found_landed'
+def test_expired_job_found_landed():
+    """ A signature that landed unnoticed is found by the final status check """
+
+    async def run() -> SendJob:
+        client = Client()
+        resender = TransactionResender(client, interval = 0.01)
+        signature = await resender.submit(builder())
+        client.statuses[signature] = {"slot": 103, "err": None}
+        client.blockhashes.expire(0)
+        await settle(resender)
+        return resender.job(signature)
+
+    job = asyncio.run(run())
+    assert job.status == "landed" and job.landedslot == 103
+
+
+# Function 'test_loop_error_is_not_an_expiry'
+def test_loop_error_is_not_an_expiry():
+    """ An RPC failure inside the loop settles the job as error, kept out of the landing rate """
+
+    async def run() -> tuple[TransactionResender, SendJob]:
+        client = Client(error = RuntimeError("node is behind"))
+        resender = TransactionResender(client, interval = 0.01)
+        job = resender.job(await resender.submit(builder()))
+        client.blockhashes.expire(0)
+        await settle(resender)
+        return resender, job
+
+    resender, job = asyncio.run(run())
+    assert job.status == "error"
+    assert resender.counts["error"] == 1 and resender.counts["expired"] == 0
+    assert resender.stats()["landingrate"] is None
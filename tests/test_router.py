@@ -0,0 +1,94 @@
+# Import libraries
+import asyncio
+
+# Import packages
+import pytest
+
+# Import local packages
+from core.batch import RPCError
+from core.router import EndpointRouter
+from utils.mocknode import MockNode
+
+
+# Function 'nodes'
+async def nodes() -> tuple[MockNode, MockNode, EndpointRouter]:
+    """ A node answering every call with -32005 and a healthy one, routed behind one router """
+    behind = MockNode(seed = 1)
+    behind.inject(1.0)
+    healthy = MockNode(seed = 2)
+    await behind.start()
+    await healthy.start()
+    router = EndpointRouter.from_config(behind.url, [{"url": healthy.url, "role": "both"}])
+    return behind, healthy, router
+
+
+# Function 'close'
+async def close(behind: MockNode, healthy: MockNode, router: EndpointRouter) -> None:
+    """ Stop the router and both nodes """
+    await router.close()
+    await behind.stop()
+    await healthy.stop()
+
+
+# Function 'test_node_behind_counts_as_failure'
+def test_node_behind_counts_as_failure():
+    """ A node answering -32005 loses its score and opens its breaker, reads fail over to the healthy node """
+
+    async def run() -> None:
+        behind, healthy, router = await nodes()
+        try:
+            primary, secondary = router.endpoints
+            body = {"jsonrpc": "2.0", "id": 1, "method": "getSlot"}
+            for _ in range(5):
+                reply = await router.post_json(body)
+                assert "result" in reply
+            assert primary.errors > 0
+            assert primary.breaker.state != "closed"
+            assert router.pick("read") is secondary
+        finally:
+            await close(behind, healthy, router)
+
+    asyncio.run(run())
+
+
+# Function 'test_node_error_is_raised_without_failover'
+def test_node_error_is_raised_without_failover():
+    """ Without another endpoint the node error surfaces as an RPCError carrying its code """
+
+    async def run() -> None:
+        behind = MockNode(seed = 1)
+        behind.inject(1.0)
+        await behind.start()
+        router = EndpointRouter.from_config(behind.url)
+        try:
+            for _ in range(5):
+                with pytest.raises(RPCError) as error:
+                    await router.post_json({"jsonrpc": "2.0", "id": 1, "method": "getSlot"})
+                assert error.value.code == -32005
+            assert router.endpoints[0].errors > 0
+            # Nowhere to fail over to, the breaker stays closed so the lagging node keeps serving
+            assert router.endpoints[0].breaker.state == "closed"
+        finally:
+            await router.close()
+            await behind.stop()
+
+    asyncio.run(run())
+
+
+# Function 'test_request_errors_keep_the_node_healthy'
+def test_request_errors_keep_the_node_healthy():
+    """ Errors about the request, such as an unknown method, say nothing about the node """
+
+    async def run() -> None:
+        node = MockNode(seed = 3)
+        await node.start()
+        router = EndpointRouter.from_config(node.url)
+        try:
+            reply = await router.post_json({"jsonrpc": "2.0", "id": 1, "method": "noSuchMethod"})
+            assert reply["error"]["code"] == -32601
+            assert router.endpoints[0].errors == 0
+        finally:
+            await router.close()
+            await node.stop()
+
+    asyncio.run(run())
@@ -0,0 +1,80 @@
+# Import libraries
+import random
+
+# Import local packages
+from core.sketch import RELATIVE_ACCURACY
+from core.sketch import QuantileSketch
+from core.sketch import SlidingQuantileSketch
+
+
+# Function 'exact'
+def exact(values: list[float], q: float) -> float:
+    """ Quantile with the same rank convention as the sketch """
+    return sorted(values)[int(q * (len(values) - 1))]
+
+
+# Function 'test_quantiles_stay_within_relative_accuracy'
+def test_quantiles_stay_within_relative_accuracy():
+    """ Every quantile is within the relative accuracy of the exact one, across skewed data """
+    rng = random.Random(11)
+    values = [rng.lognormvariate(10, 2) for _ in range(20_000)] + [0.0] * 500
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    for q in (0.0, 0.01, 0.1, 0.25, 0.5, 0.7, 0.9, 0.99, 0.999, 1.0):
+        expected = exact(values, q)
+        assert abs(sketch.quantile(q) - expected) <= RELATIVE_ACCURACY * expected
+
+
+# Function 'test_keys_stay_sorted_through_merges'
+def test_keys_stay_sorted_through_merges():
+    """ Adding and subtracting sketches keeps the bucket keys sorted and in step with the buckets """
+    rng = random.Random(2)
+    parts = []
+    for _ in range(5):
+        part = QuantileSketch()
+        for _ in range(300):
+            part.add(rng.uniform(1, 10**6))
+        parts.append(part)
+    total = QuantileSketch()
+    for part in parts:
+        total.merge(part)
+    for part in parts[:3]:
+        total.merge(part, -1)
+    assert total.keys == sorted(total.buckets)
+    remaining = QuantileSketch()
+    for part in parts[3:]:
+        remaining.merge(part)
+    assert total.buckets == remaining.buckets and total.count == 600
+    assert total.quantile(0.5) == remaining.quantile(0.5)
+    for part in parts[3:]:
+        total.merge(part, -1)
+    assert total.keys == [] and total.quantile(0.5) is None
+
+
+# Function 'test_sliding_window_drops_old_slots'
+def test_sliding_window_drops_old_slots():
+    """ Values leave the window with their slot, and late values for dropped slots are ignored """
+    sketch = SlidingQuantileSketch(window = 10)
+    for slot in range(1, 11):
+        sketch.add(slot, 1000.0)
+    assert abs(sketch.quantile(0.5) - 1000) <= 10
+    for slot in range(11, 21):
+        sketch.add(slot, 5000.0)
+    assert sketch.count == 10 and abs(sketch.quantile(0.1) - 5000) <= 50
+    sketch.add(3, 1.0)
+    assert sketch.count == 10
+    sketch.advance(40)
+    assert sketch.count == 0 and sketch.total.keys == [] and sketch.quantile(0.5) is None
+
+
+# Function 'test_sliding_merge_combines_sources'
+def test_sliding_merge_combines_sources():
+    """ Merging another sliding sketch adds its slots still inside the window """
+    first, second = SlidingQuantileSketch(window = 10), SlidingQuantileSketch(window = 10)
+    for slot in range(1, 21):
+        first.add(slot, 100.0)
+        second.add(slot, 300.0)
+    first.merge(second)
+    assert first.count == 20 and first.stats()["slots"] == 10
+    assert abs(first.quantile(0.9) - 300) <= 3 and abs(first.quantile(0.1) - 100) <= 1
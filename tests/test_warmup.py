@@ -0,0 +1,61 @@
+# Import libraries
+import asyncio
+
+# Import local packages
+from core.client import SolanaClient
+from utils.mocknode import MockNode
+
+
+# Function 'warmup'
+async def warmup(rate: float, method: str | None, seed: int) -> tuple[SolanaClient, MockNode, str | None]:
+    """ Start a mock node failing a share of the calls and warm a client up against it """
+    node = MockNode(seed = seed)
+    node.inject(rate, method = method)
+    await node.start()
+    client = SolanaClient(node.url, wssendpoint = node.wsurl)
+    try:
+        health = await client.warmup()
+    except BaseException:
+        await client.close()
+        await node.stop()
+        raise
+    return client, node, health
+
+
+# Function 'test_warmup_survives_injected_errors'
+def test_warmup_survives_injected_errors():
+    """ Seeds that fail the first blockhash reads must not fail the warm-up """
+
+    async def run(seed: int) -> None:
+        client, node, _ = await warmup(0.5, "getLatestBlockhash", seed)
+        try:
+            assert (await client.blockhashes.get()) is not None
+        finally:
+            await client.close()
+            await node.stop()
+
+    for seed in (1, 4, 7, 9, 10):
+        asyncio.run(run(seed))
+
+
+# Function 'test_warmup_without_blockhash_fetches_it_later'
+def test_warmup_without_blockhash_fetches_it_later():
+    """ A node that keeps failing getLatestBlockhash leaves the cache empty until it recovers """
+
+    async def run() -> None:
+        client, node, health = await warmup(1.0, "getLatestBlockhash", 3)
+        try:
+            assert health == "ok"
+            assert client.blockhashes.current is None
+            node.inject(0.0, method = "getLatestBlockhash")
+            # The next slot notification schedules a fetch while nothing is cached
+            for _ in range(50):
+                if client.blockhashes.current is not None:
+                    break
+                await asyncio.sleep(0.1)
+            assert client.blockhashes.current is not None
+        finally:
+            await client.close()
+            await node.stop()
+
+    asyncio.run(run())
@@ -135,14 +135,9 @@ class BotFields:
                 'fastmode': {
                     'label': 'Fast Mode',
                     'type': 'select',
-                    'description': 'Bypass price checks and execute buys immediately after detection.',
+                    'description': 'Send buys without reading the bonding curve, quoting them from the replayed curve or the initial reserves of the Global account.',
                     'options': ['True', 'False']
                 },
-                'fasttokens': {
-                    'label': 'Fast Tokens',
-                    'type': 'text',
-                    'description': 'Number of tokens to buy when fast mode is enabled.'
-                },
                 'stoploss': {
                     'label': 'Stop Loss',
                     'type': 'text',
@@ -212,6 +207,11 @@ class BotFields:
                     'label': 'Hard Cap',
                     'type': 'text',
                     'description': 'Maximum priority fee in microlamports to prevent overspending.'
+                },
+                'target': {
+                    'label': 'Target Slots',
+                    'type': 'text',
+                    'description': 'Slots a trade should take to land, the fee is learned from past trades and replaces the dynamic, fixed and extra fees, hard cap still applies (0 = disabled).'
                 }
             },
             'retries': {
@@ -168,7 +168,14 @@ class ConfLoader:
         # === Endpoint ===
         print("ENDPOINT")
         print(f"[+] RPC Endpoint: {endpoint.get('rpc', 'n/c')}")
+        for extra in endpoint.get('rpcs') or []:
+            print(f"[+] RPC Endpoint ({extra.get('role', 'both')}): {extra.get('url', 'n/c')}")
         print(f"[+] WSS Endpoint: {endpoint.get('wss', 'n/c')}")
+        print(f"[+] Pool Size: {endpoint.get('poolsize', 'n/c')}")
+        print(f"[+] Batch Window: {endpoint.get('batchwindow', 'n/c')}")
+        print(f"[+] Broadcast: {endpoint.get('broadcast', False)}")
+        print(f"[+] Rate Limit: {endpoint.get('ratelimit') or 'unlimited'}")
+        print(f"[+] Slow Call: {endpoint.get('slowcall', 1.0)}")
         print("-" * 60)
 
         # === Wallet ===
@@ -227,7 +234,6 @@ class ConfLoader:
         print(f"[+] Buy Slippage: {trade.get('buyslippage', '0')} %")
         print(f"[+] Sell Slippage: {trade.get('sellslippage', '0')} %")
         print(f"[+] Fast Mode: {trade.get('fastmode', 'n/c')}")
-        print(f"[+] Fast Tokens: {trade.get('fasttokens', '0')}")
         print(f"[+] Stop Loss: {trade.get('stoploss', '0')} %")
         print(f"[+] Take Profit: {trade.get('takeprofit', '0')} %")
         print(f"[+] Trailing Profit: {trade.get('trailprofit', 'n/c')}")
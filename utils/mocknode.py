@@ -0,0 +1,755 @@
+# === Import libraries ===
+import argparse
+import asyncio
+import base58
+import base64
+import hashlib
+import json
+import logging
+import random
+import struct
+
+# === Import packages ===
+from aiohttp import web
+from aiohttp import WSMsgType
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from solders.compute_budget import set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import AccountMeta
+from solders.instruction import Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+from solders.transaction import VersionedTransaction
+
+# === Import local packages ===
+from core.pubkeys import PumpAddresses
+from core.pubkeys import SystemAddresses
+from core.params import DEFAULT_GLOBAL
+from core.quote import buy_cost
+from core.quote import buy_tokens
+from core.quote import sell_proceeds
+from monitoring.processor import LogsProcessor
+from monitoring.processor import PumpProcessor
+
+# === Define 'logger' ===
+logger = logging.getLogger(__name__)
+
+# === Define 'CURVE_DISCRIMINATOR' ===
+CURVE_DISCRIMINATOR = struct.pack("<Q", 6966180631402821399)
+
+# === Define 'COMPUTE_UNITS' ===
+# Units consumed per instruction by 'simulateTransaction', keyed by program
+COMPUTE_UNITS = {
+    "ComputeBudget111111111111111111111111111111": 150,
+    str(SystemAddresses.ASSOCIATED_TOKEN_PROGRAM): 22_000,
+    str(SystemAddresses.TOKEN_PROGRAM): 3_000,
+    str(PumpAddresses.PROGRAM): 36_000,
+}
+
+# === Define 'NOTIFICATIONS' ===
+# Websocket subscription method for every notification method
+NOTIFICATIONS = {
+    "logsNotification": "logsSubscribe",
+    "blockNotification": "blockSubscribe",
+    "slotNotification": "slotSubscribe",
+    "signatureNotification": "signatureSubscribe",
+    "accountNotification": "accountSubscribe",
+}
+
+
+# === Class 'MockToken' ===
+@dataclass
+class MockToken:
+    """
+    Token created on the mock node, holding the addresses and the transaction that
+    announced it so tests and benchmarks can follow it through the trading pipeline.
+    """
+
+    # === Define 'name' ===
+    name: str
+
+    # === Define 'symbol' ===
+    symbol: str
+
+    # === Define 'mint' ===
+    mint: Pubkey
+
+    # === Define 'boundingcurve' ===
+    boundingcurve: Pubkey
+
+    # === Define 'user' ===
+    user: Pubkey
+
+    # === Define 'signature' ===
+    signature: str
+
+    # === Define 'logs' ===
+    logs: list[str]
+
+    # === Define 'transaction' ===
+    transaction: str
+
+
+# === Class 'MockNode' ===
+class MockNode:
+    """
+    Local stand-in for a Solana RPC and websocket node. It serves the JSON-RPC methods used
+    by SolanaClient (single and batch requests) and the logs, block, slot, signature and
+    account subscriptions used by the listeners, so the bot can be tested, benchmarked and
+    load-tested without mainnet. Latency, errors and transaction outcomes are programmable,
+    and recorded responses and notifications can be replayed from a fixture file.
+
+    Parameters:
+    - host (str): Interface to bind.
+    - port (int): Port to bind, 0 picks a free port.
+    - latency (float): Base response latency in seconds applied to every method.
+    - jitter (float): Extra uniformly distributed latency in seconds.
+    - slottime (float): Seconds between two slots.
+    - landingslots (int): Slots before a sent transaction is processed.
+    - seed (int | None): Seed of the random generator driving jitter and error injection.
+
+    Returns:
+    - None
+    """
+
+    # === Function '__init__' ===
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0, slottime: float = 0.4, landingslots: int = 1, seed: int | None = None):
+        """
+        Prepares the node state: slot and block height counters, the account store, the
+        transaction ledger and the latency and error injection tables. Nothing is bound
+        until `start()` is awaited.
+
+        Parameters:
+        - See class parameters.
+
+        Returns:
+        - None
+        """
+        self.host = host
+        self.port = port
+        self.slottime = slottime
+        self.landingslots = landingslots
+        self.slot = 1_000
+        self.blockheight = 900
+        self.balance = 10 * 10**9
+        self.tokenbalance = 1_000_000 * 10**6
+        self.txfailrate = 0.0
+        self.random = random.Random(seed)
+        self.accounts: dict[str, dict[str, Any]] = {}
+        self.tokenbalances: dict[str, int] = {}
+        self.ledger: dict[str, tuple[int, Any]] = {}
+        self.requests: dict[str, int] = {}
+        self.responses: dict[str, list[Any]] = {}
+        self.notifications: list[dict[str, Any]] = []
+        self._latency: dict[str | None, tuple[float, float]] = {None: (latency, jitter)}
+        self._errors: dict[str | None, tuple[float, str]] = {}
+        self._sockets: dict[web.WebSocketResponse, dict[int, tuple[str, list[Any]]]] = {}
+        self._subids = 0
+        self._runner: web.AppRunner | None = None
+        self._ticker: asyncio.Task | None = None
+        self.set_account(PumpAddresses.GLOBAL, DEFAULT_GLOBAL.to_bytes())
+
+    # === Function 'url' ===
+    @property
+    def url(self) -> str:
+        """
+        Returns the HTTP JSON-RPC endpoint of the running node.
+
+        Returns:
+        - str: Endpoint URL.
+        """
+        return f"http://{self.host}:{self.port}/"
+
+    # === Function 'wsurl' ===
+    @property
+    def wsurl(self) -> str:
+        """
+        Returns the websocket endpoint of the running node.
+
+        Returns:
+        - str: Endpoint URL.
+        """
+        return f"ws://{self.host}:{self.port}/ws"
+
+    # === Function 'set_latency' ===
+    def set_latency(self, latency: float, jitter: float = 0.0, method: str | None = None) -> None:
+        """
+        Sets the response latency of one JSON-RPC method, or the default of every method
+        without an override when `method` is None.
+
+        Parameters:
+        - latency (float): Fixed delay in seconds.
+        - jitter (float): Extra uniformly distributed delay in seconds.
+        - method (str | None): JSON-RPC method name.
+
+        Returns:
+        - None
+        """
+        self._latency[method] = (latency, jitter)
+
+    # === Function 'inject' ===
+    def inject(self, rate: float, kind: str = "rpc", method: str | None = None) -> None:
+        """
+        Makes a share of the requests fail. `rpc` returns a JSON-RPC error object, `429` and
+        `500` answer with that HTTP status, and `timeout` never answers. Errors are drawn
+        per request for HTTP kinds and per call inside a batch for `rpc`.
+
+        Parameters:
+        - rate (float): Probability between 0 and 1.
+        - kind (str): One of 'rpc', '429', '500' or 'timeout'.
+        - method (str | None): Restrict the injection to one JSON-RPC method.
+
+        Returns:
+        - None
+        """
+        if kind not in ("rpc", "429", "500", "timeout"):
+            raise ValueError(f"Unknown error kind '{kind}'")
+        self._errors[method] = (rate, kind)
+
+    # === Function 'set_account' ===
+    def set_account(self, pubkey: Pubkey | str, data: bytes, owner: Pubkey | str = PumpAddresses.PROGRAM, lamports: int = 1_500_000) -> None:
+        """
+        Stores an account served by getAccountInfo and getMultipleAccounts, and pushes an
+        accountNotification to its subscribers.
+
+        Parameters:
+        - pubkey (Pubkey | str): Account address.
+        - data (bytes): Raw account data.
+        - owner (Pubkey | str): Owner program.
+        - lamports (int): Account balance.
+
+        Returns:
+        - None
+        """
+        self.accounts[str(pubkey)] = {"data": data, "owner": str(owner), "lamports": lamports}
+        self.publish("accountSubscribe", {"context": {"slot": self.slot}, "value": self._account_json(str(pubkey), None)}, match = lambda params: params and params[0] == str(pubkey))
+
+    # === Function 'set_curve' ===
+    def set_curve(self, curve: Pubkey | str, virtual_token_reserves: int = 1_073_000_000 * 10**6, virtual_sol_reserves: int = 30 * 10**9, real_token_reserves: int = 793_100_000 * 10**6, real_sol_reserves: int = 0, complete: bool = False) -> None:
+        """
+        Stores a pump.fun bonding curve account with the given reserves.
+
+        Parameters:
+        - curve (Pubkey | str): Bonding curve address.
+        - virtual_token_reserves (int): Virtual token reserves in raw units.
+        - virtual_sol_reserves (int): Virtual SOL reserves in lamports.
+        - real_token_reserves (int): Real token reserves in raw units.
+        - real_sol_reserves (int): Real SOL reserves in lamports.
+        - complete (bool): Whether the curve migrated.
+
+        Returns:
+        - None
+        """
+        data = CURVE_DISCRIMINATOR + struct.pack("<5Q?", virtual_token_reserves, virtual_sol_reserves, real_token_reserves, real_sol_reserves, 10**15, complete)
+        self.set_account(curve, data + bytes(32))
+
+    # === Function 'load_fixtures' ===
+    def load_fixtures(self, path: str | Path) -> None:
+        """
+        Loads a JSON fixture file. `responses` maps a JSON-RPC method to a result (or a list
+        of results served in turn) that overrides the built-in handler, `accounts` maps an
+        address to base64 `data`, `owner` and `lamports`, and `notifications` lists recorded
+        websocket messages, each with an optional `delay` in seconds, for `replay()`.
+
+        Parameters:
+        - path (str | Path): Fixture file path.
+
+        Returns:
+        - None
+        """
+        fixtures = json.loads(Path(path).read_text(encoding = "utf-8"))
+        for method, result in fixtures.get("responses", {}).items():
+            self.responses[method] = result if isinstance(result, list) else [result]
+        for pubkey, account in fixtures.get("accounts", {}).items():
+            self.set_account(pubkey, base64.b64decode(account["data"]), account.get("owner", str(PumpAddresses.PROGRAM)), account.get("lamports", 1_500_000))
+        self.notifications.extend(fixtures.get("notifications", []))
+
+    # === Function 'replay' ===
+    async def replay(self, speed: float = 1.0) -> int:
+        """
+        Pushes the recorded notifications to the matching subscribers, honouring their
+        recorded delays divided by `speed`.
+
+        Parameters:
+        - speed (float): Replay speed multiplier, 0 sends everything at once.
+
+        Returns:
+        - int: Number of notifications sent.
+        """
+        for entry in self.notifications:
+            message = entry.get("message", entry)
+            if speed and entry.get("delay"):
+                await asyncio.sleep(entry["delay"] / speed)
+            self.publish(NOTIFICATIONS.get(message.get("method"), ""), message["params"]["result"])
+        return len(self.notifications)
+
+    # === Function 'create_token' ===
+    def create_token(self, name: str = "Mock Token", symbol: str = "MOCK", publish: bool = True) -> MockToken:
+        """
+        Creates a token on the node: seeds its bonding curve account, builds the Create
+        program logs and transaction, and publishes them to the logs and block subscribers.
+
+        Parameters:
+        - name (str): Token name.
+        - symbol (str): Token symbol.
+        - publish (bool): Send the logs and block notifications right away.
+
+        Returns:
+        - MockToken: The created token.
+        """
+        mint = Keypair().pubkey()
+        user = Keypair()
+        curve, _ = Pubkey.find_program_address([b"bonding-curve", bytes(mint)], PumpAddresses.PROGRAM)
+        basecurve, _ = Pubkey.find_program_address([bytes(curve), bytes(SystemAddresses.TOKEN_PROGRAM), bytes(mint)], SystemAddresses.ASSOCIATED_TOKEN_PROGRAM)
+        uri = f"https://example.invalid/{symbol.lower()}.json"
+        self.set_curve(curve)
+
+        def strings(*values: str) -> bytes:
+            return b"".join(struct.pack("<I", len(value.encode())) + value.encode() for value in values)
+
+        event = struct.pack("<Q", LogsProcessor.CREATE_DISCRIMINATOR) + strings(name, symbol, uri) + bytes(mint) + bytes(curve) + bytes(user.pubkey())
+        accounts = [mint, user.pubkey(), curve, basecurve, PumpAddresses.GLOBAL, SystemAddresses.PROGRAM, SystemAddresses.PROGRAM, user.pubkey()]
+        instruction = Instruction(PumpAddresses.PROGRAM, struct.pack("<Q", PumpProcessor.CREATE_DISCRIMINATOR) + strings(name, symbol, uri), [AccountMeta(pubkey, pubkey == user.pubkey(), True) for pubkey in accounts])
+        price = set_compute_unit_price(random.Random(bytes(mint)).choice((0, 1_000, 5_000, 25_000, 100_000)))
+        transaction = VersionedTransaction(Message.new_with_blockhash([price, instruction], user.pubkey(), self.blockhash()), [user])
+        signature = str(transaction.signatures[0])
+        logs = [
+            f"Program {PumpAddresses.PROGRAM} invoke [1]",
+            "Program log: Instruction: Create",
+            f"Program data: {base64.b64encode(event).decode()}",
+            f"Program {PumpAddresses.PROGRAM} success"
+        ]
+
+        token = MockToken(name, symbol, mint, curve, user.pubkey(), signature, logs, base64.b64encode(bytes(transaction)).decode())
+        if publish:
+            self.publish_token(token)
+        return token
+
+    # === Function 'trade' ===
+    def trade(self, token: MockToken, amount: int, is_buy: bool = True, slot: int | None = None, publish: bool = True) -> list[str]:
+        """
+        Executes a buy or sell against a token's bonding curve with the program's integer
+        math, stores the new curve account and publishes the TradeEvent logs.
+
+        Parameters:
+        - token (MockToken): Token returned by `create_token()`.
+        - amount (int): Lamports spent for a buy, raw tokens sold for a sell.
+        - is_buy (bool): Buy or sell.
+        - slot (int | None): Slot reported with the logs, the current slot by default.
+        - publish (bool): Send the logs notification right away.
+
+        Returns:
+        - list[str]: Program logs of the trade.
+        """
+        _, vtoken, vsol, rtoken, rsol, supply, complete = struct.unpack_from("<8s5Q?", self.accounts[str(token.boundingcurve)]["data"])
+        if is_buy:
+            tokens = min(buy_tokens(vsol, vtoken, amount, 0), rtoken)
+            lamports = buy_cost(vsol, vtoken, tokens)
+            vtoken, vsol, rtoken, rsol = vtoken - tokens, vsol + lamports, rtoken - tokens, rsol + lamports
+        else:
+            tokens, lamports = amount, sell_proceeds(vsol, vtoken, amount)
+            vtoken, vsol, rtoken, rsol = vtoken + tokens, vsol - lamports, rtoken + tokens, rsol - lamports
+        self.set_curve(token.boundingcurve, vtoken, vsol, rtoken, rsol, rtoken == 0)
+
+        user = Keypair().pubkey()
+        event = LogsProcessor.TRADE_DISCRIMINATOR + LogsProcessor.TRADE_LAYOUT.pack(bytes(token.mint), lamports, tokens, is_buy, bytes(user), 0, vsol, vtoken, rsol, rtoken)
+        logs = [
+            f"Program {PumpAddresses.PROGRAM} invoke [1]",
+            f"Program log: Instruction: {'Buy' if is_buy else 'Sell'}",
+            f"Program data: {base64.b64encode(event).decode()}",
+            f"Program {PumpAddresses.PROGRAM} success"
+        ]
+
+        if publish:
+            signature = base58.b58encode(hashlib.sha256(event).digest() * 2).decode()
+            self.publish("logsSubscribe", {"context": {"slot": self.slot if slot is None else slot}, "value": {"signature": signature, "err": None, "logs": logs}})
+        return logs
+
+    # === Function 'publish_token' ===
+    def publish_token(self, token: MockToken) -> None:
+        """
+        Announces a token to the logs and block subscribers.
+
+        Parameters:
+        - token (MockToken): Token returned by `create_token()`.
+
+        Returns:
+        - None
+        """
+        context = {"slot": self.slot}
+        self.publish("logsSubscribe", {"context": context, "value": {"signature": token.signature, "err": None, "logs": token.logs}})
+        block = {"blockhash": str(self.blockhash()), "parentSlot": self.slot - 1, "transactions": [{"transaction": [token.transaction, "base64"], "meta": {"err": None}}]}
+        self.publish("blockSubscribe", {"context": context, "value": {"slot": self.slot, "block": block, "err": None}})
+
+    # === Function 'publish' ===
+    def publish(self, kind: str, result: Any, match: Any = None) -> int:
+        """
+        Sends a notification to every subscriber of a subscription method.
+
+        Parameters:
+        - kind (str): Subscription method, e.g. 'logsSubscribe'.
+        - result (Any): Notification result payload.
+        - match (Callable | None): Optional filter on the subscription params.
+
+        Returns:
+        - int: Number of subscribers notified.
+        """
+        method = kind.replace("Subscribe", "Notification")
+        sent = 0
+        for websocket, subscriptions in list(self._sockets.items()):
+            for subid, (subkind, params) in list(subscriptions.items()):
+                if subkind != kind or (match is not None and not match(params)):
+                    continue
+                message = json.dumps({"jsonrpc": "2.0", "method": method, "params": {"result": result, "subscription": subid}})
+                asyncio.ensure_future(self._send(websocket, message))
+                sent += 1
+        return sent
+
+    # === Function 'subscribers' ===
+    def subscribers(self, kind: str) -> int:
+        """
+        Counts the active subscriptions of a subscription method.
+
+        Parameters:
+        - kind (str): Subscription method, e.g. 'blockSubscribe'.
+
+        Returns:
+        - int: Number of active subscriptions.
+        """
+        return sum(1 for subscriptions in self._sockets.values() for subkind, _ in subscriptions.values() if subkind == kind)
+
+    # === Function 'blockhash' ===
+    def blockhash(self, slot: int | None = None) -> Hash:
+        """
+        Returns the deterministic blockhash of a slot.
+
+        Parameters:
+        - slot (int | None): Slot number, the current slot by default.
+
+        Returns:
+        - Hash: Blockhash.
+        """
+        return Hash(hashlib.sha256(struct.pack("<Q", self.slot if slot is None else slot)).digest())
+
+    # === Function 'start' ===
+    async def start(self) -> "MockNode":
+        """
+        Binds the HTTP and websocket routes and starts producing slots.
+
+        Returns:
+        - MockNode: The running node.
+        """
+        app = web.Application(client_max_size = 16 * 1024 * 1024)
+        app.router.add_post("/", self._http)
+        app.router.add_get("/ws", self._websocket)
+        self._runner = web.AppRunner(app, access_log = None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.port = self._runner.addresses[0][1]
+        self._ticker = asyncio.create_task(self._tick())
+        logger.info(f"Mock node listening on {self.url} and {self.wsurl}")
+        return self
+
+    # === Function 'stop' ===
+    async def stop(self) -> None:
+        """
+        Stops producing slots, closes every websocket and unbinds the server.
+
+        Returns:
+        - None
+        """
+        if self._ticker is not None:
+            self._ticker.cancel()
+        for websocket in list(self._sockets):
+            await websocket.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # === Function '__aenter__' ===
+    async def __aenter__(self) -> "MockNode":
+        """ Starts the node for an `async with` block """
+        return await self.start()
+
+    # === Function '__aexit__' ===
+    async def __aexit__(self, *exc: Any) -> None:
+        """ Stops the node at the end of an `async with` block """
+        await self.stop()
+
+    # === Function '_tick' ===
+    async def _tick(self) -> None:
+        """ Advances the slot and delivers slot and signature notifications """
+        while True:
+            await asyncio.sleep(self.slottime)
+            self.slot += 1
+            self.blockheight += 1
+            self.publish("slotSubscribe", {"slot": self.slot, "parent": self.slot - 1, "root": self.slot - 32})
+            for websocket, subscriptions in list(self._sockets.items()):
+                for subid, (kind, params) in list(subscriptions.items()):
+                    if kind != "signatureSubscribe":
+                        continue
+                    status = self._status(params[0])
+                    commitment = (params[1] if len(params) > 1 else {}).get("commitment", "finalized")
+                    if status is not None and self._reached(status["confirmationStatus"], commitment):
+                        subscriptions.pop(subid)
+                        message = {"jsonrpc": "2.0", "method": "signatureNotification", "params": {"result": {"context": {"slot": self.slot}, "value": {"err": status["err"]}}, "subscription": subid}}
+                        await self._send(websocket, json.dumps(message))
+
+    # === Function '_send' ===
+    @staticmethod
+    async def _send(websocket: web.WebSocketResponse, message: str) -> None:
+        """ Sends a websocket message, ignoring closed sockets """
+        if not websocket.closed:
+            try:
+                await websocket.send_str(message)
+            except ConnectionError:
+                pass
+
+    # === Function '_delay' ===
+    async def _delay(self, method: str) -> None:
+        """ Sleeps for the configured latency of a method """
+        latency, jitter = self._latency.get(method, self._latency[None])
+        delay = latency + (self.random.uniform(0, jitter) if jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    # === Function '_error' ===
+    def _error(self, method: str) -> str | None:
+        """ Draws an injected error kind for a method, None for a normal answer """
+        rate, kind = self._errors.get(method, self._errors.get(None, (0.0, "rpc")))
+        if rate and self.random.random() < rate:
+            return kind
+        return None
+
+    # === Function '_http' ===
+    async def _http(self, request: web.Request) -> web.Response:
+        """ Serves a single or batch JSON-RPC request """
+        body = await request.json()
+        calls = body if isinstance(body, list) else [body]
+        methods = [call.get("method", "") for call in calls]
+        for method in methods:
+            self.requests[method] = self.requests.get(method, 0) + 1
+
+        await asyncio.gather(*(self._delay(method) for method in set(methods)))
+        for method in methods:
+            kind = self._error(method)
+            if kind == "timeout":
+                await asyncio.sleep(3600)
+            if kind in ("429", "500"):
+                return web.Response(status = int(kind), text = "injected error")
+
+        replies = [self._reply(call) for call in calls]
+        return web.json_response(replies if isinstance(body, list) else replies[0])
+
+    # === Function '_reply' ===
+    def _reply(self, call: dict[str, Any]) -> dict[str, Any]:
+        """ Builds the JSON-RPC reply of one call """
+        method = call.get("method", "")
+        reply: dict[str, Any] = {"jsonrpc": "2.0", "id": call.get("id")}
+        if self._error(method) == "rpc":
+            reply["error"] = {"code": -32005, "message": "Node is behind (injected)"}
+            return reply
+
+        if self.responses.get(method):
+            queue = self.responses[method]
+            reply["result"] = queue.pop(0) if len(queue) > 1 else queue[0]
+            return reply
+
+        handler = getattr(self, f"_rpc_{method}", None)
+        if handler is None:
+            reply["error"] = {"code": -32601, "message": "Method not found"}
+            return reply
+        try:
+            reply["result"] = handler(*(call.get("params") or []))
+        except Exception as e:
+            reply["error"] = {"code": -32602, "message": f"Invalid params: {e!s}"}
+        return reply
+
+    # === Function '_account_json' ===
+    def _account_json(self, pubkey: str, config: dict[str, Any] | None) -> dict[str, Any] | None:
+        """ Encodes a stored account the way the JSON-RPC API returns it """
+        account = self.accounts.get(pubkey)
+        if account is None:
+            return None
+
+        data = account["data"]
+        dataslice = (config or {}).get("dataSlice")
+        if dataslice:
+            data = data[dataslice["offset"]:dataslice["offset"] + dataslice["length"]]
+        return {"data": [base64.b64encode(data).decode(), "base64"], "executable": False, "lamports": account["lamports"], "owner": account["owner"], "rentEpoch": 18446744073709551615, "space": len(account["data"])}
+
+    # === Function '_status' ===
+    def _status(self, signature: str) -> dict[str, Any] | None:
+        """ Returns the status of a sent transaction once it has been processed """
+        entry = self.ledger.get(signature)
+        if entry is None or entry[0] > self.slot:
+            return None
+
+        confirmations = self.slot - entry[0]
+        status = "finalized" if confirmations >= 32 else "confirmed" if confirmations >= 1 else "processed"
+        return {"slot": entry[0], "confirmations": None if status == "finalized" else confirmations, "err": entry[1], "confirmationStatus": status}
+
+    # === Function '_reached' ===
+    @staticmethod
+    def _reached(status: str, commitment: str) -> bool:
+        """ True if a confirmation status satisfies a commitment """
+        order = ("processed", "confirmed", "finalized")
+        return order.index(status) >= order.index(commitment)
+
+    # === Function '_rpc_getHealth' ===
+    def _rpc_getHealth(self) -> str:
+        """ Answers 'getHealth' """
+        return "ok"
+
+    # === Function '_rpc_getSlot' ===
+    def _rpc_getSlot(self, config: dict[str, Any] | None = None) -> int:
+        """ Answers 'getSlot' """
+        return self.slot
+
+    # === Function '_rpc_getBlockHeight' ===
+    def _rpc_getBlockHeight(self, config: dict[str, Any] | None = None) -> int:
+        """ Answers 'getBlockHeight' """
+        return self.blockheight
+
+    # === Function '_rpc_getBalance' ===
+    def _rpc_getBalance(self, pubkey: str, config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """ Answers 'getBalance' """
+        return {"context": {"slot": self.slot}, "value": self.balance}
+
+    # === Function '_rpc_getLatestBlockhash' ===
+    def _rpc_getLatestBlockhash(self, config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """ Answers 'getLatestBlockhash' """
+        return {"context": {"slot": self.slot}, "value": {"blockhash": str(self.blockhash()), "lastValidBlockHeight": self.blockheight + 150}}
+
+    # === Function '_rpc_getAccountInfo' ===
+    def _rpc_getAccountInfo(self, pubkey: str, config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """ Answers 'getAccountInfo' """
+        return {"context": {"slot": self.slot}, "value": self._account_json(pubkey, config)}
+
+    # === Function '_rpc_getMultipleAccounts' ===
+    def _rpc_getMultipleAccounts(self, pubkeys: list[str], config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """ Answers 'getMultipleAccounts' """
+        return {"context": {"slot": self.slot}, "value": [self._account_json(pubkey, config) for pubkey in pubkeys]}
+
+    # === Function '_rpc_getTokenAccountBalance' ===
+    def _rpc_getTokenAccountBalance(self, pubkey: str, config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """ Answers 'getTokenAccountBalance' """
+        amount = self.tokenbalances.get(pubkey, self.tokenbalance)
+        return {"context": {"slot": self.slot}, "value": {"amount": str(amount), "decimals": 6, "uiAmount": amount / 10**6, "uiAmountString": str(amount / 10**6)}}
+
+    # === Function '_rpc_getRecentPrioritizationFees' ===
+    def _rpc_getRecentPrioritizationFees(self, accounts: list[str] | None = None) -> list[dict[str, int]]:
+        """ Answers 'getRecentPrioritizationFees' """
+        generator = random.Random(self.slot)
+        return [{"slot": slot, "prioritizationFee": generator.choice((0, 0, 1_000, 5_000, 25_000, 100_000))} for slot in range(self.slot - 149, self.slot + 1)]
+
+    # === Function '_rpc_getSignatureStatuses' ===
+    def _rpc_getSignatureStatuses(self, signatures: list[str], config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """ Answers 'getSignatureStatuses' """
+        return {"context": {"slot": self.slot}, "value": [self._status(signature) for signature in signatures]}
+
+    # === Function '_rpc_sendTransaction' ===
+    def _rpc_sendTransaction(self, payload: str, config: dict[str, Any] | None = None) -> str:
+        """ Answers 'sendTransaction' """
+        raw = base64.b64decode(payload) if (config or {}).get("encoding") == "base64" else base58.b58decode(payload)
+        try:
+            signature = str(Transaction.from_bytes(raw).signatures[0])
+        except Exception:
+            signature = str(VersionedTransaction.from_bytes(raw).signatures[0])
+
+        if signature not in self.ledger:
+            failed = self.txfailrate and self.random.random() < self.txfailrate
+            self.ledger[signature] = (self.slot + self.landingslots, {"InstructionError": [0, {"Custom": 6002}]} if failed else None)
+        return signature
+
+    # === Function '_rpc_simulateTransaction' ===
+    def _rpc_simulateTransaction(self, payload: str, config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """ Answers 'simulateTransaction' with the units of COMPUTE_UNITS for every instruction """
+        raw = base64.b64decode(payload) if (config or {}).get("encoding") == "base64" else base58.b58decode(payload)
+        message = Transaction.from_bytes(raw).message
+        keys = [str(key) for key in message.account_keys]
+        units = sum(COMPUTE_UNITS.get(keys[ix.program_id_index], 1_000) for ix in message.instructions)
+        return {"context": {"slot": self.slot}, "value": {"err": None, "logs": [], "accounts": None, "returnData": None, "unitsConsumed": units}}
+
+    # === Function '_websocket' ===
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """ Serves the subscription websocket """
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        subscriptions: dict[int, tuple[str, list[Any]]] = {}
+        self._sockets[websocket] = subscriptions
+        try:
+            async for message in websocket:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                call = json.loads(message.data)
+                method = call.get("method", "")
+                params = call.get("params") or []
+                self.requests[method] = self.requests.get(method, 0) + 1
+                reply: dict[str, Any] = {"jsonrpc": "2.0", "id": call.get("id")}
+                if method.endswith("Unsubscribe"):
+                    reply["result"] = subscriptions.pop(params[0], None) is not None
+                elif method.endswith("Subscribe"):
+                    self._subids += 1
+                    subscriptions[self._subids] = (method, params)
+                    reply["result"] = self._subids
+                else:
+                    reply["error"] = {"code": -32601, "message": "Method not found"}
+                await websocket.send_str(json.dumps(reply))
+        finally:
+            self._sockets.pop(websocket, None)
+        return websocket
+
+
+# === Function 'main' ===
+async def main() -> None:
+    """
+    Runs a mock node from the command line until interrupted, optionally creating a new
+    token at a fixed rate and replaying a fixture file.
+
+    Returns:
+    - None
+    """
+    parser = argparse.ArgumentParser(description = "Local mock Solana RPC and websocket node")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = 8899)
+    parser.add_argument("--latency", type = float, default = 0.0, help = "Base latency in seconds")
+    parser.add_argument("--jitter", type = float, default = 0.0, help = "Extra random latency in seconds")
+    parser.add_argument("--errorrate", type = float, default = 0.0, help = "Share of calls answered with a JSON-RPC error")
+    parser.add_argument("--slottime", type = float, default = 0.4)
+    parser.add_argument("--fixtures", help = "JSON fixture file to load and replay")
+    parser.add_argument("--tokens", type = float, default = 0.0, help = "New tokens created per second")
+    args = parser.parse_args()
+
+    node = MockNode(args.host, args.port, args.latency, args.jitter, args.slottime)
+    if args.errorrate:
+        node.inject(args.errorrate)
+    if args.fixtures:
+        node.load_fixtures(args.fixtures)
+
+    await node.start()
+    print(f"RPC: {node.url}\nWSS: {node.wsurl}")
+    try:
+        if args.fixtures:
+            await node.replay()
+        while True:
+            if args.tokens:
+                await asyncio.sleep(1 / args.tokens)
+                node.create_token()
+            else:
+                await asyncio.sleep(3600)
+    finally:
+        await node.stop()
+
+
+# === Callback ===
+if __name__ == "__main__":
+    logging.basicConfig(level = logging.INFO)
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -58,4 +58,16 @@ class PumpTableWallet(PumpBase):
     """ Class description """
     __tablename__ = 'wallet'
     id = Column(Integer, primary_key=True, default=1)
-    balance = Column(String, nullable=False)
\ No newline at end of file
+    balance = Column(String, nullable=False)
+
+# Class 'PumpTableLandings'
+class PumpTableLandings(PumpBase):
+    """ Class description """
+    __tablename__ = 'landings'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    created = Column(BigInteger, index=True, nullable=False)
+    label = Column(String, index=True)
+    fee = Column(BigInteger, nullable=False)
+    sendslot = Column(BigInteger, nullable=False)
+    landedslot = Column(BigInteger)
+    status = Column(String, index=True, nullable=False)